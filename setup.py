@@ -46,6 +46,13 @@ setup(
             "flake8>=3.8",
             "mypy>=0.800",
         ],
+        "fast": [
+            "orjson>=3.6",
+        ],
+        "async": [
+            "aioboto3>=12.0",
+            "anyio>=3.6",
+        ],
     },
     entry_points={
         "console_scripts": [
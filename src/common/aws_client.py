@@ -3,14 +3,62 @@ AWS Client Manager for handling Boto3 clients and sessions.
 """
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError, ProfileNotFound
 from typing import Optional, Dict, Any
 import logging
+import threading
 
 from .exceptions import AWSConnectionException, AWSPermissionException
 
 logger = logging.getLogger(__name__)
 
+# Shared client configuration, built once at import time. Clients are cached
+# per Config instance, so reusing this object also lets services share clients.
+# botocore only sends requests over urllib3: installing awscrt (botocore[crt])
+# adds CRT signing and checksums but no HTTP/2 transport, so per-call overhead
+# is kept down with a large pool of keep-alive connections instead.
+DEFAULT_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=30,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Process-wide client cache keyed by (profile, service, region, config). boto3
+# clients are thread-safe, so managers for the same profile share clients and
+# their connection pools instead of each building their own. Each entry counts
+# the managers holding it, and a client is closed when the last one lets go.
+_shared_clients: Dict[tuple, Any] = {}
+_shared_client_refs: Dict[tuple, int] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def clear_client_cache() -> None:
+    """Drop all clients from the process-wide cache."""
+    with _shared_clients_lock:
+        _shared_clients.clear()
+        _shared_client_refs.clear()
+
+
+def _release_shared_client(shared_key: tuple, client: Any) -> None:
+    """
+    Drop one manager's hold on a shared client, closing it once no manager holds it.
+    
+    Must be called with _shared_clients_lock held.
+    """
+    refs = _shared_client_refs.get(shared_key, 0) - 1
+    if refs > 0:
+        _shared_client_refs[shared_key] = refs
+        return
+    _shared_client_refs.pop(shared_key, None)
+    if _shared_clients.get(shared_key) is client:
+        del _shared_clients[shared_key]
+    close = getattr(client, 'close', None)
+    if close is not None:
+        close()
+
 
 class AWSClientManager:
     """
@@ -56,13 +104,19 @@ class AWSClientManager:
                 raise AWSPermissionException('STS', 'get_caller_identity', str(e))
             raise AWSConnectionException(f"Failed to connect to AWS: {str(e)}")
     
-    def get_client(self, service_name: str, region_name: Optional[str] = None) -> Any:
+    def get_client(self, service_name: str, region_name: Optional[str] = None,
+                   config: Optional[Config] = None) -> Any:
         """
         Get or create a Boto3 client for the specified service.
         
+        Clients are cached process-wide per profile, service, region and config
+        object, so pass the same Config instance to share a client.
+        
         Args:
             service_name (str): AWS service name (e.g., 's3', 'ec2', 'lambda').
             region_name (str, optional): Override region for this client.
+            config (botocore.config.Config, optional): Client configuration such as
+                retry mode or connection pool size.
         
         Returns:
             boto3.client: The AWS service client.
@@ -71,27 +125,36 @@ class AWSClientManager:
             AWSConnectionException: If client creation fails.
         """
         region = region_name or self.region_name
-        client_key = f"{service_name}_{region}"
+        client_key = (service_name, region, config)
         
         if client_key not in self._clients:
-            try:
-                self._clients[client_key] = self._session.client(
-                    service_name,
-                    region_name=region
-                )
-                logger.debug(f"Created {service_name} client for region {region}")
-            except (ClientError, BotoCoreError) as e:
-                raise AWSConnectionException(f"Failed to create {service_name} client: {str(e)}")
+            shared_key = (self.profile_name,) + client_key
+            with _shared_clients_lock:
+                client = _shared_clients.get(shared_key)
+                if client is None:
+                    kwargs = {'region_name': region}
+                    if config is not None:
+                        kwargs['config'] = config
+                    try:
+                        client = self._session.client(service_name, **kwargs)
+                    except (ClientError, BotoCoreError) as e:
+                        raise AWSConnectionException(f"Failed to create {service_name} client: {str(e)}")
+                    _shared_clients[shared_key] = client
+                    logger.debug(f"Created {service_name} client for region {region}")
+                _shared_client_refs[shared_key] = _shared_client_refs.get(shared_key, 0) + 1
+            self._clients[client_key] = client
         
         return self._clients[client_key]
     
-    def get_resource(self, service_name: str, region_name: Optional[str] = None) -> Any:
+    def get_resource(self, service_name: str, region_name: Optional[str] = None,
+                     config: Optional[Config] = None) -> Any:
         """
         Get a Boto3 resource for the specified service.
         
         Args:
             service_name (str): AWS service name (e.g., 's3', 'dynamodb').
             region_name (str, optional): Override region for this resource.
+            config (botocore.config.Config, optional): Configuration for the underlying client.
         
         Returns:
             boto3.resource: The AWS service resource.
@@ -100,15 +163,55 @@ class AWSClientManager:
             AWSConnectionException: If resource creation fails.
         """
         region = region_name or self.region_name
+        kwargs = {'region_name': region}
+        if config is not None:
+            kwargs['config'] = config
         
         try:
-            return self._session.resource(
-                service_name,
-                region_name=region
-            )
+            return self._session.resource(service_name, **kwargs)
         except (ClientError, BotoCoreError) as e:
             raise AWSConnectionException(f"Failed to create {service_name} resource: {str(e)}")
     
+    def close_client(self, service_name: str, region_name: Optional[str] = None,
+                     config: Optional[Config] = None) -> None:
+        """
+        Release one client this manager handed out.
+        
+        Takes the same arguments as the get_client call that created it. The
+        client is closed, releasing its connection pool, only once no other
+        manager shares it.
+        
+        Args:
+            service_name (str): AWS service name (e.g., 's3', 'ec2', 'lambda').
+            region_name (str, optional): Region override passed to get_client.
+            config (botocore.config.Config, optional): Config passed to get_client.
+        """
+        client_key = (service_name, region_name or self.region_name, config)
+        client = self._clients.pop(client_key, None)
+        if client is None:
+            return
+        with _shared_clients_lock:
+            _release_shared_client((self.profile_name,) + client_key, client)
+    
+    def close(self) -> None:
+        """
+        Release the clients this manager handed out.
+        
+        Clients no other manager shares are closed and dropped from the
+        process-wide cache, so later get_client calls create fresh ones.
+        """
+        with _shared_clients_lock:
+            for client_key, client in self._clients.items():
+                _release_shared_client((self.profile_name,) + client_key, client)
+        self._clients.clear()
+        logger.debug("Closed AWS clients for profile %s", self.profile_name)
+    
+    def __enter__(self) -> 'AWSClientManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def list_profiles(self) -> list:
         """
         List available AWS profiles from the credentials file.
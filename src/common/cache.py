@@ -0,0 +1,102 @@
+"""
+In-process response caching for read-heavy AWS describe calls.
+"""
+
+import threading
+from typing import Any, Callable, Hashable
+
+from cachetools import TTLCache
+
+_MISSING = object()
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache for read-through AWS API responses.
+
+    Cached values are returned as-is, so callers should treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 30):
+        """
+        Initialize the response cache.
+
+        Args:
+            maxsize (int): Maximum number of entries to keep. Defaults to 512.
+            ttl (float): Seconds an entry stays fresh. Defaults to 30.
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], use_cache: bool = True) -> Any:
+        """
+        Return the cached value for a key, calling the loader on a miss.
+
+        Args:
+            key (Hashable): Cache key, typically built with cachetools.keys.hashkey.
+            loader (Callable): Zero-argument callable that fetches the value.
+            use_cache (bool): If False, always call the loader and refresh the entry.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        if use_cache:
+            with self._lock:
+                value = self._cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        value = loader()
+        with self._lock:
+            self._cache[key] = value
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for a key without loading it, e.g. for async callers.
+
+        Args:
+            key (Hashable): Cache key, typically built with cachetools.keys.hashkey.
+            default (Any): Value returned on a miss. Defaults to None.
+
+        Returns:
+            Any: The cached value, or default.
+        """
+        with self._lock:
+            return self._cache.get(key, default)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value fetched elsewhere, e.g. one item of a batch describe.
+
+        Args:
+            key (Hashable): Cache key, typically built with cachetools.keys.hashkey.
+            value (Any): Value to cache.
+        """
+        with self._lock:
+            self._cache[key] = value
+
+    def discard(self, match: Callable[[Hashable, Any], bool]) -> int:
+        """
+        Drop the entries for which match(key, value) is true.
+
+        Args:
+            match (Callable): Predicate called with each key and cached value.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        with self._lock:
+            stale = [key for key, value in self._cache.items() if match(key, value)]
+            for key in stale:
+                del self._cache[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
@@ -0,0 +1,150 @@
+"""
+On-disk JSON cache for describe responses that outlive the process.
+
+DiskCache has the same get_or_load and discard interface as ResponseCache,
+so repeated CLI runs can reuse responses fetched by an earlier run. Entries
+are files holding the key and value, whose modification time marks their
+age; datetimes round-trip as tagged ISO strings so cached responses keep
+the shapes boto3 returns.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Callable, Hashable, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up: pip install argus-aws[fast]
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_DATETIME_TAG = '$datetime'
+
+
+def _encode_default(value: Any) -> Any:
+    """Tag datetimes so _decode_object can restore them."""
+    if isinstance(value, datetime.datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_object(obj: dict) -> Any:
+    """Restore datetimes tagged by _encode_default."""
+    if len(obj) == 1 and _DATETIME_TAG in obj:
+        return datetime.datetime.fromisoformat(obj[_DATETIME_TAG])
+    return obj
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a value as JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_encode_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(value, default=_encode_default).encode()
+
+
+class DiskCache:
+    """Directory of JSON files, one per key, fresh for ttl seconds."""
+
+    def __init__(self, directory: str, ttl: float):
+        """
+        Initialize DiskCache.
+
+        Args:
+            directory (str): Directory holding the cache files; created on first write.
+            ttl (float): Seconds an entry stays fresh.
+        """
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+
+    def _read(self, path: str) -> Tuple[tuple, Any]:
+        """Return the (key, value) pair stored in a cache file."""
+        with open(path, 'rb') as f:
+            entry = json.loads(f.read(), object_hook=_decode_object)
+        return tuple(entry['key']), entry['value']
+
+    def _path(self, key: Hashable) -> str:
+        """Return the file for a key: <first key part>_<hash of the key>.json."""
+        digest = hashlib.sha256(json.dumps(list(key), default=str).encode()).hexdigest()[:16]
+        return os.path.join(self.directory, f"{key[0]}_{digest}.json")
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], use_cache: bool = True) -> Any:
+        """
+        Return the cached value for a key, calling the loader on a miss.
+
+        Unreadable or corrupt entries count as misses.
+
+        Args:
+            key (Hashable): Tuple of strings and None whose first item names the operation.
+            loader (Callable): Zero-argument callable that fetches the value.
+            use_cache (bool): If False, always call the loader and refresh the entry.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        path = self._path(key)
+        if use_cache:
+            try:
+                if time.time() - os.path.getmtime(path) < self.ttl:
+                    stored_key, value = self._read(path)
+                    if stored_key == tuple(key):
+                        return value
+            except (OSError, ValueError, KeyError):
+                pass
+
+        value = loader()
+        try:
+            self._write(path, _dumps({'key': list(key), 'value': value}))
+        except (OSError, TypeError) as e:
+            logger.debug("Could not write cache file %s: %s", path, e)
+        return value
+
+    def _write(self, path: str, data: bytes) -> None:
+        """Write a cache file atomically, so readers never see a partial file."""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+    def _paths(self) -> List[str]:
+        """Return the paths of all cache files."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.directory, name) for name in names if name.endswith('.json')]
+
+    def discard(self, match: Callable[[Hashable, Any], bool]) -> int:
+        """
+        Delete the entries for which match(key, value) is true.
+
+        Args:
+            match (Callable): Predicate called with each key and cached value.
+
+        Returns:
+            int: Number of entries deleted.
+        """
+        dropped = 0
+        for path in self._paths():
+            try:
+                if match(*self._read(path)):
+                    os.remove(path)
+                    dropped += 1
+            except (OSError, ValueError, KeyError):
+                continue
+        return dropped
+
+    def clear(self) -> None:
+        """Delete all cache files in the directory."""
+        for path in self._paths():
+            os.remove(path)
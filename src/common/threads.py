@@ -0,0 +1,85 @@
+"""
+Helpers for calling blocking boto3 code from async callers.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from .aws_client import DEFAULT_CLIENT_CONFIG
+
+try:
+    import anyio
+    import anyio.to_thread
+except ImportError:  # optional: pip install argus-aws[async]
+    anyio = None
+
+# Match the worker thread limit to the client connection pool size
+THREAD_LIMIT = DEFAULT_CLIENT_CONFIG.max_pool_connections
+
+
+def capacity_limiter(total_tokens: int = THREAD_LIMIT) -> Any:
+    """
+    Create a thread limiter for run_sync_limited.
+
+    Without anyio the limiter is a thread pool of the same size, which the
+    caller should shut down when it is done with it.
+
+    Args:
+        total_tokens (int): Maximum number of calls running in worker threads at once.
+
+    Returns:
+        anyio.CapacityLimiter or ThreadPoolExecutor: The new limiter.
+    """
+    if anyio is None:
+        return ThreadPoolExecutor(max_workers=total_tokens, thread_name_prefix='argus-async')
+    return anyio.CapacityLimiter(total_tokens)
+
+
+async def run_sync(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking function in a worker thread and await its result.
+
+    The event loop's default anyio thread limiter is raised to THREAD_LIMIT
+    so concurrent calls can use the whole client connection pool. Without
+    anyio the call runs on the event loop's default executor instead.
+
+    Args:
+        func (Callable): Blocking function to call.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        Any: The function's return value.
+    """
+    if anyio is None:
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    if limiter.total_tokens < THREAD_LIMIT:
+        limiter.total_tokens = THREAD_LIMIT
+    return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs))
+
+
+async def run_sync_limited(limiter: Any, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking function in a worker thread held by the given limiter.
+
+    Unlike run_sync, the calls do not compete for the event loop's default
+    thread limiter, which other libraries share.
+
+    Args:
+        limiter (anyio.CapacityLimiter or ThreadPoolExecutor): Limiter from capacity_limiter().
+        func (Callable): Blocking function to call.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        Any: The function's return value.
+    """
+    if anyio is None or isinstance(limiter, Executor):
+        executor = limiter if isinstance(limiter, Executor) else None
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(func, *args, **kwargs)
+        )
+    return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs), limiter=limiter)
@@ -3,29 +3,122 @@ DynamoDB Writer Module
 Provides functionality to create, update, and manage AWS DynamoDB tables and items.
 """
 
-from typing import Dict, Any, Optional, List, Union
+import contextlib
+import functools
+import json
+import logging
+import threading
+from typing import Dict, Any, Iterator, Optional, List, Sequence, Tuple, Union
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from decimal import Decimal
+from cachetools import LRUCache, cachedmethod
+from cachetools.keys import hashkey
+from decimal import Decimal, InvalidOperation
 
-from common.aws_client import AWSClientManager
+from common.aws_client import AWSClientManager, DEFAULT_CLIENT_CONFIG
 from common.exceptions import AWSResourceError, AWSPermissionException, ResourceNotFoundError
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up for large items
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# DynamoDB error code -> (exception class, table-specific message template)
+_CODE_TO_EXC = {
+    'AccessDeniedException': (AWSPermissionException, None),
+    'UnauthorizedOperation': (AWSPermissionException, None),
+    'ResourceNotFoundException': (ResourceNotFoundError, "Table '{table}' not found"),
+    'ResourceInUseException': (AWSResourceError, "Table '{table}' already exists or is in use"),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _float_to_decimal(text: str) -> Decimal:
+    """
+    Parse the repr of a float into a Decimal, memoized for repeated values.
+    
+    Keyed on the repr rather than the float so that -0.0 and 0.0 stay distinct.
+    Decimal is immutable and compares by value, so sharing instances is safe.
+    """
+    return Decimal(text)
+
+
+def _key_part(value: Any) -> Any:
+    """
+    Return a hashable form of one primary key value for deduplicating requests.
+    
+    Numbers compare by value as DynamoDB does, so 1, 1.0, Decimal('1') and the
+    typed {'N': '1.0'} all give the same key. Other typed AttributeValues such
+    as {'S': 'a'} are dicts, so their JSON form is used.
+    """
+    if isinstance(value, float):
+        return _float_to_decimal(repr(value))
+    if isinstance(value, (int, Decimal)) and not isinstance(value, bool):
+        return Decimal(value)
+    if isinstance(value, dict) and len(value) == 1 and isinstance(value.get('N'), str):
+        return Decimal(value['N'])
+    return json.dumps(value, sort_keys=True, default=repr)
+
+
+# Below this many top-level attributes the Python walk is faster than a round trip
+_ORJSON_MIN_ATTRIBUTES = 64
+
+if orjson is not None:
+    # Send datetimes, dataclasses and subclasses of builtins to the fallback path
+    # instead of letting orjson turn them into JSON primitives
+    _ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS |
+                       orjson.OPT_PASSTHROUGH_SUBCLASS)
+
+
+def _convert_with_orjson(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert floats to Decimals with a C-level JSON round trip.
+    
+    Returns None when the item holds anything the round trip cannot reproduce
+    exactly (bytes, sets, Decimals, non-string keys, NaN/inf, ...), in which
+    case the caller should use the Python walk instead.
+    """
+    try:
+        data = orjson.dumps(item, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return None
+    if b'null' in data:
+        # NaN and infinity serialize as null, so None cannot be told apart from them
+        return None
+    return json.loads(data, parse_float=Decimal)
+
+
+@functools.lru_cache(maxsize=None)
+def _client_config(retry_mode: str) -> Config:
+    """Return the shared client Config, overriding the retry mode if needed."""
+    if retry_mode == DEFAULT_CLIENT_CONFIG.retries['mode']:
+        return DEFAULT_CLIENT_CONFIG
+    return DEFAULT_CLIENT_CONFIG.merge(Config(retries={'mode': retry_mode, 'max_attempts': 10}))
+
 
 class DynamoDBWriter:
     """
     Handles write operations for AWS DynamoDB.
     """
     
-    def __init__(self, client_manager: AWSClientManager):
+    def __init__(self, client_manager: AWSClientManager, retry_mode: str = 'adaptive'):
         """
         Initialize the DynamoDB writer.
         
         Args:
             client_manager (AWSClientManager): AWS client manager instance.
+            retry_mode (str): botocore retry mode. 'adaptive' (the default) backs off
+                client-side when DynamoDB throttles; use 'standard' for more
+                predictable latency.
         """
         self.client_manager = client_manager
-        self.client = client_manager.get_client('dynamodb')
-        self.resource = client_manager.get_resource('dynamodb')
+        config = _client_config(retry_mode)
+        self.client = client_manager.get_client('dynamodb', config=config)
+        self.resource = client_manager.get_resource('dynamodb', config=config)
+        self._key_attrs_cache = LRUCache(maxsize=256)
+        self._key_attrs_lock = threading.Lock()
     
     def create_table(self, table_name: str, key_schema: List[Dict[str, str]],
                     attribute_definitions: List[Dict[str, str]],
@@ -94,13 +187,7 @@ class DynamoDBWriter:
             }
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-                raise AWSPermissionException(f"Failed to create table '{table_name}': {str(e)}") from e
-            elif error_code == 'ResourceInUseException':
-                raise AWSResourceError(f"Table '{table_name}' already exists") from e
-            else:
-                raise AWSResourceError(f"Failed to create table '{table_name}': {str(e)}") from e
+            self._raise(e, "create table '{table}'", table_name)
     
     def delete_table(self, table_name: str) -> Dict[str, Any]:
         """
@@ -119,6 +206,8 @@ class DynamoDBWriter:
         """
         try:
             response = self.client.delete_table(TableName=table_name)
+            with self._key_attrs_lock:
+                self._key_attrs_cache.pop(hashkey(table_name), None)
             
             return {
                 'table_name': table_name,
@@ -126,13 +215,7 @@ class DynamoDBWriter:
             }
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-                raise AWSPermissionException(f"Failed to delete table '{table_name}': {str(e)}") from e
-            elif error_code == 'ResourceNotFoundException':
-                raise ResourceNotFoundError(f"Table '{table_name}' not found") from e
-            else:
-                raise AWSResourceError(f"Failed to delete table '{table_name}': {str(e)}") from e
+            self._raise(e, "delete table '{table}'", table_name)
     
     def put_item(self, table_name: str, item: Dict[str, Any],
                 condition_expression: Optional[str] = None,
@@ -173,13 +256,7 @@ class DynamoDBWriter:
             return response
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-                raise AWSPermissionException(f"Failed to put item in table '{table_name}': {str(e)}") from e
-            elif error_code == 'ResourceNotFoundException':
-                raise ResourceNotFoundError(f"Table '{table_name}' not found") from e
-            else:
-                raise AWSResourceError(f"Failed to put item in table '{table_name}': {str(e)}") from e
+            self._raise(e, "put item in table '{table}'", table_name)
     
     def update_item(self, table_name: str, key: Dict[str, Any],
                    update_expression: str,
@@ -228,13 +305,7 @@ class DynamoDBWriter:
             return response
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-                raise AWSPermissionException(f"Failed to update item in table '{table_name}': {str(e)}") from e
-            elif error_code == 'ResourceNotFoundException':
-                raise ResourceNotFoundError(f"Table '{table_name}' not found") from e
-            else:
-                raise AWSResourceError(f"Failed to update item in table '{table_name}': {str(e)}") from e
+            self._raise(e, "update item in table '{table}'", table_name)
     
     def delete_item(self, table_name: str, key: Dict[str, Any],
                    condition_expression: Optional[str] = None,
@@ -280,20 +351,21 @@ class DynamoDBWriter:
             return response
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-                raise AWSPermissionException(f"Failed to delete item from table '{table_name}': {str(e)}") from e
-            elif error_code == 'ResourceNotFoundException':
-                raise ResourceNotFoundError(f"Table '{table_name}' not found") from e
-            else:
-                raise AWSResourceError(f"Failed to delete item from table '{table_name}': {str(e)}") from e
+            self._raise(e, "delete item from table '{table}'", table_name)
     
-    def batch_write_item(self, request_items: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    def batch_write_item(self, request_items: Dict[str, List[Dict[str, Any]]],
+                        key_schemas: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
         """
         Perform batch write operations on multiple tables.
         
+        DynamoDB rejects a batch that touches the same primary key twice, so
+        requests are deduplicated per table first; the last request for a key wins.
+        Floats in the request items are replaced with Decimals in place.
+        
         Args:
             request_items (Dict[str, List[Dict[str, Any]]]): Batch write request items.
+            key_schemas (Dict[str, List[str]], optional): Key attribute names per table.
+                Tables not listed here are looked up with describe_table.
         
         Returns:
             Dict[str, Any]: Batch write response.
@@ -303,27 +375,60 @@ class DynamoDBWriter:
             AWSPermissionException: If insufficient permissions.
         """
         try:
-            # Convert request items to DynamoDB format
+            key_schemas = key_schemas or {}
+            
+            # Convert request items to DynamoDB format in place
             converted_request_items = {}
             for table_name, items in request_items.items():
-                converted_items = []
+                key_attrs = key_schemas.get(table_name) or self._get_key_attrs(table_name)
+                items = self._dedupe_requests(table_name, items, key_attrs)
                 for item in items:
                     if 'PutRequest' in item:
-                        item['PutRequest']['Item'] = self._convert_to_dynamodb_format(item['PutRequest']['Item'])
+                        self._convert_in_place(item['PutRequest']['Item'])
                     elif 'DeleteRequest' in item:
-                        item['DeleteRequest']['Key'] = self._convert_to_dynamodb_format(item['DeleteRequest']['Key'])
-                    converted_items.append(item)
-                converted_request_items[table_name] = converted_items
+                        self._convert_in_place(item['DeleteRequest']['Key'])
+                converted_request_items[table_name] = items
             
             response = self.client.batch_write_item(RequestItems=converted_request_items)
             return response
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-                raise AWSPermissionException(f"Failed to perform batch write: {str(e)}") from e
-            else:
-                raise AWSResourceError(f"Failed to perform batch write: {str(e)}") from e
+            self._raise(e, "perform batch write")
+    
+    @contextlib.contextmanager
+    def batch_writer(self, table_name: str,
+                     overwrite_by_pkeys: Optional[List[str]] = None) -> Iterator[Any]:
+        """
+        Buffer writes to a table and send them as BatchWriteItem calls of 25 items.
+        
+        Wraps boto3's Table.batch_writer, which flushes automatically and retries
+        unprocessed items. Unlike put_item, items are passed through unchanged,
+        so numbers must already be int or Decimal.
+        
+        Args:
+            table_name (str): Name of the table.
+            overwrite_by_pkeys (List[str], optional): Key attribute names. When set,
+                a buffered request is replaced by a later one for the same key, so
+                the last write wins without DynamoDB rejecting the batch.
+        
+        Yields:
+            boto3.dynamodb.table.BatchWriter: Writer exposing put_item and delete_item.
+        
+        Raises:
+            AWSResourceError: If a batch write fails.
+            AWSPermissionException: If insufficient permissions.
+        
+        Example:
+            with writer.batch_writer('Orders') as batch:
+                for order in orders:
+                    batch.put_item(Item=order)
+        """
+        try:
+            table = self.resource.Table(table_name)
+            with table.batch_writer(overwrite_by_pkeys=overwrite_by_pkeys) as batch:
+                yield batch
+        except ClientError as e:
+            self._raise(e, "batch write to table '{table}'", table_name)
     
     def update_table_throughput(self, table_name: str, 
                                provisioned_throughput: Dict[str, int],
@@ -356,13 +461,7 @@ class DynamoDBWriter:
             return response
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-                raise AWSPermissionException(f"Failed to update table throughput: {str(e)}") from e
-            elif error_code == 'ResourceNotFoundException':
-                raise ResourceNotFoundError(f"Table '{table_name}' not found") from e
-            else:
-                raise AWSResourceError(f"Failed to update table throughput: {str(e)}") from e
+            self._raise(e, "update throughput for table '{table}'", table_name)
     
     def tag_resource(self, resource_arn: str, tags: List[Dict[str, str]]) -> bool:
         """
@@ -387,11 +486,7 @@ class DynamoDBWriter:
             return True
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-                raise AWSPermissionException(f"Failed to tag resource: {str(e)}") from e
-            else:
-                raise AWSResourceError(f"Failed to tag resource: {str(e)}") from e
+            self._raise(e, "tag resource")
     
     def untag_resource(self, resource_arn: str, tag_keys: List[str]) -> bool:
         """
@@ -416,27 +511,158 @@ class DynamoDBWriter:
             return True
             
         except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code in ['AccessDeniedException', 'UnauthorizedOperation']:
-                raise AWSPermissionException(f"Failed to untag resource: {str(e)}") from e
+            self._raise(e, "untag resource")
+    
+    def _raise(self, e: ClientError, action: str, table_name: Optional[str] = None) -> None:
+        """
+        Translate a ClientError into the matching Argus exception.
+        
+        Args:
+            e (ClientError): The error raised by boto3.
+            action (str): Description of the failed action; '{table}' is filled in.
+            table_name (str, optional): Table the action targeted.
+        
+        Raises:
+            AWSPermissionException: If the caller lacks permissions.
+            ResourceNotFoundError: If the table doesn't exist.
+            AWSResourceError: For any other failure.
+        """
+        code = e.response.get('Error', {}).get('Code')
+        exc_class, template = _CODE_TO_EXC.get(code, (AWSResourceError, None))
+        if template and table_name:
+            message = template.format(table=table_name)
+        else:
+            message = f"Failed to {action.format(table=table_name)}: {e}"
+        raise exc_class(message) from e
+    
+    @cachedmethod(lambda self: self._key_attrs_cache, lock=lambda self: self._key_attrs_lock)
+    def _get_key_attrs(self, table_name: str) -> Tuple[str, ...]:
+        """
+        Look up the primary key attribute names of a table.
+        
+        A table's key schema can't change, so the result is cached per writer
+        and only dropped when the table is deleted through this writer.
+        
+        Args:
+            table_name (str): Name of the table.
+        
+        Returns:
+            Tuple[str, ...]: Partition key name, followed by the sort key name if any.
+        """
+        response = self.client.describe_table(TableName=table_name)
+        return tuple(k['AttributeName'] for k in response['Table']['KeySchema'])
+    
+    def _dedupe_requests(self, table_name: str, requests: List[Dict[str, Any]],
+                         key_attrs: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Collapse write requests that target the same primary key, keeping the last one.
+        
+        Args:
+            table_name (str): Name of the table, used for logging.
+            requests (List[Dict[str, Any]]): PutRequest/DeleteRequest entries for the table.
+            key_attrs (Sequence[str]): Primary key attribute names.
+        
+        Returns:
+            List[Dict[str, Any]]: Requests with at most one entry per primary key.
+        """
+        deduped = {}
+        for request in requests:
+            if 'PutRequest' in request:
+                source = request['PutRequest']['Item']
             else:
-                raise AWSResourceError(f"Failed to untag resource: {str(e)}") from e
+                source = request.get('DeleteRequest', {}).get('Key', {})
+            try:
+                key = tuple(_key_part(source[attr]) for attr in key_attrs)
+            except (KeyError, TypeError, ValueError, InvalidOperation):
+                # Without a usable key, let DynamoDB validate the request as-is
+                key = id(request)
+            deduped[key] = request
+        
+        collisions = len(requests) - len(deduped)
+        if collisions:
+            logger.debug("Dropped %d duplicate-key requests from batch for table '%s'",
+                         collisions, table_name)
+        return list(deduped.values())
     
     def _convert_to_dynamodb_format(self, item: Any) -> Any:
         """
         Convert Python types to DynamoDB format.
         
+        Items without floats are returned unchanged. Large items go through
+        orjson when it is installed; everything else uses the recursive Python walk.
+        
         Args:
             item: Item to convert.
         
         Returns:
             Converted item in DynamoDB format.
         """
+        if not self._needs_conversion(item):
+            return item
+        if orjson is not None and type(item) is dict and len(item) >= _ORJSON_MIN_ATTRIBUTES:
+            converted = _convert_with_orjson(item)
+            if converted is not None:
+                return converted
+        return self._convert_value(item)
+    
+    def _needs_conversion(self, item: Any) -> bool:
+        """
+        Check whether a value contains any float that must become a Decimal.
+        
+        Items built with Decimals already skip the copying walk entirely.
+        
+        Args:
+            item: Value to check.
+        
+        Returns:
+            bool: True if a float is found in the value or its nested dicts and lists.
+        """
+        stack = [item]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, float):
+                return True
+            if isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, list):
+                stack.extend(value)
+        return False
+    
+    def _convert_in_place(self, item: Any) -> None:
+        """
+        Replace floats with Decimals inside nested dicts and lists, mutating them.
+        
+        Used on batch paths where the request structure is already owned by the
+        call, avoiding a full copy of every item.
+        
+        Args:
+            item: Dict or list to convert.
+        """
+        stack = [item]
+        while stack:
+            node = stack.pop()
+            entries = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in entries:
+                if isinstance(value, float):
+                    node[key] = _float_to_decimal(repr(value))
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+    
+    def _convert_value(self, item: Any) -> Any:
+        """
+        Recursively convert floats to Decimals, leaving other values untouched.
+        
+        Args:
+            item: Value to convert.
+        
+        Returns:
+            Converted value.
+        """
         if isinstance(item, dict):
-            return {k: self._convert_to_dynamodb_format(v) for k, v in item.items()}
+            return {k: self._convert_value(v) for k, v in item.items()}
         elif isinstance(item, list):
-            return [self._convert_to_dynamodb_format(v) for v in item]
+            return [self._convert_value(v) for v in item]
         elif isinstance(item, float):
-            return Decimal(str(item))
+            return _float_to_decimal(repr(item))
         else:
             return item
@@ -8,6 +8,10 @@ including applications, environments, application versions, and configurations.
 import logging
 from typing import List, Dict, Any, Optional
 from botocore.exceptions import ClientError
+from cachetools.keys import hashkey
+
+from common.aws_client import DEFAULT_CLIENT_CONFIG
+from common.cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -15,23 +19,29 @@ logger = logging.getLogger(__name__)
 class EBSReader:
     """Reader class for AWS Elastic Beanstalk resources."""
     
-    def __init__(self, client_manager):
+    def __init__(self, client_manager, cache_ttl: float = 30):
         """
         Initialize EBS Reader.
         
         Args:
             client_manager: AWS client manager instance
+            cache_ttl: Seconds to cache describe responses for the get_* methods
         """
         self.client_manager = client_manager
         self._client = None
+        self._cache = ResponseCache(maxsize=512, ttl=cache_ttl)
     
     @property
     def client(self):
         """Get or create the Elastic Beanstalk client."""
         if self._client is None:
-            self._client = self.client_manager.get_client('elasticbeanstalk')
+            self._client = self.client_manager.get_client('elasticbeanstalk', config=DEFAULT_CLIENT_CONFIG)
         return self._client
     
+    def clear_cache(self) -> None:
+        """Drop all cached describe responses."""
+        self._cache.clear()
+    
     def list_applications(self) -> List[Dict[str, Any]]:
         """
         List all Elastic Beanstalk applications.
@@ -49,18 +59,18 @@ class EBSReader:
             logger.error(f"Error listing applications: {e}")
             raise
     
-    def get_application(self, application_name: str) -> Optional[Dict[str, Any]]:
+    def get_application(self, application_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get details for a specific application.
         
         Args:
             application_name: Name of the application
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             Application details or None if not found
         """
-        try:
-            logger.info(f"Getting application details: {application_name}")
+        def fetch():
             response = self.client.describe_applications(
                 ApplicationNames=[application_name]
             )
@@ -68,6 +78,11 @@ class EBSReader:
             if applications:
                 return applications[0]
             return None
+        
+        try:
+            logger.info(f"Getting application details: {application_name}")
+            key = hashkey('get_application', application_name)
+            return self._cache.get_or_load(key, fetch, use_cache)
         except ClientError as e:
             logger.error(f"Error getting application {application_name}: {e}")
             raise
@@ -96,13 +111,15 @@ class EBSReader:
             logger.error(f"Error listing environments: {e}")
             raise
     
-    def get_environment(self, environment_id: str = None, environment_name: str = None) -> Optional[Dict[str, Any]]:
+    def get_environment(self, environment_id: str = None, environment_name: str = None,
+                        use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get details for a specific environment.
         
         Args:
             environment_id: Environment ID
             environment_name: Environment name
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             Environment details or None if not found
@@ -118,11 +135,15 @@ class EBSReader:
             else:
                 raise ValueError("Either environment_id or environment_name must be provided")
             
-            response = self.client.describe_environments(**params)
-            environments = response.get('Environments', [])
-            if environments:
-                return environments[0]
-            return None
+            def fetch():
+                response = self.client.describe_environments(**params)
+                environments = response.get('Environments', [])
+                if environments:
+                    return environments[0]
+                return None
+            
+            key = hashkey('get_environment', environment_id, environment_name)
+            return self._cache.get_or_load(key, fetch, use_cache)
         except ClientError as e:
             logger.error(f"Error getting environment: {e}")
             raise
@@ -149,19 +170,20 @@ class EBSReader:
             logger.error(f"Error listing application versions: {e}")
             raise
     
-    def get_application_version(self, application_name: str, version_label: str) -> Optional[Dict[str, Any]]:
+    def get_application_version(self, application_name: str, version_label: str,
+                                use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get details for a specific application version.
         
         Args:
             application_name: Name of the application
             version_label: Version label
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             Application version details or None if not found
         """
-        try:
-            logger.info(f"Getting application version: {application_name}/{version_label}")
+        def fetch():
             response = self.client.describe_application_versions(
                 ApplicationName=application_name,
                 VersionLabels=[version_label]
@@ -170,17 +192,24 @@ class EBSReader:
             if versions:
                 return versions[0]
             return None
+        
+        try:
+            logger.info(f"Getting application version: {application_name}/{version_label}")
+            key = hashkey('get_application_version', application_name, version_label)
+            return self._cache.get_or_load(key, fetch, use_cache)
         except ClientError as e:
             logger.error(f"Error getting application version: {e}")
             raise
     
-    def get_environment_health(self, environment_id: str = None, environment_name: str = None) -> Dict[str, Any]:
+    def get_environment_health(self, environment_id: str = None, environment_name: str = None,
+                               use_cache: bool = True) -> Dict[str, Any]:
         """
         Get health information for an environment.
         
         Args:
             environment_id: Environment ID
             environment_name: Environment name
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             Environment health information
@@ -199,8 +228,10 @@ class EBSReader:
             elif environment_name:
                 params['EnvironmentName'] = environment_name
             
-            response = self.client.describe_environment_health(**params)
-            return response
+            key = hashkey('get_environment_health', environment_id, environment_name)
+            return self._cache.get_or_load(
+                key, lambda: self.client.describe_environment_health(**params), use_cache
+            )
         except ClientError as e:
             logger.error(f"Error getting environment health: {e}")
             raise
@@ -227,13 +258,15 @@ class EBSReader:
             logger.error(f"Error listing configuration templates: {e}")
             raise
     
-    def get_environment_resources(self, environment_id: str = None, environment_name: str = None) -> Dict[str, Any]:
+    def get_environment_resources(self, environment_id: str = None, environment_name: str = None,
+                                  use_cache: bool = True) -> Dict[str, Any]:
         """
         Get AWS resources used by an environment.
         
         Args:
             environment_id: Environment ID
             environment_name: Environment name
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             Environment resources information
@@ -249,23 +282,33 @@ class EBSReader:
             else:
                 raise ValueError("Either environment_id or environment_name must be provided")
             
-            response = self.client.describe_environment_resources(**params)
-            return response.get('EnvironmentResources', {})
+            def fetch():
+                response = self.client.describe_environment_resources(**params)
+                return response.get('EnvironmentResources', {})
+            
+            key = hashkey('get_environment_resources', environment_id, environment_name)
+            return self._cache.get_or_load(key, fetch, use_cache)
         except ClientError as e:
             logger.error(f"Error getting environment resources: {e}")
             raise
     
-    def list_platform_versions(self) -> List[Dict[str, Any]]:
+    def list_platform_versions(self, use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         List available platform versions.
         
+        Args:
+            use_cache: Whether to serve a recently cached response
+            
         Returns:
             List of platform version dictionaries
         """
+        def fetch():
+            response = self.client.list_platform_versions()
+            return response.get('PlatformSummaryList', [])
+        
         try:
             logger.info("Listing platform versions")
-            response = self.client.list_platform_versions()
-            platforms = response.get('PlatformSummaryList', [])
+            platforms = self._cache.get_or_load(hashkey('list_platform_versions'), fetch, use_cache)
             logger.info(f"Found {len(platforms)} platform versions")
             return platforms
         except ClientError as e:
@@ -9,12 +9,60 @@ import logging
 from typing import Dict, Any, Optional, List
 from botocore.exceptions import ClientError
 
+from common.aws_client import DEFAULT_CLIENT_CONFIG
+from common.threads import run_sync
+
 logger = logging.getLogger(__name__)
 
 
+def _with_optional(params: Dict[str, Any], *fields) -> Dict[str, Any]:
+    """
+    Merge optional request fields into the required parameters.
+    
+    Args:
+        params: Required request parameters
+        *fields: (key, value) pairs; pairs with empty values are dropped
+        
+    Returns:
+        Request parameters for the API call
+    """
+    return {**params, **{key: value for key, value in fields if value}}
+
+
+def _env_params(environment_id: Optional[str], environment_name: Optional[str],
+                id_key: str = 'EnvironmentId', name_key: str = 'EnvironmentName') -> Dict[str, str]:
+    """
+    Build the parameter that identifies an environment, preferring the ID.
+    
+    Args:
+        environment_id: Environment ID
+        environment_name: Environment name
+        id_key: Request key for the ID
+        name_key: Request key for the name
+        
+    Returns:
+        Single-entry parameter dictionary
+        
+    Raises:
+        ValueError: If neither the ID nor the name is provided
+    """
+    if environment_id:
+        return {id_key: environment_id}
+    if environment_name:
+        return {name_key: environment_name}
+    raise ValueError(f"Either {_snake(id_key)} or {_snake(name_key)} must be provided")
+
+
+def _snake(key: str) -> str:
+    """Convert a request key such as 'SourceEnvironmentId' to 'source_environment_id'."""
+    return ''.join(f'_{c.lower()}' if c.isupper() else c for c in key).lstrip('_')
+
+
 class EBSWriter:
     """Writer class for AWS Elastic Beanstalk resources."""
     
+    __slots__ = ('client_manager', '_client')
+    
     def __init__(self, client_manager):
         """
         Initialize EBS Writer.
@@ -29,9 +77,21 @@ class EBSWriter:
     def client(self):
         """Get or create the Elastic Beanstalk client."""
         if self._client is None:
-            self._client = self.client_manager.get_client('elasticbeanstalk')
+            self._client = self.client_manager.get_client('elasticbeanstalk', config=DEFAULT_CLIENT_CONFIG)
         return self._client
     
+    def close(self) -> None:
+        """Release the Elastic Beanstalk client, closing it unless another manager shares it."""
+        if self._client is not None:
+            self.client_manager.close_client('elasticbeanstalk', config=DEFAULT_CLIENT_CONFIG)
+            self._client = None
+    
+    def __enter__(self) -> 'EBSWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def create_application(self, application_name: str, description: str = None, 
                           resource_lifecycle_config: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -47,14 +107,11 @@ class EBSWriter:
         """
         try:
             logger.info("Creating application: %s", application_name)
-            params = {
-                'ApplicationName': application_name
-            }
-            
-            if description:
-                params['Description'] = description
-            if resource_lifecycle_config:
-                params['ResourceLifecycleConfig'] = resource_lifecycle_config
+            params = _with_optional(
+                {'ApplicationName': application_name},
+                ('Description', description),
+                ('ResourceLifecycleConfig', resource_lifecycle_config),
+            )
             
             response = self.client.create_application(**params)
             logger.info("Successfully created application: %s", application_name)
@@ -99,15 +156,11 @@ class EBSWriter:
         """
         try:
             logger.info("Creating application version: %s/%s", application_name, version_label)
-            params = {
-                'ApplicationName': application_name,
-                'VersionLabel': version_label
-            }
-            
-            if source_bundle:
-                params['SourceBundle'] = source_bundle
-            if description:
-                params['Description'] = description
+            params = _with_optional(
+                {'ApplicationName': application_name, 'VersionLabel': version_label},
+                ('SourceBundle', source_bundle),
+                ('Description', description),
+            )
             
             response = self.client.create_application_version(**params)
             logger.info("Successfully created application version: %s/%s", application_name, version_label)
@@ -162,25 +215,16 @@ class EBSWriter:
         """
         try:
             logger.info("Creating environment: %s for application: %s", environment_name, application_name)
-            params = {
-                'ApplicationName': application_name,
-                'EnvironmentName': environment_name
-            }
-            
-            if solution_stack_name:
-                params['SolutionStackName'] = solution_stack_name
-            if platform_arn:
-                params['PlatformArn'] = platform_arn
-            if version_label:
-                params['VersionLabel'] = version_label
-            if template_name:
-                params['TemplateName'] = template_name
-            if description:
-                params['Description'] = description
-            if option_settings:
-                params['OptionSettings'] = option_settings
-            if tags:
-                params['Tags'] = tags
+            params = _with_optional(
+                {'ApplicationName': application_name, 'EnvironmentName': environment_name},
+                ('SolutionStackName', solution_stack_name),
+                ('PlatformArn', platform_arn),
+                ('VersionLabel', version_label),
+                ('TemplateName', template_name),
+                ('Description', description),
+                ('OptionSettings', option_settings),
+                ('Tags', tags),
+            )
             
             response = self.client.create_environment(**params)
             logger.info("Successfully created environment: %s", environment_name)
@@ -206,17 +250,10 @@ class EBSWriter:
         try:
             params = {
                 'TerminateResources': terminate_resources,
-                'ForceTerminate': force_terminate
+                'ForceTerminate': force_terminate,
+                **_env_params(environment_id, environment_name)
             }
-            
-            if environment_id:
-                params['EnvironmentId'] = environment_id
-                logger.info("Terminating environment by ID: %s", environment_id)
-            elif environment_name:
-                params['EnvironmentName'] = environment_name
-                logger.info("Terminating environment by name: %s", environment_name)
-            else:
-                raise ValueError("Either environment_id or environment_name must be provided")
+            logger.info("Terminating environment: %s", environment_id or environment_name)
             
             response = self.client.terminate_environment(**params)
             logger.info("Successfully initiated environment termination")
@@ -249,31 +286,17 @@ class EBSWriter:
             Update response
         """
         try:
-            params = {}
-            
-            if environment_id:
-                params['EnvironmentId'] = environment_id
-                logger.info("Updating environment by ID: %s", environment_id)
-            elif environment_name:
-                params['EnvironmentName'] = environment_name
-                logger.info("Updating environment by name: %s", environment_name)
-            else:
-                raise ValueError("Either environment_id or environment_name must be provided")
-            
-            if version_label:
-                params['VersionLabel'] = version_label
-            if template_name:
-                params['TemplateName'] = template_name
-            if solution_stack_name:
-                params['SolutionStackName'] = solution_stack_name
-            if platform_arn:
-                params['PlatformArn'] = platform_arn
-            if option_settings:
-                params['OptionSettings'] = option_settings
-            if options_to_remove:
-                params['OptionsToRemove'] = options_to_remove
-            if description:
-                params['Description'] = description
+            logger.info("Updating environment: %s", environment_id or environment_name)
+            params = _with_optional(
+                _env_params(environment_id, environment_name),
+                ('VersionLabel', version_label),
+                ('TemplateName', template_name),
+                ('SolutionStackName', solution_stack_name),
+                ('PlatformArn', platform_arn),
+                ('OptionSettings', option_settings),
+                ('OptionsToRemove', options_to_remove),
+                ('Description', description),
+            )
             
             response = self.client.update_environment(**params)
             logger.info("Successfully updated environment")
@@ -294,21 +317,12 @@ class EBSWriter:
             destination_environment_name: Destination environment name
         """
         try:
-            params = {}
-            
-            if source_environment_id:
-                params['SourceEnvironmentId'] = source_environment_id
-            elif source_environment_name:
-                params['SourceEnvironmentName'] = source_environment_name
-            else:
-                raise ValueError("Either source_environment_id or source_environment_name must be provided")
-            
-            if destination_environment_id:
-                params['DestinationEnvironmentId'] = destination_environment_id
-            elif destination_environment_name:
-                params['DestinationEnvironmentName'] = destination_environment_name
-            else:
-                raise ValueError("Either destination_environment_id or destination_environment_name must be provided")
+            params = {
+                **_env_params(source_environment_id, source_environment_name,
+                              'SourceEnvironmentId', 'SourceEnvironmentName'),
+                **_env_params(destination_environment_id, destination_environment_name,
+                              'DestinationEnvironmentId', 'DestinationEnvironmentName')
+            }
             
             logger.info("Swapping environment CNAMEs")
             self.client.swap_environment_cnames(**params)
@@ -326,19 +340,47 @@ class EBSWriter:
             environment_name: Environment name
         """
         try:
-            params = {}
-            
-            if environment_id:
-                params['EnvironmentId'] = environment_id
-                logger.info("Restarting app server for environment ID: %s", environment_id)
-            elif environment_name:
-                params['EnvironmentName'] = environment_name
-                logger.info("Restarting app server for environment: %s", environment_name)
-            else:
-                raise ValueError("Either environment_id or environment_name must be provided")
+            params = _env_params(environment_id, environment_name)
+            logger.info("Restarting app server for environment: %s", environment_id or environment_name)
             
             self.client.restart_app_server(**params)
             logger.info("Successfully initiated app server restart")
         except ClientError as e:
             logger.error("Error restarting app server: %s", e)
             raise
+    
+    async def create_application_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async version of create_application; runs it in a worker thread."""
+        return await run_sync(self.create_application, *args, **kwargs)
+    
+    async def delete_application_async(self, *args, **kwargs) -> None:
+        """Async version of delete_application; runs it in a worker thread."""
+        return await run_sync(self.delete_application, *args, **kwargs)
+    
+    async def create_application_version_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async version of create_application_version; runs it in a worker thread."""
+        return await run_sync(self.create_application_version, *args, **kwargs)
+    
+    async def delete_application_version_async(self, *args, **kwargs) -> None:
+        """Async version of delete_application_version; runs it in a worker thread."""
+        return await run_sync(self.delete_application_version, *args, **kwargs)
+    
+    async def create_environment_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async version of create_environment; runs it in a worker thread."""
+        return await run_sync(self.create_environment, *args, **kwargs)
+    
+    async def terminate_environment_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async version of terminate_environment; runs it in a worker thread."""
+        return await run_sync(self.terminate_environment, *args, **kwargs)
+    
+    async def update_environment_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """Async version of update_environment; runs it in a worker thread."""
+        return await run_sync(self.update_environment, *args, **kwargs)
+    
+    async def swap_environment_cnames_async(self, *args, **kwargs) -> None:
+        """Async version of swap_environment_cnames; runs it in a worker thread."""
+        return await run_sync(self.swap_environment_cnames, *args, **kwargs)
+    
+    async def restart_app_server_async(self, *args, **kwargs) -> None:
+        """Async version of restart_app_server; runs it in a worker thread."""
+        return await run_sync(self.restart_app_server, *args, **kwargs)
@@ -7,5 +7,7 @@ security groups, key pairs, and other EC2 resources.
 
 from .read.ec2_reader import EC2Reader
 from .write.ec2_writer import EC2Writer
+from .write.ec2_writer_async import AsyncEC2Writer
+from .write.tag_batcher import TagBatcher
 
-__all__ = ['EC2Reader', 'EC2Writer']
+__all__ = ['EC2Reader', 'EC2Writer', 'AsyncEC2Writer', 'TagBatcher']
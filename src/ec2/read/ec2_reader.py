@@ -5,34 +5,188 @@ This module provides methods to read and query EC2 instances, security groups,
 key pairs, AMIs, and other EC2 resources.
 """
 
+import asyncio
+import json
 import logging
-from typing import List, Dict, Any, Optional
-from common.aws_client import AWSClientManager
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import chain
+from typing import List, Dict, Any, Iterator, Optional, Sequence
+from cachetools.keys import hashkey
+
+from common.aws_client import AWSClientManager, DEFAULT_CLIENT_CONFIG
+from common.cache import ResponseCache
+from common.threads import run_sync
 from common.exceptions import AWSResourceError, ResourceNotFoundError
 
+try:
+    import aioboto3
+except ImportError:  # optional: pip install argus-aws[async]
+    aioboto3 = None
+
 logger = logging.getLogger(__name__)
 
+# Largest page the EC2 describe_* paginators accept
+_PAGE_SIZE = 1000
+
+# Most instance IDs describe_instances accepts per request
+_MAX_INSTANCE_IDS = 100
+
+# Worker threads shared by get_instances and snapshot
+_MAX_WORKERS = 8
+
+# describe_instances names its state filter differently from other resources
+_INSTANCE_FILTER_ALIASES = {'state': 'instance-state-name'}
+
+# Non-paginated client methods bound once the client exists, saving two
+# attribute lookups per call
+_PREBOUND_METHODS = ('describe_instances', 'describe_instance_status',
+                     'describe_security_groups', 'describe_key_pairs')
+
+# Error codes for lookups of resources that don't exist
+_NOT_FOUND_ERRORS = {
+    'InvalidInstanceID.NotFound': ResourceNotFoundError,
+    'InvalidGroupId.NotFound': ResourceNotFoundError,
+    'InvalidGroup.NotFound': ResourceNotFoundError,
+}
+
+
+def _error_code(e: Exception) -> Optional[str]:
+    """Return the AWS error code of a botocore ClientError, or None for other errors."""
+    return getattr(e, 'response', {}).get('Error', {}).get('Code')
+
+
+def _filter_values(value: Any) -> List[Any]:
+    """Wrap a single filter value in a list."""
+    return list(value) if isinstance(value, (list, tuple, set, frozenset)) else [value]
+
+
+def _build_filters(filters: Optional[List[Dict[str, Any]]] = None,
+                   aliases: Optional[Dict[str, str]] = None,
+                   **filter_kwargs) -> Optional[List[Dict[str, Any]]]:
+    """
+    Combine explicit EC2 filters with keyword filter shorthands.
+    
+    Keyword names become filter names with underscores replaced by hyphens
+    (availability_zone -> availability-zone) unless aliased, tag={'Env': 'prod'}
+    becomes a tag:Env filter, and None values are skipped.
+    
+    Args:
+        filters: Explicit EC2 filter dictionaries
+        aliases: Keyword-to-filter-name overrides for the resource type
+        **filter_kwargs: Filter shorthands
+        
+    Returns:
+        List of EC2 filter dictionaries, or None if there are none
+    """
+    built = list(filters or [])
+    for name, value in filter_kwargs.items():
+        if value is None:
+            continue
+        if name == 'tag':
+            built.extend({'Name': f'tag:{k}', 'Values': _filter_values(v)} for k, v in value.items())
+        else:
+            filter_name = (aliases or {}).get(name, name.replace('_', '-'))
+            built.append({'Name': filter_name, 'Values': _filter_values(value)})
+    return built or None
+
+
+def _canonical(value: Any) -> str:
+    """Serialize request parameters into a stable, hashable cache key component."""
+    return json.dumps(value, sort_keys=True)
+
 
 class EC2Reader:
     """EC2 read operations using boto3."""
     
-    def __init__(self, client_manager: AWSClientManager):
+    __slots__ = ('client_manager', '_cache', '_ec2_client', '_async_client_context',
+                 '_async_client', '_async_lock', '_executor') + tuple(f'_{name}' for name in _PREBOUND_METHODS)
+    
+    def __init__(self, client_manager: AWSClientManager, cache_ttl: float = 900):
         """
         Initialize EC2Reader.
         
         Args:
             client_manager: AWSClientManager instance for AWS service clients
+            cache_ttl: Seconds to cache AMI, key pair, VPC and subnet listings
         """
         self.client_manager = client_manager
-        self.ec2_client = client_manager.get_client('ec2')
+        self._cache = ResponseCache(maxsize=128, ttl=cache_ttl)
+        self._ec2_client = None
+        self._async_client_context = None
+        self._async_client = None
+        self._async_lock = None
+        self._executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix='ec2-reader')
+        for name in _PREBOUND_METHODS:
+            setattr(self, f'_{name}', self._first_call(name))
         logger.info("EC2Reader initialized successfully")
     
-    def list_instances(self, filters: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    @property
+    def ec2_client(self):
+        """Get or create the EC2 client."""
+        if self._ec2_client is None:
+            self._ec2_client = self.client_manager.get_client('ec2', config=DEFAULT_CLIENT_CONFIG)
+            for name in _PREBOUND_METHODS:
+                setattr(self, f'_{name}', getattr(self._ec2_client, name))
+        return self._ec2_client
+    
+    def close(self) -> None:
+        """
+        Release the EC2 client and shut down the worker threads.
+        
+        The client is closed unless another client manager shares it.
+        
+        snapshot and multi-chunk get_instances calls can't be made after closing.
+        """
+        self._executor.shutdown(wait=True)
+        if self._ec2_client is not None:
+            self.client_manager.close_client('ec2', config=DEFAULT_CLIENT_CONFIG)
+            self._ec2_client = None
+            for name in _PREBOUND_METHODS:
+                setattr(self, f'_{name}', self._first_call(name))
+    
+    def __enter__(self) -> 'EC2Reader':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> 'EC2Reader':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+        # close() waits for the worker threads, so keep that wait off the event loop
+        await run_sync(self.close)
+    
+    def _first_call(self, name: str):
+        """Return a placeholder that creates the client, which rebinds the method, then calls it."""
+        def call(**kwargs):
+            return getattr(self.ec2_client, name)(**kwargs)
+        return call
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached AMI, key pair, VPC and subnet listings."""
+        self._cache.clear()
+    
+    def refresh_cache(self) -> None:
+        """Drop cached listings and reload the unfiltered key pair, VPC and subnet listings."""
+        self.invalidate_cache()
+        self.list_key_pairs()
+        self.list_vpcs()
+        self.list_subnets()
+    
+    def list_instances(self, filters: Optional[List[Dict[str, Any]]] = None,
+                       projection: Optional[Sequence[str]] = None,
+                       **filter_kwargs) -> List[Dict[str, Any]]:
         """
         List all EC2 instances with optional filters.
         
         Args:
             filters: Optional filters to apply to the query
+            projection: Optional instance fields to keep, e.g. ('InstanceId', 'State');
+                other fields are dropped as each page is read
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                availability_zone='us-east-1a' or tag={'Env': 'prod'}
             
         Returns:
             List of EC2 instance dictionaries
@@ -40,25 +194,39 @@ class EC2Reader:
         Raises:
             AWSResourceError: If there's an error listing instances
         """
-        try:
-            logger.info("Listing EC2 instances")
-            
-            kwargs = {}
-            if filters:
-                kwargs['Filters'] = filters
-            
-            response = self.ec2_client.describe_instances(**kwargs)
-            
-            instances = []
-            for reservation in response.get('Reservations', []):
-                for instance in reservation.get('Instances', []):
-                    instances.append(instance)
+        logger.info("Listing EC2 instances")
+        instances = list(self.iter_instances(filters, projection, **filter_kwargs))
+        logger.info("Found %s EC2 instances", len(instances))
+        return instances
+    
+    def iter_instances(self, filters: Optional[List[Dict[str, Any]]] = None,
+                       projection: Optional[Sequence[str]] = None,
+                       **filter_kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over EC2 instances page by page.
+        
+        Args:
+            filters: Optional filters to apply to the query
+            projection: Optional instance fields to keep, e.g. ('InstanceId', 'State');
+                other fields are dropped as each page is read
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                availability_zone='us-east-1a' or tag={'Env': 'prod'}
             
-            logger.info(f"Found {len(instances)} EC2 instances")
-            return instances
+        Yields:
+            EC2 instance dictionaries
             
+        Raises:
+            AWSResourceError: If there's an error listing instances
+        """
+        filters = _build_filters(filters, _INSTANCE_FILTER_ALIASES, **filter_kwargs)
+        try:
+            reservations = self._paginate('describe_instances', 'Reservations', filters)
+            instances = chain.from_iterable(r.get('Instances', ()) for r in reservations)
+            if projection:
+                instances = ({key: instance.get(key) for key in projection} for instance in instances)
+            yield from instances
         except Exception as e:
-            logger.error(f"Error listing EC2 instances: {e}")
+            logger.error("Error listing EC2 instances: %s", e)
             raise AWSResourceError(f"Failed to list EC2 instances: {e}")
     
     def get_instance(self, instance_id: str) -> Dict[str, Any]:
@@ -75,33 +243,78 @@ class EC2Reader:
             ResourceNotFoundError: If the instance is not found
             AWSResourceError: If there's an error getting the instance
         """
+        logger.info("Getting EC2 instance: %s", instance_id)
+        
         try:
-            logger.info(f"Getting EC2 instance: {instance_id}")
+            instance = self.get_instances([instance_id]).get(instance_id)
+        except ResourceNotFoundError:
+            instance = None
+        
+        if instance is None:
+            raise ResourceNotFoundError(f"EC2 instance not found: {instance_id}")
+        
+        logger.info("Successfully retrieved instance: %s", instance_id)
+        return instance
+    
+    def get_instances(self, instance_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get details for several EC2 instances with as few API calls as possible.
+        
+        IDs are sent 100 per describe_instances request, and requests for more
+        than 100 IDs run concurrently.
+        
+        Args:
+            instance_ids: The EC2 instance IDs
             
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
+        Returns:
+            Instance details dictionaries keyed by instance ID
             
-            if not response.get('Reservations'):
-                raise ResourceNotFoundError(f"EC2 instance not found: {instance_id}")
+        Raises:
+            ResourceNotFoundError: If any of the instances is not found
+            AWSResourceError: If there's an error getting the instances
+        """
+        ids = list(dict.fromkeys(instance_ids))
+        chunks = [ids[i:i + _MAX_INSTANCE_IDS] for i in range(0, len(ids), _MAX_INSTANCE_IDS)]
+        
+        try:
+            logger.info("Getting %s EC2 instances in %s requests", len(ids), len(chunks))
             
-            instance = response['Reservations'][0]['Instances'][0]
-            logger.info(f"Successfully retrieved instance: {instance_id}")
-            return instance
+            if len(chunks) > 1:
+                results = list(self._executor.map(self._describe_instance_chunk, chunks))
+            else:
+                results = [self._describe_instance_chunk(chunk) for chunk in chunks]
+            
+            return {instance['InstanceId']: instance for instance in chain.from_iterable(results)}
             
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidInstanceID.NotFound':
-                raise ResourceNotFoundError(f"EC2 instance not found: {instance_id}")
-            logger.error(f"Error getting EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to get EC2 instance {instance_id}: {e}")
         except Exception as e:
-            logger.error(f"Error getting EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to get EC2 instance {instance_id}: {e}")
+            not_found = _NOT_FOUND_ERRORS.get(_error_code(e))
+            if not_found:
+                raise not_found(f"EC2 instance not found: {e.response['Error'].get('Message')}")
+            logger.error("Error getting EC2 instances: %s", e)
+            raise AWSResourceError(f"Failed to get EC2 instances: {e}")
     
-    def list_security_groups(self, filters: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    def _describe_instance_chunk(self, instance_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Describe up to 100 instances in one request.
+        
+        Args:
+            instance_ids: The EC2 instance IDs
+            
+        Returns:
+            List of EC2 instance dictionaries
+        """
+        response = self._describe_instances(InstanceIds=instance_ids)
+        return list(chain.from_iterable(r.get('Instances', ()) for r in response.get('Reservations', ())))
+    
+    def list_security_groups(self, filters: Optional[List[Dict[str, Any]]] = None,
+                             **filter_kwargs) -> List[Dict[str, Any]]:
         """
         List all security groups with optional filters.
         
         Args:
             filters: Optional filters to apply to the query
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                vpc_id='vpc-123', group_name='web' or tag={'Env': 'prod'}
             
         Returns:
             List of security group dictionaries
@@ -109,21 +322,32 @@ class EC2Reader:
         Raises:
             AWSResourceError: If there's an error listing security groups
         """
-        try:
-            logger.info("Listing security groups")
-            
-            kwargs = {}
-            if filters:
-                kwargs['Filters'] = filters
-            
-            response = self.ec2_client.describe_security_groups(**kwargs)
-            security_groups = response.get('SecurityGroups', [])
+        logger.info("Listing security groups")
+        security_groups = list(self.iter_security_groups(filters, **filter_kwargs))
+        logger.info("Found %s security groups", len(security_groups))
+        return security_groups
+    
+    def iter_security_groups(self, filters: Optional[List[Dict[str, Any]]] = None,
+                             **filter_kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over security groups page by page.
+        
+        Args:
+            filters: Optional filters to apply to the query
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                vpc_id='vpc-123', group_name='web' or tag={'Env': 'prod'}
             
-            logger.info(f"Found {len(security_groups)} security groups")
-            return security_groups
+        Yields:
+            Security group dictionaries
             
+        Raises:
+            AWSResourceError: If there's an error listing security groups
+        """
+        filters = _build_filters(filters, **filter_kwargs)
+        try:
+            yield from self._paginate('describe_security_groups', 'SecurityGroups', filters)
         except Exception as e:
-            logger.error(f"Error listing security groups: {e}")
+            logger.error("Error listing security groups: %s", e)
             raise AWSResourceError(f"Failed to list security groups: {e}")
     
     def get_security_group(self, group_id: str) -> Dict[str, Any]:
@@ -141,55 +365,62 @@ class EC2Reader:
             AWSResourceError: If there's an error getting the security group
         """
         try:
-            logger.info(f"Getting security group: {group_id}")
+            logger.info("Getting security group: %s", group_id)
             
-            response = self.ec2_client.describe_security_groups(GroupIds=[group_id])
+            response = self._describe_security_groups(GroupIds=[group_id])
             
             if not response.get('SecurityGroups'):
                 raise ResourceNotFoundError(f"Security group not found: {group_id}")
             
             security_group = response['SecurityGroups'][0]
-            logger.info(f"Successfully retrieved security group: {group_id}")
+            logger.info("Successfully retrieved security group: %s", group_id)
             return security_group
             
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidGroupId.NotFound':
-                raise ResourceNotFoundError(f"Security group not found: {group_id}")
-            logger.error(f"Error getting security group {group_id}: {e}")
-            raise AWSResourceError(f"Failed to get security group {group_id}: {e}")
+        except ResourceNotFoundError:
+            raise
         except Exception as e:
-            logger.error(f"Error getting security group {group_id}: {e}")
+            not_found = _NOT_FOUND_ERRORS.get(_error_code(e))
+            if not_found:
+                raise not_found(f"Security group not found: {group_id}")
+            logger.error("Error getting security group %s: %s", group_id, e)
             raise AWSResourceError(f"Failed to get security group {group_id}: {e}")
     
-    def list_key_pairs(self) -> List[Dict[str, Any]]:
+    def list_key_pairs(self, use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         List all EC2 key pairs.
         
+        Args:
+            use_cache: Whether to serve a recently cached listing
+            
         Returns:
             List of key pair dictionaries
             
         Raises:
             AWSResourceError: If there's an error listing key pairs
         """
+        def fetch():
+            return self._describe_key_pairs().get('KeyPairs', [])
+        
         try:
             logger.info("Listing EC2 key pairs")
             
-            response = self.ec2_client.describe_key_pairs()
-            key_pairs = response.get('KeyPairs', [])
+            key_pairs = self._cache.get_or_load(hashkey('list_key_pairs'), fetch, use_cache)
             
-            logger.info(f"Found {len(key_pairs)} key pairs")
+            logger.info("Found %s key pairs", len(key_pairs))
             return key_pairs
             
         except Exception as e:
-            logger.error(f"Error listing key pairs: {e}")
+            logger.error("Error listing key pairs: %s", e)
             raise AWSResourceError(f"Failed to list key pairs: {e}")
     
-    def list_vpcs(self, filters: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    def list_vpcs(self, filters: Optional[List[Dict[str, Any]]] = None,
+                  use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         List all VPCs with optional filters.
         
         Args:
             filters: Optional filters to apply to the query
+            use_cache: Whether to serve a recently cached listing
             
         Returns:
             List of VPC dictionaries
@@ -197,29 +428,41 @@ class EC2Reader:
         Raises:
             AWSResourceError: If there's an error listing VPCs
         """
-        try:
-            logger.info("Listing VPCs")
-            
-            kwargs = {}
-            if filters:
-                kwargs['Filters'] = filters
-            
-            response = self.ec2_client.describe_vpcs(**kwargs)
-            vpcs = response.get('Vpcs', [])
+        logger.info("Listing VPCs")
+        key = hashkey('list_vpcs', _canonical(filters))
+        vpcs = self._cache.get_or_load(key, lambda: list(self.iter_vpcs(filters)), use_cache)
+        logger.info("Found %s VPCs", len(vpcs))
+        return vpcs
+    
+    def iter_vpcs(self, filters: Optional[List[Dict[str, Any]]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over VPCs page by page.
+        
+        Args:
+            filters: Optional filters to apply to the query
             
-            logger.info(f"Found {len(vpcs)} VPCs")
-            return vpcs
+        Yields:
+            VPC dictionaries
             
+        Raises:
+            AWSResourceError: If there's an error listing VPCs
+        """
+        try:
+            yield from self._paginate('describe_vpcs', 'Vpcs', filters)
         except Exception as e:
-            logger.error(f"Error listing VPCs: {e}")
+            logger.error("Error listing VPCs: %s", e)
             raise AWSResourceError(f"Failed to list VPCs: {e}")
     
-    def list_subnets(self, vpc_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_subnets(self, vpc_id: Optional[str] = None, use_cache: bool = True,
+                     **filter_kwargs) -> List[Dict[str, Any]]:
         """
         List all subnets, optionally filtered by VPC.
         
         Args:
             vpc_id: Optional VPC ID to filter subnets
+            use_cache: Whether to serve a recently cached listing
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                availability_zone='us-east-1a' or tag={'Env': 'prod'}
             
         Returns:
             List of subnet dictionaries
@@ -227,30 +470,47 @@ class EC2Reader:
         Raises:
             AWSResourceError: If there's an error listing subnets
         """
-        try:
-            logger.info(f"Listing subnets{f' for VPC {vpc_id}' if vpc_id else ''}")
-            
-            kwargs = {}
-            if vpc_id:
-                kwargs['Filters'] = [{'Name': 'vpc-id', 'Values': [vpc_id]}]
-            
-            response = self.ec2_client.describe_subnets(**kwargs)
-            subnets = response.get('Subnets', [])
+        logger.info("Listing subnets for VPC %s", vpc_id or 'all')
+        key = hashkey('list_subnets', _canonical(_build_filters(vpc_id=vpc_id, **filter_kwargs)))
+        subnets = self._cache.get_or_load(
+            key, lambda: list(self.iter_subnets(vpc_id, **filter_kwargs)), use_cache
+        )
+        logger.info("Found %s subnets", len(subnets))
+        return subnets
+    
+    def iter_subnets(self, vpc_id: Optional[str] = None, **filter_kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over subnets page by page, optionally filtered by VPC.
+        
+        Args:
+            vpc_id: Optional VPC ID to filter subnets
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                availability_zone='us-east-1a' or tag={'Env': 'prod'}
             
-            logger.info(f"Found {len(subnets)} subnets")
-            return subnets
+        Yields:
+            Subnet dictionaries
             
+        Raises:
+            AWSResourceError: If there's an error listing subnets
+        """
+        filters = _build_filters(vpc_id=vpc_id, **filter_kwargs)
+        try:
+            yield from self._paginate('describe_subnets', 'Subnets', filters)
         except Exception as e:
-            logger.error(f"Error listing subnets: {e}")
+            logger.error("Error listing subnets: %s", e)
             raise AWSResourceError(f"Failed to list subnets: {e}")
     
-    def list_amis(self, owners: Optional[List[str]] = None, filters: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    def list_amis(self, owners: Optional[List[str]] = None, filters: Optional[List[Dict[str, Any]]] = None,
+                  use_cache: bool = True, **filter_kwargs) -> List[Dict[str, Any]]:
         """
         List AMIs with optional filters.
         
         Args:
             owners: Optional list of owner IDs to filter AMIs
             filters: Optional filters to apply to the query
+            use_cache: Whether to serve a recently cached listing
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                architecture='arm64', state='available' or tag={'Env': 'prod'}
             
         Returns:
             List of AMI dictionaries
@@ -258,25 +518,58 @@ class EC2Reader:
         Raises:
             AWSResourceError: If there's an error listing AMIs
         """
-        try:
-            logger.info("Listing AMIs")
-            
-            kwargs = {}
-            if owners:
-                kwargs['Owners'] = owners
-            if filters:
-                kwargs['Filters'] = filters
-            
-            response = self.ec2_client.describe_images(**kwargs)
-            amis = response.get('Images', [])
+        logger.info("Listing AMIs")
+        filters = _build_filters(filters, **filter_kwargs)
+        key = hashkey('list_amis', _canonical(owners), _canonical(filters))
+        amis = self._cache.get_or_load(key, lambda: list(self.iter_amis(owners, filters)), use_cache)
+        logger.info("Found %s AMIs", len(amis))
+        return amis
+    
+    def iter_amis(self, owners: Optional[List[str]] = None,
+                  filters: Optional[List[Dict[str, Any]]] = None, **filter_kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over AMIs page by page.
+        
+        Args:
+            owners: Optional list of owner IDs to filter AMIs
+            filters: Optional filters to apply to the query
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                architecture='arm64', state='available' or tag={'Env': 'prod'}
             
-            logger.info(f"Found {len(amis)} AMIs")
-            return amis
+        Yields:
+            AMI dictionaries
             
+        Raises:
+            AWSResourceError: If there's an error listing AMIs
+        """
+        filters = _build_filters(filters, **filter_kwargs)
+        kwargs = {'Owners': owners} if owners else {}
+        try:
+            yield from self._paginate('describe_images', 'Images', filters, **kwargs)
         except Exception as e:
-            logger.error(f"Error listing AMIs: {e}")
+            logger.error("Error listing AMIs: %s", e)
             raise AWSResourceError(f"Failed to list AMIs: {e}")
     
+    def _paginate(self, operation: str, result_key: str,
+                  filters: Optional[List[Dict[str, Any]]] = None, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Yield results from every page of a paginated describe_* call.
+        
+        Args:
+            operation: Client method name, e.g. 'describe_vpcs'
+            result_key: Response key holding the results
+            filters: Optional filters to apply to the query
+            **kwargs: Additional request parameters
+            
+        Yields:
+            Result dictionaries
+        """
+        if filters:
+            kwargs['Filters'] = filters
+        paginator = self.ec2_client.get_paginator(operation)
+        for page in paginator.paginate(PaginationConfig={'PageSize': _PAGE_SIZE}, **kwargs):
+            yield from page.get(result_key, [])
+    
     def get_instance_status(self, instance_id: str) -> Dict[str, Any]:
         """
         Get the status of a specific EC2 instance.
@@ -292,26 +585,297 @@ class EC2Reader:
             AWSResourceError: If there's an error getting the instance status
         """
         try:
-            logger.info(f"Getting status for EC2 instance: {instance_id}")
+            logger.info("Getting status for EC2 instance: %s", instance_id)
             
-            response = self.ec2_client.describe_instance_status(InstanceIds=[instance_id])
+            # IncludeAllInstances also reports stopped and pending instances
+            response = self._describe_instance_status(
+                InstanceIds=[instance_id], IncludeAllInstances=True
+            )
             
             if not response.get('InstanceStatuses'):
-                # Instance might exist but not have status data yet
-                instance = self.get_instance(instance_id)
-                return {
-                    'InstanceId': instance_id,
-                    'InstanceState': instance.get('State', {}),
-                    'SystemStatus': {'Status': 'unknown'},
-                    'InstanceStatus': {'Status': 'unknown'}
-                }
+                raise ResourceNotFoundError(f"EC2 instance not found: {instance_id}")
             
             status = response['InstanceStatuses'][0]
-            logger.info(f"Successfully retrieved status for instance: {instance_id}")
+            logger.info("Successfully retrieved status for instance: %s", instance_id)
             return status
             
         except ResourceNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Error getting instance status {instance_id}: {e}")
+            not_found = _NOT_FOUND_ERRORS.get(_error_code(e))
+            if not_found:
+                raise not_found(f"EC2 instance not found: {instance_id}")
+            logger.error("Error getting instance status %s: %s", instance_id, e)
             raise AWSResourceError(f"Failed to get instance status {instance_id}: {e}")
+    
+    def snapshot(self, owners: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch an inventory of EC2 resources with the list calls running in parallel.
+        
+        Args:
+            owners: Owner IDs for the AMI listing; defaults to ['self'] since
+                an unfiltered describe_images returns every public image
+            
+        Returns:
+            Dictionary of resource lists keyed by resource type
+            
+        Raises:
+            AWSResourceError: If any of the listings fails
+        """
+        futures = {
+            'instances': self._executor.submit(self.list_instances),
+            'security_groups': self._executor.submit(self.list_security_groups),
+            'key_pairs': self._executor.submit(self.list_key_pairs),
+            'vpcs': self._executor.submit(self.list_vpcs),
+            'subnets': self._executor.submit(self.list_subnets),
+            'amis': self._executor.submit(self.list_amis, owners=owners or ['self']),
+        }
+        wait(futures.values())
+        return {name: future.result() for name, future in futures.items()}
+    
+    async def _get_async_client(self):
+        """
+        Get or create the long-lived aioboto3 EC2 client.
+        
+        Returns:
+            aioboto3 EC2 client
+            
+        Raises:
+            ImportError: If aioboto3 is not installed
+        """
+        if aioboto3 is None:
+            raise ImportError("aioboto3 is required for async EC2 reads: pip install argus-aws[async]")
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            if self._async_client is None:
+                session = aioboto3.Session(
+                    profile_name=self.client_manager.profile_name,
+                    region_name=self.client_manager.get_current_region()
+                )
+                context = session.client('ec2', config=DEFAULT_CLIENT_CONFIG)
+                self._async_client = await context.__aenter__()
+                self._async_client_context = context
+        return self._async_client
+    
+    async def aclose(self) -> None:
+        """Close the aioboto3 EC2 client, if one was opened."""
+        if self._async_client_context is not None:
+            await self._async_client_context.__aexit__(None, None, None)
+            self._async_client_context = None
+            self._async_client = None
+    
+    async def _describe_async(self, operation: str, result_key: str, description: str,
+                              filters: Optional[List[Dict[str, Any]]] = None,
+                              **kwargs) -> List[Dict[str, Any]]:
+        """
+        Collect the results of every page of a describe_* call on the async client.
+        
+        Args:
+            operation: Client method name, e.g. 'describe_vpcs'
+            result_key: Response key holding the results
+            description: Resource description used in log and error messages
+            filters: Optional filters to apply to the query
+            **kwargs: Additional request parameters
+            
+        Returns:
+            List of result dictionaries
+            
+        Raises:
+            AWSResourceError: If the call fails
+        """
+        if filters:
+            kwargs['Filters'] = filters
+        try:
+            logger.info("Listing %s", description)
+            client = await self._get_async_client()
+            if client.can_paginate(operation):
+                results = []
+                async for page in client.get_paginator(operation).paginate(
+                        PaginationConfig={'PageSize': _PAGE_SIZE}, **kwargs):
+                    results.extend(page.get(result_key, []))
+            else:
+                response = await getattr(client, operation)(**kwargs)
+                results = response.get(result_key, [])
+            logger.info("Found %s %s", len(results), description)
+            return results
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.error("Error listing %s: %s", description, e)
+            raise AWSResourceError(f"Failed to list {description}: {e}")
+    
+    async def _cached_async(self, key: Any, loader, use_cache: bool) -> List[Dict[str, Any]]:
+        """
+        Return a listing from the cache shared with the sync methods, awaiting loader() on a miss.
+        
+        Args:
+            key: Cache key, the same one the sync method uses
+            loader: Zero-argument coroutine function that fetches the listing
+            use_cache: Whether to serve a recently cached listing
+            
+        Returns:
+            The cached or freshly loaded listing
+        """
+        if use_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        results = await loader()
+        self._cache.set(key, results)
+        return results
+    
+    async def list_instances_async(self, filters: Optional[List[Dict[str, Any]]] = None,
+                                   projection: Optional[Sequence[str]] = None,
+                                   **filter_kwargs) -> List[Dict[str, Any]]:
+        """
+        Async version of list_instances.
+        
+        Args:
+            filters: Optional filters to apply to the query
+            projection: Optional instance fields to keep, e.g. ('InstanceId', 'State')
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                availability_zone='us-east-1a' or tag={'Env': 'prod'}
+            
+        Returns:
+            List of EC2 instance dictionaries
+        """
+        filters = _build_filters(filters, _INSTANCE_FILTER_ALIASES, **filter_kwargs)
+        reservations = await self._describe_async('describe_instances', 'Reservations', 'EC2 reservations', filters)
+        instances = chain.from_iterable(r.get('Instances', ()) for r in reservations)
+        if projection:
+            return [{key: instance.get(key) for key in projection} for instance in instances]
+        return list(instances)
+    
+    async def list_security_groups_async(self, filters: Optional[List[Dict[str, Any]]] = None,
+                                         **filter_kwargs) -> List[Dict[str, Any]]:
+        """
+        Async version of list_security_groups.
+        
+        Args:
+            filters: Optional filters to apply to the query
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                vpc_id='vpc-123', group_name='web' or tag={'Env': 'prod'}
+            
+        Returns:
+            List of security group dictionaries
+        """
+        filters = _build_filters(filters, **filter_kwargs)
+        return await self._describe_async('describe_security_groups', 'SecurityGroups', 'security groups', filters)
+    
+    async def list_key_pairs_async(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Async version of list_key_pairs.
+        
+        Args:
+            use_cache: Whether to serve a recently cached listing
+            
+        Returns:
+            List of key pair dictionaries
+        """
+        return await self._cached_async(
+            hashkey('list_key_pairs'),
+            lambda: self._describe_async('describe_key_pairs', 'KeyPairs', 'key pairs'),
+            use_cache
+        )
+    
+    async def list_vpcs_async(self, filters: Optional[List[Dict[str, Any]]] = None,
+                              use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Async version of list_vpcs.
+        
+        Args:
+            filters: Optional filters to apply to the query
+            use_cache: Whether to serve a recently cached listing
+            
+        Returns:
+            List of VPC dictionaries
+        """
+        return await self._cached_async(
+            hashkey('list_vpcs', _canonical(filters)),
+            lambda: self._describe_async('describe_vpcs', 'Vpcs', 'VPCs', filters),
+            use_cache
+        )
+    
+    async def list_subnets_async(self, vpc_id: Optional[str] = None, use_cache: bool = True,
+                                 **filter_kwargs) -> List[Dict[str, Any]]:
+        """
+        Async version of list_subnets.
+        
+        Args:
+            vpc_id: Optional VPC ID to filter subnets
+            use_cache: Whether to serve a recently cached listing
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                availability_zone='us-east-1a' or tag={'Env': 'prod'}
+            
+        Returns:
+            List of subnet dictionaries
+        """
+        filters = _build_filters(vpc_id=vpc_id, **filter_kwargs)
+        return await self._cached_async(
+            hashkey('list_subnets', _canonical(filters)),
+            lambda: self._describe_async('describe_subnets', 'Subnets', 'subnets', filters),
+            use_cache
+        )
+    
+    async def list_amis_async(self, owners: Optional[List[str]] = None,
+                              filters: Optional[List[Dict[str, Any]]] = None,
+                              use_cache: bool = True, **filter_kwargs) -> List[Dict[str, Any]]:
+        """
+        Async version of list_amis.
+        
+        Args:
+            owners: Optional list of owner IDs to filter AMIs
+            filters: Optional filters to apply to the query
+            use_cache: Whether to serve a recently cached listing
+            **filter_kwargs: Filter shorthands applied server-side, e.g.
+                architecture='arm64', state='available' or tag={'Env': 'prod'}
+            
+        Returns:
+            List of AMI dictionaries
+        """
+        filters = _build_filters(filters, **filter_kwargs)
+        kwargs = {'Owners': owners} if owners else {}
+        return await self._cached_async(
+            hashkey('list_amis', _canonical(owners), _canonical(filters)),
+            lambda: self._describe_async('describe_images', 'Images', 'AMIs', filters, **kwargs),
+            use_cache
+        )
+    
+    async def snapshot_async(self, owners: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch an inventory of EC2 resources with all describe calls in flight at once.
+        
+        Args:
+            owners: Owner IDs for the AMI listing; defaults to ['self'] since
+                an unfiltered describe_images returns every public image
+            
+        Returns:
+            Dictionary of resource lists keyed by resource type
+        """
+        names = ('instances', 'security_groups', 'key_pairs', 'vpcs', 'subnets', 'amis')
+        results = await asyncio.gather(
+            self.list_instances_async(),
+            self.list_security_groups_async(),
+            self.list_key_pairs_async(),
+            self.list_vpcs_async(),
+            self.list_subnets_async(),
+            self.list_amis_async(owners=owners or ['self']),
+        )
+        return dict(zip(names, results))
+    
+    async def get_instance_async(self, instance_id: str) -> Dict[str, Any]:
+        """Async version of get_instance; runs it in a worker thread."""
+        return await run_sync(self.get_instance, instance_id)
+    
+    async def get_instances_async(self, instance_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Async version of get_instances; runs it in a worker thread."""
+        return await run_sync(self.get_instances, instance_ids)
+    
+    async def get_security_group_async(self, group_id: str) -> Dict[str, Any]:
+        """Async version of get_security_group; runs it in a worker thread."""
+        return await run_sync(self.get_security_group, group_id)
+    
+    async def get_instance_status_async(self, instance_id: str) -> Dict[str, Any]:
+        """Async version of get_instance_status; runs it in a worker thread."""
+        return await run_sync(self.get_instance_status, instance_id)
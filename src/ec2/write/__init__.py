@@ -2,6 +2,8 @@
 EC2 write operations module.
 """
 
-from .ec2_writer import EC2Writer
+from .ec2_writer import EC2Writer, InstanceLaunchResult, get_shared_writer
+from .ec2_writer_async import AsyncEC2Writer
+from .tag_batcher import TagBatcher
 
-__all__ = ['EC2Writer']
+__all__ = ['EC2Writer', 'InstanceLaunchResult', 'AsyncEC2Writer', 'TagBatcher', 'get_shared_writer']
@@ -5,16 +5,200 @@ This module provides methods to create, modify, and delete EC2 instances,
 security groups, key pairs, and other EC2 resources.
 """
 
+import functools
+import hashlib
+import inspect
+import json
 import logging
-from typing import List, Dict, Any, Optional
-from common.aws_client import AWSClientManager
-from common.exceptions import AWSResourceError, ResourceNotFoundError
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Dict, Any, Optional
+from botocore.exceptions import ClientError
+from cachetools.keys import hashkey
+
+from common.aws_client import AWSClientManager, DEFAULT_CLIENT_CONFIG
+from common.cache import ResponseCache
+from common.exceptions import AWSResourceError, ResourceNotFoundError, AWSPermissionException
 
 logger = logging.getLogger(__name__)
 
+# Most instance IDs the start/stop/reboot/terminate_instances calls accept
+_MAX_STATE_CHANGE_IDS = 1000
+
+# Most resource IDs one CreateTags or DeleteTags call accepts
+_MAX_TAG_RESOURCES = 1000
+
+# Security group name lookups are stable for minutes; keep them briefly
+_GROUP_ID_CACHE_SIZE = 1024
+_GROUP_ID_CACHE_TTL = 60
+
+# Argus exception and message template for each EC2 error code; templates
+# are formatted with the method's arguments and the AWS error message
+_ERROR_MAP = {
+    'InvalidInstanceID.NotFound': (ResourceNotFoundError, "EC2 instance not found: {message}"),
+    'InvalidGroupId.NotFound': (ResourceNotFoundError, "Security group not found: {group_id}"),
+    'InvalidGroup.NotFound': (ResourceNotFoundError, "Security group not found: {group_id}"),
+    'InvalidKeyPair.NotFound': (ResourceNotFoundError, "Key pair not found: {key_name}"),
+    'UnauthorizedOperation': (AWSPermissionException, None),
+}
+
+# IpPermissions source lists and the field identifying each source
+_RULE_SOURCES = {
+    'IpRanges': 'CidrIp',
+    'Ipv6Ranges': 'CidrIpv6',
+    'PrefixListIds': 'PrefixListId',
+    'UserIdGroupPairs': 'GroupId',
+}
+
+
+@dataclass
+class InstanceLaunchResult:
+    """
+    The parts of a run_instances response most callers need.
+    
+    Attributes:
+        instance_ids: IDs of the launched instances
+        reservation_id: ID of the reservation holding them
+        raw: The full run_instances response, when requested with return_raw=True
+    """
+    instance_ids: List[str]
+    reservation_id: str
+    raw: Optional[Dict[str, Any]] = None
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most size items."""
+    iterator = iter(items)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def aws_call(action: str) -> Callable:
+    """
+    Map a writer method's failures to Argus exceptions through _ERROR_MAP.
+    
+    Args:
+        action: What the method does, formatted with its arguments for the error
+            message, e.g. 'delete key pair {key_name}'
+        
+    Returns:
+        Decorator for EC2Writer methods
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        
+        def describe(args, kwargs) -> Dict[str, Any]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return bound.arguments
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except (AWSResourceError, ValueError):
+                raise
+            except ClientError as e:
+                error = e.response.get('Error', {})
+                exc_class, template = _ERROR_MAP.get(error.get('Code'), (AWSResourceError, None))
+                arguments = describe(args, kwargs)
+                try:
+                    message = template.format(message=error.get('Message'), **arguments) if template else None
+                except KeyError:
+                    message = None
+                message = message or f"Failed to {action.format(**arguments)}: {e}"
+                cause = e
+            except Exception as e:
+                exc_class = AWSResourceError
+                message = f"Failed to {action.format(**describe(args, kwargs))}: {e}"
+                cause = e
+            logger.error("%s", message)
+            raise exc_class(message) from cause
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def _operation_params(service_model: Any, operation_name: str) -> FrozenSet[str]:
+    """Return the request parameter names of an operation, read once from the service model."""
+    return frozenset(service_model.operation_model(operation_name).input_shape.members)
+
+
+def _rule_atoms(ip_permissions: List[Dict[str, Any]]) -> Dict[tuple, Dict[str, Any]]:
+    """
+    Split IpPermissions into single-source rules.
+    
+    Returns:
+        Source dictionaries keyed by (protocol, from port, to port, source list, source ID)
+    """
+    atoms = {}
+    for permission in ip_permissions:
+        rule = (str(permission.get('IpProtocol')), permission.get('FromPort'), permission.get('ToPort'))
+        for list_key, id_key in _RULE_SOURCES.items():
+            for source in permission.get(list_key, ()):
+                atoms[rule + (list_key, source.get(id_key))] = source
+    return atoms
+
+
+def _permissions(atoms: Dict[tuple, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Regroup single-source rules into IpPermissions, one entry per protocol and port range."""
+    grouped = {}
+    for (protocol, from_port, to_port, list_key, _), source in atoms.items():
+        permission = grouped.get((protocol, from_port, to_port))
+        if permission is None:
+            permission = grouped[(protocol, from_port, to_port)] = {'IpProtocol': protocol}
+            if from_port is not None:
+                permission.update(FromPort=from_port, ToPort=to_port)
+        permission.setdefault(list_key, []).append(source)
+    return list(grouped.values())
+
+
+def _launch_params(image_id: str, instance_type: str, key_name: Optional[str],
+                   security_group_ids: Optional[List[str]], subnet_id: Optional[str],
+                   user_data: Optional[str], min_count: int, max_count: int,
+                   idempotent: bool = False, **kwargs) -> Dict[str, Any]:
+    """
+    Build the run_instances request for create_instance in a single dict display.
+    
+    With idempotent set and no ClientToken given, the request gets a
+    ClientToken derived from its parameters, so repeating an identical launch
+    (for example after a timeout) returns the original instances instead of
+    launching more. Without one, botocore generates a random token per call,
+    which its own retries reuse.
+    """
+    optional = (
+        ('KeyName', key_name),
+        ('SecurityGroupIds', security_group_ids),
+        ('SubnetId', subnet_id),
+        ('UserData', user_data),
+    )
+    launch_params = {
+        'ImageId': image_id,
+        'MinCount': min_count,
+        'MaxCount': max_count,
+        'InstanceType': instance_type,
+        **{key: value for key, value in optional if value},
+        # Additional parameters override the ones above
+        **kwargs,
+    }
+    if idempotent and 'ClientToken' not in launch_params:
+        launch_params['ClientToken'] = hashlib.sha1(
+            json.dumps(launch_params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+    return launch_params
+
 
 class EC2Writer:
-    """EC2 write operations using boto3."""
+    """
+    EC2 write operations using boto3.
+    
+    Instances are thread-safe; create one and share it. The boto3 client and
+    the lookup cache can be used from many threads at once, see
+    get_shared_writer.
+    """
     
     def __init__(self, client_manager: AWSClientManager):
         """
@@ -24,13 +208,55 @@ class EC2Writer:
             client_manager: AWSClientManager instance for AWS service clients
         """
         self.client_manager = client_manager
-        self.ec2_client = client_manager.get_client('ec2')
+        self.ec2_client = client_manager.get_client('ec2', config=DEFAULT_CLIENT_CONFIG)
+        self._group_ids = ResponseCache(maxsize=_GROUP_ID_CACHE_SIZE, ttl=_GROUP_ID_CACHE_TTL)
         logger.info("EC2Writer initialized successfully")
     
+    def invalidate(self, resource_id: str) -> None:
+        """
+        Drop cached lookups that mention a resource.
+        
+        Args:
+            resource_id: A security group ID or name
+        """
+        self._group_ids.discard(lambda key, group_id: group_id == resource_id or resource_id in key)
+    
+    def _resolve_group_id(self, group_name: str, vpc_id: Optional[str] = None) -> str:
+        """
+        Look up a security group ID by name, caching the answer for a minute.
+        
+        Args:
+            group_name: The security group name
+            vpc_id: VPC to search in, for names that are only unique per VPC
+            
+        Returns:
+            The security group ID
+            
+        Raises:
+            ResourceNotFoundError: If no security group has that name
+        """
+        def load():
+            filters = [{'Name': 'group-name', 'Values': [group_name]}]
+            if vpc_id:
+                filters.append({'Name': 'vpc-id', 'Values': [vpc_id]})
+            groups = self.ec2_client.describe_security_groups(Filters=filters)['SecurityGroups']
+            if not groups:
+                raise ResourceNotFoundError(f"Security group not found: {group_name}")
+            return groups[0]['GroupId']
+        
+        return self._group_ids.get_or_load(hashkey(group_name, vpc_id), load)
+    
+    def _group_id(self, group: str, vpc_id: Optional[str] = None) -> str:
+        """Return group unchanged if it is a security group ID, otherwise resolve it as a name."""
+        return group if group.startswith('sg-') else self._resolve_group_id(group, vpc_id)
+    
+    @aws_call('launch EC2 instances')
     def create_instance(self, image_id: str, instance_type: str = 't2.micro', 
                        key_name: Optional[str] = None, security_group_ids: Optional[List[str]] = None,
                        subnet_id: Optional[str] = None, user_data: Optional[str] = None,
-                       min_count: int = 1, max_count: int = 1, **kwargs) -> Dict[str, Any]:
+                       min_count: int = 1, max_count: int = 1, wait: bool = False,
+                       idempotent: bool = False, return_raw: bool = False,
+                       **kwargs) -> InstanceLaunchResult:
         """
         Launch new EC2 instances.
         
@@ -43,46 +269,90 @@ class EC2Writer:
             user_data: User data script for instance initialization
             min_count: Minimum number of instances to launch
             max_count: Maximum number of instances to launch
+            wait: Block until the instances are running, via wait_for_running
+            idempotent: Derive a ClientToken from the request so an identical
+                repeat launch returns the same instances instead of launching
+                more; botocore's retries of a single call never duplicate a launch
+            return_raw: Keep the full run_instances response on the result's raw field
             **kwargs: Additional parameters for run_instances
             
         Returns:
-            Dictionary containing instance launch details
+            InstanceLaunchResult with the launched instance IDs and reservation ID
             
         Raises:
+            ValueError: If kwargs holds a parameter run_instances doesn't accept
             AWSResourceError: If there's an error launching instances
         """
-        try:
-            logger.info(f"Launching {min_count}-{max_count} EC2 instances")
-            
-            launch_params = {
-                'ImageId': image_id,
-                'MinCount': min_count,
-                'MaxCount': max_count,
-                'InstanceType': instance_type
-            }
-            
-            if key_name:
-                launch_params['KeyName'] = key_name
-            if security_group_ids:
-                launch_params['SecurityGroupIds'] = security_group_ids
-            if subnet_id:
-                launch_params['SubnetId'] = subnet_id
-            if user_data:
-                launch_params['UserData'] = user_data
-            
-            # Add any additional parameters
-            launch_params.update(kwargs)
-            
-            response = self.ec2_client.run_instances(**launch_params)
+        unknown = kwargs.keys() - _operation_params(self.ec2_client.meta.service_model, 'RunInstances')
+        if unknown:
+            raise ValueError(f"Unknown run_instances parameters: {', '.join(sorted(unknown))}")
+        
+        logger.info("Launching %s-%s EC2 instances", min_count, max_count)
+        
+        launch_params = _launch_params(image_id, instance_type, key_name, security_group_ids,
+                                       subnet_id, user_data, min_count, max_count, idempotent, **kwargs)
+        
+        response = self.ec2_client.run_instances(**launch_params)
+        
+        instance_ids = [instance['InstanceId'] for instance in response['Instances']]
+        logger.info("Successfully launched instances: %s", instance_ids)
+        
+        if wait:
+            self.wait_for_running(instance_ids)
+        return InstanceLaunchResult(instance_ids, response['ReservationId'],
+                                    response if return_raw else None)
+    
+    def wait_for_running(self, instance_ids: List[str], delay: int = 5, max_attempts: int = 40) -> None:
+        """
+        Wait until EC2 instances are running, using the instance_running waiter.
+        
+        Args:
+            instance_ids: The EC2 instance IDs to wait for
+            delay: Seconds between DescribeInstances checks
+            max_attempts: Checks to make before giving up
             
-            instance_ids = [instance['InstanceId'] for instance in response['Instances']]
-            logger.info(f"Successfully launched instances: {instance_ids}")
+        Raises:
+            AWSResourceError: If the instances don't reach the state in time
+        """
+        self._wait('instance_running', instance_ids, delay, max_attempts)
+    
+    def wait_for_stopped(self, instance_ids: List[str], delay: int = 5, max_attempts: int = 40) -> None:
+        """
+        Wait until EC2 instances are stopped, using the instance_stopped waiter.
+        
+        Args:
+            instance_ids: The EC2 instance IDs to wait for
+            delay: Seconds between DescribeInstances checks
+            max_attempts: Checks to make before giving up
             
-            return response
+        Raises:
+            AWSResourceError: If the instances don't reach the state in time
+        """
+        self._wait('instance_stopped', instance_ids, delay, max_attempts)
+    
+    def wait_for_terminated(self, instance_ids: List[str], delay: int = 5, max_attempts: int = 40) -> None:
+        """
+        Wait until EC2 instances are terminated, using the instance_terminated waiter.
+        
+        Args:
+            instance_ids: The EC2 instance IDs to wait for
+            delay: Seconds between DescribeInstances checks
+            max_attempts: Checks to make before giving up
             
-        except Exception as e:
-            logger.error(f"Error launching EC2 instances: {e}")
-            raise AWSResourceError(f"Failed to launch EC2 instances: {e}")
+        Raises:
+            AWSResourceError: If the instances don't reach the state in time
+        """
+        self._wait('instance_terminated', instance_ids, delay, max_attempts)
+    
+    @aws_call('wait for {waiter_name} on EC2 instances {instance_ids}')
+    def _wait(self, waiter_name: str, instance_ids: List[str], delay: int, max_attempts: int) -> None:
+        """Run a boto3 instance waiter with the given polling config."""
+        ids = list(instance_ids)
+        logger.info("Waiting for %s on %s EC2 instances", waiter_name, len(ids))
+        self.ec2_client.get_waiter(waiter_name).wait(
+            InstanceIds=ids,
+            WaiterConfig={'Delay': delay, 'MaxAttempts': max_attempts}
+        )
     
     def terminate_instance(self, instance_id: str) -> Dict[str, Any]:
         """
@@ -98,22 +368,23 @@ class EC2Writer:
             ResourceNotFoundError: If the instance is not found
             AWSResourceError: If there's an error terminating the instance
         """
-        try:
-            logger.info(f"Terminating EC2 instance: {instance_id}")
-            
-            response = self.ec2_client.terminate_instances(InstanceIds=[instance_id])
+        return self.terminate_instances([instance_id])
+    
+    def terminate_instances(self, instance_ids: List[str]) -> Dict[str, Any]:
+        """
+        Terminate EC2 instances, 1000 per API call.
+        
+        Args:
+            instance_ids: The EC2 instance IDs to terminate
             
-            logger.info(f"Successfully initiated termination for instance: {instance_id}")
-            return response
+        Returns:
+            Dictionary containing termination details for all instances
             
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidInstanceID.NotFound':
-                raise ResourceNotFoundError(f"EC2 instance not found: {instance_id}")
-            logger.error(f"Error terminating EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to terminate EC2 instance {instance_id}: {e}")
-        except Exception as e:
-            logger.error(f"Error terminating EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to terminate EC2 instance {instance_id}: {e}")
+        Raises:
+            ResourceNotFoundError: If an instance is not found
+            AWSResourceError: If there's an error terminating the instances
+        """
+        return self._change_instance_state('terminate', 'TerminatingInstances', instance_ids)
     
     def start_instance(self, instance_id: str) -> Dict[str, Any]:
         """
@@ -129,22 +400,23 @@ class EC2Writer:
             ResourceNotFoundError: If the instance is not found
             AWSResourceError: If there's an error starting the instance
         """
-        try:
-            logger.info(f"Starting EC2 instance: {instance_id}")
-            
-            response = self.ec2_client.start_instances(InstanceIds=[instance_id])
+        return self.start_instances([instance_id])
+    
+    def start_instances(self, instance_ids: List[str]) -> Dict[str, Any]:
+        """
+        Start stopped EC2 instances, 1000 per API call.
+        
+        Args:
+            instance_ids: The EC2 instance IDs to start
             
-            logger.info(f"Successfully initiated start for instance: {instance_id}")
-            return response
+        Returns:
+            Dictionary containing start operation details for all instances
             
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidInstanceID.NotFound':
-                raise ResourceNotFoundError(f"EC2 instance not found: {instance_id}")
-            logger.error(f"Error starting EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to start EC2 instance {instance_id}: {e}")
-        except Exception as e:
-            logger.error(f"Error starting EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to start EC2 instance {instance_id}: {e}")
+        Raises:
+            ResourceNotFoundError: If an instance is not found
+            AWSResourceError: If there's an error starting the instances
+        """
+        return self._change_instance_state('start', 'StartingInstances', instance_ids)
     
     def stop_instance(self, instance_id: str, force: bool = False) -> Dict[str, Any]:
         """
@@ -161,25 +433,24 @@ class EC2Writer:
             ResourceNotFoundError: If the instance is not found
             AWSResourceError: If there's an error stopping the instance
         """
-        try:
-            logger.info(f"Stopping EC2 instance: {instance_id}")
-            
-            response = self.ec2_client.stop_instances(
-                InstanceIds=[instance_id],
-                Force=force
-            )
+        return self.stop_instances([instance_id], force=force)
+    
+    def stop_instances(self, instance_ids: List[str], force: bool = False) -> Dict[str, Any]:
+        """
+        Stop running EC2 instances, 1000 per API call.
+        
+        Args:
+            instance_ids: The EC2 instance IDs to stop
+            force: Whether to force stop the instances
             
-            logger.info(f"Successfully initiated stop for instance: {instance_id}")
-            return response
+        Returns:
+            Dictionary containing stop operation details for all instances
             
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidInstanceID.NotFound':
-                raise ResourceNotFoundError(f"EC2 instance not found: {instance_id}")
-            logger.error(f"Error stopping EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to stop EC2 instance {instance_id}: {e}")
-        except Exception as e:
-            logger.error(f"Error stopping EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to stop EC2 instance {instance_id}: {e}")
+        Raises:
+            ResourceNotFoundError: If an instance is not found
+            AWSResourceError: If there's an error stopping the instances
+        """
+        return self._change_instance_state('stop', 'StoppingInstances', instance_ids, Force=force)
     
     def reboot_instance(self, instance_id: str) -> Dict[str, Any]:
         """
@@ -195,23 +466,61 @@ class EC2Writer:
             ResourceNotFoundError: If the instance is not found
             AWSResourceError: If there's an error rebooting the instance
         """
-        try:
-            logger.info(f"Rebooting EC2 instance: {instance_id}")
+        return self.reboot_instances([instance_id])
+    
+    def reboot_instances(self, instance_ids: List[str]) -> Dict[str, Any]:
+        """
+        Reboot EC2 instances, 1000 per API call.
+        
+        Args:
+            instance_ids: The EC2 instance IDs to reboot
+            
+        Returns:
+            Dictionary containing reboot operation details
             
-            response = self.ec2_client.reboot_instances(InstanceIds=[instance_id])
+        Raises:
+            ResourceNotFoundError: If an instance is not found
+            AWSResourceError: If there's an error rebooting the instances
+        """
+        return self._change_instance_state('reboot', None, instance_ids)
+    
+    @aws_call('{action} EC2 instances')
+    def _change_instance_state(self, action: str, result_key: Optional[str],
+                               instance_ids: List[str], **params) -> Dict[str, Any]:
+        """
+        Call {action}_instances for the given IDs in chunks of 1000.
+        
+        Args:
+            action: 'terminate', 'start', 'stop' or 'reboot'
+            result_key: Response key listing the state changes, merged across chunks
+            instance_ids: The EC2 instance IDs
+            **params: Additional request parameters
             
-            logger.info(f"Successfully initiated reboot for instance: {instance_id}")
-            return response
+        Returns:
+            Response of the first call, with the state changes of every call
             
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidInstanceID.NotFound':
-                raise ResourceNotFoundError(f"EC2 instance not found: {instance_id}")
-            logger.error(f"Error rebooting EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to reboot EC2 instance {instance_id}: {e}")
-        except Exception as e:
-            logger.error(f"Error rebooting EC2 instance {instance_id}: {e}")
-            raise AWSResourceError(f"Failed to reboot EC2 instance {instance_id}: {e}")
+        Raises:
+            ResourceNotFoundError: If an instance is not found
+            AWSResourceError: If the call fails
+        """
+        ids = list(instance_ids)
+        target = f"EC2 instance {ids[0]}" if len(ids) == 1 else f"{len(ids)} EC2 instances"
+        operation = getattr(self.ec2_client, f"{action}_instances")
+        response = {}
+        
+        logger.info("Calling %s_instances for %s", action, target)
+        
+        for chunk in _chunks(ids, _MAX_STATE_CHANGE_IDS):
+            chunk_response = operation(InstanceIds=chunk, **params)
+            if not response:
+                response = chunk_response
+            elif result_key:
+                response[result_key].extend(chunk_response.get(result_key, []))
+        
+        logger.info("Successfully initiated %s for %s", action, target)
+        return response
     
+    @aws_call('create security group {group_name}')
     def create_security_group(self, group_name: str, description: str, 
                              vpc_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -228,32 +537,30 @@ class EC2Writer:
         Raises:
             AWSResourceError: If there's an error creating the security group
         """
-        try:
-            logger.info(f"Creating security group: {group_name}")
-            
-            params = {
-                'GroupName': group_name,
-                'Description': description
-            }
-            
-            if vpc_id:
-                params['VpcId'] = vpc_id
-            
-            response = self.ec2_client.create_security_group(**params)
-            
-            logger.info(f"Successfully created security group: {response['GroupId']}")
-            return response
-            
-        except Exception as e:
-            logger.error(f"Error creating security group {group_name}: {e}")
-            raise AWSResourceError(f"Failed to create security group {group_name}: {e}")
+        logger.info("Creating security group: %s", group_name)
+        
+        params = {
+            'GroupName': group_name,
+            'Description': description
+        }
+        
+        if vpc_id:
+            params['VpcId'] = vpc_id
+        
+        response = self.ec2_client.create_security_group(**params)
+        self.invalidate(group_name)
+        
+        logger.info("Successfully created security group: %s", response['GroupId'])
+        return response
     
-    def delete_security_group(self, group_id: str) -> Dict[str, Any]:
+    @aws_call('delete security group {group_id}')
+    def delete_security_group(self, group_id: str, vpc_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Delete a security group.
         
         Args:
-            group_id: The security group ID to delete
+            group_id: The security group ID to delete, or its name
+            vpc_id: VPC to look the name up in
             
         Returns:
             Dictionary containing deletion details
@@ -262,30 +569,25 @@ class EC2Writer:
             ResourceNotFoundError: If the security group is not found
             AWSResourceError: If there's an error deleting the security group
         """
-        try:
-            logger.info(f"Deleting security group: {group_id}")
-            
-            response = self.ec2_client.delete_security_group(GroupId=group_id)
-            
-            logger.info(f"Successfully deleted security group: {group_id}")
-            return response
-            
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidGroupId.NotFound':
-                raise ResourceNotFoundError(f"Security group not found: {group_id}")
-            logger.error(f"Error deleting security group {group_id}: {e}")
-            raise AWSResourceError(f"Failed to delete security group {group_id}: {e}")
-        except Exception as e:
-            logger.error(f"Error deleting security group {group_id}: {e}")
-            raise AWSResourceError(f"Failed to delete security group {group_id}: {e}")
+        group_id = self._group_id(group_id, vpc_id)
+        logger.info("Deleting security group: %s", group_id)
+        
+        response = self.ec2_client.delete_security_group(GroupId=group_id)
+        self.invalidate(group_id)
+        
+        logger.info("Successfully deleted security group: %s", group_id)
+        return response
     
-    def authorize_security_group_ingress(self, group_id: str, ip_permissions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @aws_call('add inbound rules to security group {group_id}')
+    def authorize_security_group_ingress(self, group_id: str, ip_permissions: List[Dict[str, Any]],
+                                         vpc_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Add inbound rules to a security group.
         
         Args:
-            group_id: The security group ID
+            group_id: The security group ID, or its name
             ip_permissions: List of inbound rule specifications
+            vpc_id: VPC to look the name up in
             
         Returns:
             Dictionary containing authorization details
@@ -294,33 +596,27 @@ class EC2Writer:
             ResourceNotFoundError: If the security group is not found
             AWSResourceError: If there's an error adding the rules
         """
-        try:
-            logger.info(f"Adding inbound rules to security group: {group_id}")
-            
-            response = self.ec2_client.authorize_security_group_ingress(
-                GroupId=group_id,
-                IpPermissions=ip_permissions
-            )
-            
-            logger.info(f"Successfully added inbound rules to security group: {group_id}")
-            return response
-            
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidGroupId.NotFound':
-                raise ResourceNotFoundError(f"Security group not found: {group_id}")
-            logger.error(f"Error adding inbound rules to security group {group_id}: {e}")
-            raise AWSResourceError(f"Failed to add inbound rules to security group {group_id}: {e}")
-        except Exception as e:
-            logger.error(f"Error adding inbound rules to security group {group_id}: {e}")
-            raise AWSResourceError(f"Failed to add inbound rules to security group {group_id}: {e}")
+        group_id = self._group_id(group_id, vpc_id)
+        logger.info("Adding inbound rules to security group: %s", group_id)
+        
+        response = self.ec2_client.authorize_security_group_ingress(
+            GroupId=group_id,
+            IpPermissions=ip_permissions
+        )
+        
+        logger.info("Successfully added inbound rules to security group: %s", group_id)
+        return response
     
-    def revoke_security_group_ingress(self, group_id: str, ip_permissions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @aws_call('remove inbound rules from security group {group_id}')
+    def revoke_security_group_ingress(self, group_id: str, ip_permissions: List[Dict[str, Any]],
+                                      vpc_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Remove inbound rules from a security group.
         
         Args:
-            group_id: The security group ID
+            group_id: The security group ID, or its name
             ip_permissions: List of inbound rule specifications to remove
+            vpc_id: VPC to look the name up in
             
         Returns:
             Dictionary containing revocation details
@@ -329,26 +625,71 @@ class EC2Writer:
             ResourceNotFoundError: If the security group is not found
             AWSResourceError: If there's an error removing the rules
         """
-        try:
-            logger.info(f"Removing inbound rules from security group: {group_id}")
-            
-            response = self.ec2_client.revoke_security_group_ingress(
-                GroupId=group_id,
-                IpPermissions=ip_permissions
-            )
+        group_id = self._group_id(group_id, vpc_id)
+        logger.info("Removing inbound rules from security group: %s", group_id)
+        
+        response = self.ec2_client.revoke_security_group_ingress(
+            GroupId=group_id,
+            IpPermissions=ip_permissions
+        )
+        
+        logger.info("Successfully removed inbound rules from security group: %s", group_id)
+        return response
+    
+    @aws_call('reconcile inbound rules of security group {group_id}')
+    def reconcile_security_group_ingress(self, group_id: str, desired: List[Dict[str, Any]],
+                                         vpc_id: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Make a security group's inbound rules match a desired rule set.
+        
+        The live rules are read once and diffed against the desired ones in
+        process; the missing rules are then authorized while the extra rules
+        are revoked, with both calls in flight at once. Rule descriptions are
+        not compared.
+        
+        Args:
+            group_id: The security group ID, or its name
+            desired: The complete list of inbound rule specifications
+            vpc_id: VPC to look the name up in
             
-            logger.info(f"Successfully removed inbound rules from security group: {group_id}")
-            return response
+        Returns:
+            Dictionary with the 'Authorized' and 'Revoked' rule specifications
             
-        except self.ec2_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'InvalidGroupId.NotFound':
-                raise ResourceNotFoundError(f"Security group not found: {group_id}")
-            logger.error(f"Error removing inbound rules from security group {group_id}: {e}")
-            raise AWSResourceError(f"Failed to remove inbound rules from security group {group_id}: {e}")
-        except Exception as e:
-            logger.error(f"Error removing inbound rules from security group {group_id}: {e}")
-            raise AWSResourceError(f"Failed to remove inbound rules from security group {group_id}: {e}")
+        Raises:
+            ResourceNotFoundError: If the security group is not found
+            AWSResourceError: If there's an error reading or changing the rules
+        """
+        group_id = self._group_id(group_id, vpc_id)
+        logger.info("Reconciling inbound rules of security group: %s", group_id)
+        
+        group = self.ec2_client.describe_security_groups(GroupIds=[group_id])['SecurityGroups'][0]
+        current = _rule_atoms(group.get('IpPermissions', []))
+        wanted = _rule_atoms(desired)
+        current_keys, wanted_keys = frozenset(current), frozenset(wanted)
+        to_add = _permissions({key: wanted[key] for key in wanted_keys - current_keys})
+        # Revoke by source ID only, so live descriptions don't have to match
+        to_remove = _permissions({key: {_RULE_SOURCES[key[3]]: key[4]}
+                                  for key in current_keys - wanted_keys})
+        
+        calls = []
+        if to_add:
+            calls.append((self.authorize_security_group_ingress, to_add))
+        if to_remove:
+            calls.append((self.revoke_security_group_ingress, to_remove))
+        if len(calls) == 2:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [pool.submit(call, group_id, rules) for call, rules in calls]
+                for future in futures:
+                    future.result()
+        else:
+            for call, rules in calls:
+                call(group_id, rules)
+        
+        logger.info("Reconciled security group %s: %s rules added, %s removed",
+                    group_id, len(wanted_keys - current_keys), len(current_keys - wanted_keys))
+        return {'Authorized': to_add, 'Revoked': to_remove}
     
+    @aws_call('create key pair {key_name}')
     def create_key_pair(self, key_name: str) -> Dict[str, Any]:
         """
         Create a new EC2 key pair.
@@ -362,18 +703,14 @@ class EC2Writer:
         Raises:
             AWSResourceError: If there's an error creating the key pair
         """
-        try:
-            logger.info(f"Creating key pair: {key_name}")
-            
-            response = self.ec2_client.create_key_pair(KeyName=key_name)
-            
-            logger.info(f"Successfully created key pair: {key_name}")
-            return response
-            
-        except Exception as e:
-            logger.error(f"Error creating key pair {key_name}: {e}")
-            raise AWSResourceError(f"Failed to create key pair {key_name}: {e}")
+        logger.info("Creating key pair: %s", key_name)
+        
+        response = self.ec2_client.create_key_pair(KeyName=key_name)
+        
+        logger.info("Successfully created key pair: %s", key_name)
+        return response
     
+    @aws_call('delete key pair {key_name}')
     def delete_key_pair(self, key_name: str) -> Dict[str, Any]:
         """
         Delete an EC2 key pair.
@@ -387,72 +724,80 @@ class EC2Writer:
         Raises:
             AWSResourceError: If there's an error deleting the key pair
         """
-        try:
-            logger.info(f"Deleting key pair: {key_name}")
-            
-            response = self.ec2_client.delete_key_pair(KeyName=key_name)
-            
-            logger.info(f"Successfully deleted key pair: {key_name}")
-            return response
-            
-        except Exception as e:
-            logger.error(f"Error deleting key pair {key_name}: {e}")
-            raise AWSResourceError(f"Failed to delete key pair {key_name}: {e}")
+        logger.info("Deleting key pair: %s", key_name)
+        
+        response = self.ec2_client.delete_key_pair(KeyName=key_name)
+        
+        logger.info("Successfully deleted key pair: %s", key_name)
+        return response
     
-    def create_tags(self, resource_ids: List[str], tags: List[Dict[str, str]]) -> Dict[str, Any]:
+    def create_tags(self, resource_ids: Iterable[str], tags: List[Dict[str, str]],
+                    chunk_size: int = _MAX_TAG_RESOURCES) -> Dict[str, Any]:
         """
         Create or overwrite tags for EC2 resources.
         
+        Resource IDs are read lazily and sent chunk_size at a time, so a
+        generator of IDs is never held in memory all at once.
+        
         Args:
-            resource_ids: List of resource IDs to tag
+            resource_ids: Resource IDs to tag
             tags: List of tag dictionaries with 'Key' and 'Value' keys
+            chunk_size: Resource IDs per CreateTags call (AWS allows up to 1000)
             
         Returns:
-            Dictionary containing tagging operation details
+            Dictionary containing the details of the last tagging call
             
         Raises:
             AWSResourceError: If there's an error creating tags
         """
-        try:
-            logger.info(f"Creating tags for resources: {resource_ids}")
-            
-            response = self.ec2_client.create_tags(
-                Resources=resource_ids,
-                Tags=tags
-            )
-            
-            logger.info(f"Successfully created tags for resources: {resource_ids}")
-            return response
-            
-        except Exception as e:
-            logger.error(f"Error creating tags for resources {resource_ids}: {e}")
-            raise AWSResourceError(f"Failed to create tags for resources {resource_ids}: {e}")
+        return self._tag_resources('create_tags', resource_ids, tags, chunk_size)
     
-    def delete_tags(self, resource_ids: List[str], tags: List[Dict[str, str]]) -> Dict[str, Any]:
+    def delete_tags(self, resource_ids: Iterable[str], tags: List[Dict[str, str]],
+                    chunk_size: int = _MAX_TAG_RESOURCES) -> Dict[str, Any]:
         """
         Delete tags from EC2 resources.
         
+        Resource IDs are read lazily and sent chunk_size at a time, so a
+        generator of IDs is never held in memory all at once.
+        
         Args:
-            resource_ids: List of resource IDs to remove tags from
+            resource_ids: Resource IDs to remove tags from
             tags: List of tag dictionaries with 'Key' and optionally 'Value' keys
+            chunk_size: Resource IDs per DeleteTags call (AWS allows up to 1000)
             
         Returns:
-            Dictionary containing tag deletion details
+            Dictionary containing the details of the last tag deletion call
             
         Raises:
             AWSResourceError: If there's an error deleting tags
         """
-        try:
-            logger.info(f"Deleting tags from resources: {resource_ids}")
-            
-            response = self.ec2_client.delete_tags(
-                Resources=resource_ids,
-                Tags=tags
-            )
-            
-            logger.info(f"Successfully deleted tags from resources: {resource_ids}")
-            return response
-            
-        except Exception as e:
-            logger.error(f"Error deleting tags from resources {resource_ids}: {e}")
-            raise AWSResourceError(f"Failed to delete tags from resources {resource_ids}: {e}")
+        return self._tag_resources('delete_tags', resource_ids, tags, chunk_size)
+    
+    @aws_call('call {operation} for EC2 resources')
+    def _tag_resources(self, operation: str, resource_ids: Iterable[str],
+                       tags: List[Dict[str, str]], chunk_size: int) -> Dict[str, Any]:
+        """Call create_tags or delete_tags for each chunk of resource IDs."""
+        call = getattr(self.ec2_client, operation)
+        response = {}
+        count = 0
+        for chunk in _chunks(resource_ids, chunk_size):
+            logger.debug("Calling %s for resources: %s", operation, chunk)
+            response = call(Resources=chunk, Tags=tags)
+            count += len(chunk)
+        
+        logger.info("Successfully called %s for %s resources", operation, count)
+        return response
+
+
+@functools.lru_cache(maxsize=8)
+def get_shared_writer(client_manager: AWSClientManager) -> EC2Writer:
+    """
+    Return the EC2Writer shared by every caller using the same client manager.
+    
+    Args:
+        client_manager: AWSClientManager instance for AWS service clients
+        
+    Returns:
+        EC2Writer memoized per client manager, for up to 8 managers
+    """
+    return EC2Writer(client_manager)
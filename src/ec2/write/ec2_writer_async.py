@@ -0,0 +1,301 @@
+"""
+Async EC2 Writer - Awaitable write operations for Amazon EC2 resources.
+
+AsyncEC2Writer mirrors the public methods of EC2Writer as coroutines so that
+many writes can be awaited together with asyncio.gather. Requests go through
+a long-lived aioboto3 client when the async extra is installed; without
+aioboto3 they fall back to EC2Writer's boto3 client run in worker threads.
+"""
+
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+from botocore.exceptions import ClientError
+
+from common.aws_client import AWSClientManager, DEFAULT_CLIENT_CONFIG
+from common.threads import run_sync
+from common.exceptions import AWSResourceError
+from .ec2_writer import (EC2Writer, InstanceLaunchResult, _ERROR_MAP, _MAX_STATE_CHANGE_IDS,
+                         _MAX_TAG_RESOURCES, _chunks, _launch_params)
+
+try:
+    import aioboto3
+except ImportError:  # optional: pip install argus-aws[async]
+    aioboto3 = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEC2Writer:
+    """Async EC2 write operations using aioboto3, or EC2Writer in worker threads."""
+    
+    def __init__(self, client_manager: AWSClientManager):
+        """
+        Initialize AsyncEC2Writer.
+        
+        Args:
+            client_manager: AWSClientManager instance for AWS service clients
+        """
+        self.client_manager = client_manager
+        self._client_context = None
+        self._client = None
+        self._lock = None
+        self._sync_writer = None
+        logger.info("AsyncEC2Writer initialized successfully")
+    
+    async def __aenter__(self) -> 'AsyncEC2Writer':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    async def _get_client(self):
+        """
+        Get or create the long-lived aioboto3 EC2 client.
+        
+        Returns:
+            aioboto3 EC2 client
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._client is None:
+                session = aioboto3.Session(
+                    profile_name=self.client_manager.profile_name,
+                    region_name=self.client_manager.get_current_region()
+                )
+                context = session.client('ec2', config=DEFAULT_CLIENT_CONFIG)
+                self._client = await context.__aenter__()
+                self._client_context = context
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the aioboto3 EC2 client, if one was opened."""
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+            self._client_context = None
+            self._client = None
+    
+    async def _call(self, operation: str, description: str,
+                    arguments: Optional[Dict[str, Any]] = None, **params) -> Dict[str, Any]:
+        """
+        Await one EC2 API call and map its errors through _ERROR_MAP like EC2Writer does.
+        
+        Args:
+            operation: Client method name, e.g. 'create_tags'
+            description: What the call does, used in error messages
+            arguments: Method arguments for the _ERROR_MAP message templates,
+                e.g. {'group_id': group_id}
+            **params: Request parameters
+        
+        Returns:
+            The API response
+        
+        Raises:
+            ResourceNotFoundError: If the resource doesn't exist
+            AWSPermissionException: If the caller isn't authorized for the call
+            AWSResourceError: If the call fails otherwise
+        """
+        try:
+            if aioboto3 is None:
+                if self._sync_writer is None:
+                    self._sync_writer = EC2Writer(self.client_manager)
+                return await run_sync(getattr(self._sync_writer.ec2_client, operation), **params)
+            client = await self._get_client()
+            return await getattr(client, operation)(**params)
+        except ImportError:
+            raise
+        except ClientError as e:
+            error = e.response.get('Error', {})
+            exc_class, template = _ERROR_MAP.get(error.get('Code'), (AWSResourceError, None))
+            try:
+                message = template.format(message=error.get('Message'), **(arguments or {})) if template else None
+            except KeyError:
+                message = None
+            message = message or f"Failed to {description}: {e}"
+            cause = e
+        except Exception as e:
+            exc_class = AWSResourceError
+            message = f"Failed to {description}: {e}"
+            cause = e
+        logger.error("Error calling %s: %s", operation, message)
+        raise exc_class(message) from cause
+    
+    async def create_instance(self, image_id: str, instance_type: str = 't2.micro',
+                              key_name: Optional[str] = None, security_group_ids: Optional[List[str]] = None,
+                              subnet_id: Optional[str] = None, user_data: Optional[str] = None,
+                              min_count: int = 1, max_count: int = 1, wait: bool = False,
+                              idempotent: bool = False, return_raw: bool = False,
+                              **kwargs) -> InstanceLaunchResult:
+        """Async version of EC2Writer.create_instance."""
+        logger.info("Launching %s-%s EC2 instances", min_count, max_count)
+        launch_params = _launch_params(image_id, instance_type, key_name, security_group_ids,
+                                       subnet_id, user_data, min_count, max_count, idempotent, **kwargs)
+        response = await self._call('run_instances', 'launch EC2 instances', **launch_params)
+        instance_ids = [instance['InstanceId'] for instance in response['Instances']]
+        logger.info("Successfully launched instances: %s", instance_ids)
+        if wait:
+            await self.wait_for_running(instance_ids)
+        return InstanceLaunchResult(instance_ids, response['ReservationId'],
+                                    response if return_raw else None)
+    
+    async def wait_for_running(self, instance_ids: List[str], delay: int = 5, max_attempts: int = 40) -> None:
+        """Async version of EC2Writer.wait_for_running."""
+        await self._wait('instance_running', instance_ids, delay, max_attempts)
+    
+    async def wait_for_stopped(self, instance_ids: List[str], delay: int = 5, max_attempts: int = 40) -> None:
+        """Async version of EC2Writer.wait_for_stopped."""
+        await self._wait('instance_stopped', instance_ids, delay, max_attempts)
+    
+    async def wait_for_terminated(self, instance_ids: List[str], delay: int = 5, max_attempts: int = 40) -> None:
+        """Async version of EC2Writer.wait_for_terminated."""
+        await self._wait('instance_terminated', instance_ids, delay, max_attempts)
+    
+    async def _wait(self, waiter_name: str, instance_ids: List[str], delay: int, max_attempts: int) -> None:
+        """Run an instance waiter on the async client, or EC2Writer's in a worker thread."""
+        if aioboto3 is None:
+            if self._sync_writer is None:
+                self._sync_writer = EC2Writer(self.client_manager)
+            return await run_sync(self._sync_writer._wait, waiter_name, instance_ids, delay, max_attempts)
+        ids = list(instance_ids)
+        try:
+            logger.info("Waiting for %s on %s EC2 instances", waiter_name, len(ids))
+            client = await self._get_client()
+            await client.get_waiter(waiter_name).wait(
+                InstanceIds=ids,
+                WaiterConfig={'Delay': delay, 'MaxAttempts': max_attempts}
+            )
+        except Exception as e:
+            logger.error("Error waiting for %s on %s: %s", waiter_name, ids, e)
+            raise AWSResourceError(f"Failed waiting for {waiter_name} on {ids}: {e}")
+    
+    async def terminate_instance(self, instance_id: str) -> Dict[str, Any]:
+        """Async version of EC2Writer.terminate_instance."""
+        return await self.terminate_instances([instance_id])
+    
+    async def terminate_instances(self, instance_ids: List[str]) -> Dict[str, Any]:
+        """Async version of EC2Writer.terminate_instances."""
+        return await self._change_instance_state('terminate', 'TerminatingInstances', instance_ids)
+    
+    async def start_instance(self, instance_id: str) -> Dict[str, Any]:
+        """Async version of EC2Writer.start_instance."""
+        return await self.start_instances([instance_id])
+    
+    async def start_instances(self, instance_ids: List[str]) -> Dict[str, Any]:
+        """Async version of EC2Writer.start_instances."""
+        return await self._change_instance_state('start', 'StartingInstances', instance_ids)
+    
+    async def stop_instance(self, instance_id: str, force: bool = False) -> Dict[str, Any]:
+        """Async version of EC2Writer.stop_instance."""
+        return await self.stop_instances([instance_id], force=force)
+    
+    async def stop_instances(self, instance_ids: List[str], force: bool = False) -> Dict[str, Any]:
+        """Async version of EC2Writer.stop_instances."""
+        return await self._change_instance_state('stop', 'StoppingInstances', instance_ids, Force=force)
+    
+    async def reboot_instance(self, instance_id: str) -> Dict[str, Any]:
+        """Async version of EC2Writer.reboot_instance."""
+        return await self.reboot_instances([instance_id])
+    
+    async def reboot_instances(self, instance_ids: List[str]) -> Dict[str, Any]:
+        """Async version of EC2Writer.reboot_instances."""
+        return await self._change_instance_state('reboot', None, instance_ids)
+    
+    async def _change_instance_state(self, action: str, result_key: Optional[str],
+                                     instance_ids: List[str], **params) -> Dict[str, Any]:
+        """
+        Call {action}_instances for the given IDs, with all 1000-ID chunks in flight at once.
+        
+        Args:
+            action: 'terminate', 'start', 'stop' or 'reboot'
+            result_key: Response key listing the state changes, merged across chunks
+            instance_ids: The EC2 instance IDs
+            **params: Additional request parameters
+        
+        Returns:
+            Response of the first call, with the state changes of every call
+        """
+        ids = list(instance_ids)
+        target = f"EC2 instance {ids[0]}" if len(ids) == 1 else f"{len(ids)} EC2 instances"
+        logger.info("Calling %s_instances for %s", action, target)
+        
+        responses = await asyncio.gather(*(
+            self._call(f"{action}_instances", f"{action} {target}", InstanceIds=chunk, **params)
+            for chunk in _chunks(ids, _MAX_STATE_CHANGE_IDS)
+        ))
+        response = responses[0] if responses else {}
+        if result_key:
+            for chunk_response in responses[1:]:
+                response[result_key].extend(chunk_response.get(result_key, []))
+        
+        logger.info("Successfully initiated %s for %s", action, target)
+        return response
+    
+    async def create_security_group(self, group_name: str, description: str,
+                                    vpc_id: Optional[str] = None) -> Dict[str, Any]:
+        """Async version of EC2Writer.create_security_group."""
+        logger.info("Creating security group: %s", group_name)
+        params = {'GroupName': group_name, 'Description': description}
+        if vpc_id:
+            params['VpcId'] = vpc_id
+        response = await self._call('create_security_group', f"create security group {group_name}", **params)
+        logger.info("Successfully created security group: %s", response['GroupId'])
+        return response
+    
+    async def delete_security_group(self, group_id: str) -> Dict[str, Any]:
+        """Async version of EC2Writer.delete_security_group."""
+        logger.info("Deleting security group: %s", group_id)
+        return await self._call('delete_security_group', f"delete security group {group_id}",
+                                {'group_id': group_id},
+                                GroupId=group_id)
+    
+    async def authorize_security_group_ingress(self, group_id: str,
+                                               ip_permissions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async version of EC2Writer.authorize_security_group_ingress."""
+        logger.info("Adding inbound rules to security group: %s", group_id)
+        return await self._call('authorize_security_group_ingress',
+                                f"add inbound rules to security group {group_id}",
+                                {'group_id': group_id},
+                                GroupId=group_id, IpPermissions=ip_permissions)
+    
+    async def revoke_security_group_ingress(self, group_id: str,
+                                            ip_permissions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async version of EC2Writer.revoke_security_group_ingress."""
+        logger.info("Removing inbound rules from security group: %s", group_id)
+        return await self._call('revoke_security_group_ingress',
+                                f"remove inbound rules from security group {group_id}",
+                                {'group_id': group_id},
+                                GroupId=group_id, IpPermissions=ip_permissions)
+    
+    async def create_key_pair(self, key_name: str) -> Dict[str, Any]:
+        """Async version of EC2Writer.create_key_pair."""
+        logger.info("Creating key pair: %s", key_name)
+        return await self._call('create_key_pair', f"create key pair {key_name}", {'key_name': key_name},
+                                KeyName=key_name)
+    
+    async def delete_key_pair(self, key_name: str) -> Dict[str, Any]:
+        """Async version of EC2Writer.delete_key_pair."""
+        logger.info("Deleting key pair: %s", key_name)
+        return await self._call('delete_key_pair', f"delete key pair {key_name}", {'key_name': key_name},
+                                KeyName=key_name)
+    
+    async def create_tags(self, resource_ids: List[str], tags: List[Dict[str, str]],
+                          chunk_size: int = _MAX_TAG_RESOURCES) -> Dict[str, Any]:
+        """Async version of EC2Writer.create_tags."""
+        return await self._tag_resources('create_tags', resource_ids, tags, chunk_size)
+    
+    async def delete_tags(self, resource_ids: List[str], tags: List[Dict[str, str]],
+                          chunk_size: int = _MAX_TAG_RESOURCES) -> Dict[str, Any]:
+        """Async version of EC2Writer.delete_tags."""
+        return await self._tag_resources('delete_tags', resource_ids, tags, chunk_size)
+    
+    async def _tag_resources(self, operation: str, resource_ids: List[str],
+                             tags: List[Dict[str, str]], chunk_size: int) -> Dict[str, Any]:
+        """Call create_tags or delete_tags concurrently for each chunk of resource IDs."""
+        ids = list(resource_ids)
+        logger.info("Calling %s for %s resources", operation, len(ids))
+        responses = await asyncio.gather(*(
+            self._call(operation, f"call {operation} for EC2 resources", Resources=chunk, Tags=tags)
+            for chunk in _chunks(ids, chunk_size)
+        ))
+        return responses[-1] if responses else {}
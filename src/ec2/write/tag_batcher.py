@@ -0,0 +1,111 @@
+"""
+Tag Batcher - Buffered EC2 tagging.
+
+TagBatcher collects per-resource tag requests and sends one create_tags call
+per distinct tag set, with up to 1000 resources per call, instead of one call
+per resource.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Union
+
+from .ec2_writer import EC2Writer, _MAX_TAG_RESOURCES
+
+logger = logging.getLogger(__name__)
+
+Tags = Union[Dict[str, str], List[Dict[str, str]]]
+
+
+def _tag_set(tags: Tags) -> FrozenSet[Tuple[str, str]]:
+    """Normalize a {key: value} dict or a boto3 tag list to a hashable set of pairs."""
+    if isinstance(tags, dict):
+        return frozenset(tags.items())
+    return frozenset((tag['Key'], tag.get('Value', '')) for tag in tags)
+
+
+class TagBatcher:
+    """Buffer create_tags requests and merge them across resources."""
+
+    def __init__(self, ec2_writer: EC2Writer, flush_threshold: int = 500):
+        """
+        Initialize TagBatcher.
+
+        Args:
+            ec2_writer: EC2Writer used to send the create_tags calls
+            flush_threshold: Number of buffered resources that triggers a flush
+        """
+        self.ec2_writer = ec2_writer
+        self.flush_threshold = flush_threshold
+        self._groups = defaultdict(list)
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'TagBatcher':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+            return
+        # Send what was buffered before the error, without masking the error
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error("Could not flush buffered tags: %s", e)
+
+    def add(self, resource_id: str, tags: Tags) -> None:
+        """
+        Queue tags for a resource, flushing once flush_threshold resources are buffered.
+
+        Args:
+            resource_id: The EC2 resource ID to tag
+            tags: Tags as a {key: value} dict or a list of 'Key'/'Value' dictionaries
+        """
+        with self._lock:
+            self._groups[_tag_set(tags)].append(resource_id)
+            self._pending += 1
+            full = self._pending >= self.flush_threshold
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Send the buffered tags, one create_tags call per tag set and 1000 resources.
+
+        If a call fails, the resources not yet tagged go back into the buffer
+        so a later flush can retry them.
+
+        Returns:
+            Number of create_tags calls made
+
+        Raises:
+            AWSResourceError: If a create_tags call fails
+        """
+        with self._lock:
+            groups, self._groups = self._groups, defaultdict(list)
+            self._pending = 0
+
+        calls = 0
+        pending = list(groups.items())
+        for index, (tag_set, resource_ids) in enumerate(pending):
+            tags = [{'Key': key, 'Value': value} for key, value in sorted(tag_set)]
+            resource_ids = list(dict.fromkeys(resource_ids))
+            for start in range(0, len(resource_ids), _MAX_TAG_RESOURCES):
+                try:
+                    self.ec2_writer.create_tags(resource_ids[start:start + _MAX_TAG_RESOURCES], tags)
+                except Exception:
+                    self._requeue([(tag_set, resource_ids[start:])] + pending[index + 1:])
+                    raise
+                calls += 1
+
+        logger.debug("Flushed tags with %s create_tags calls", calls)
+        return calls
+
+    def _requeue(self, groups: Iterable[Tuple[FrozenSet[Tuple[str, str]], List[str]]]) -> None:
+        """Put unsent groups back in the buffer, ahead of resources added since the flush began."""
+        with self._lock:
+            for tag_set, resource_ids in groups:
+                self._groups[tag_set][:0] = resource_ids
+                self._pending += len(resource_ids)
@@ -3,6 +3,8 @@ AWS ECS service package for reading and writing ECS resources.
 """
 
 from .read.ecs_reader import ECSReader
+from .read.ecs_reader_async import AsyncECSReader
 from .write.ecs_writer import ECSWriter
+from .write.ecs_writer_async import AsyncECSWriter
 
-__all__ = ['ECSReader', 'ECSWriter']
+__all__ = ['ECSReader', 'AsyncECSReader', 'ECSWriter', 'AsyncECSWriter']
@@ -5,13 +5,54 @@ This module provides functionality for reading and exploring AWS ECS resources.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple
 from botocore.exceptions import ClientError
-from common.aws_client import AWSClientManager
+from cachetools.keys import hashkey
+from common.aws_client import AWSClientManager, DEFAULT_CLIENT_CONFIG
+from common.cache import ResponseCache
 from common.exceptions import AWSResourceError, ResourceNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Largest page the ECS list_* operations return
+_PAGE_SIZE = 100
+
+# Most ARNs each describe_* operation accepts per call
+_DESCRIBE_LIMITS = {
+    'describe_clusters': 100,
+    'describe_services': 10,
+    'describe_tasks': 100,
+    'describe_container_instances': 100,
+}
+
+
+# Worker threads for describing ARN chunks concurrently
+_MAX_WORKERS = 10
+
+# Registered task definition revisions kept for the life of the reader
+_TASK_DEFINITION_CACHE_SIZE = 4096
+
+
+def _chunk(seq: Sequence[Any], n: int) -> Iterator[Sequence[Any]]:
+    """Yield successive slices of at most n items."""
+    for start in range(0, len(seq), n):
+        yield seq[start:start + n]
+
+
+def _kw(**pairs: Any) -> Dict[str, Any]:
+    """Return the request parameters that were given, dropping None and empty values."""
+    return {key: value for key, value in pairs.items() if value}
+
+
+def _is_immutable_task_definition(task_definition: str) -> bool:
+    """Return True for an ARN or family:revision, which never change once registered."""
+    if task_definition.startswith('arn:'):
+        return True
+    family, _, revision = task_definition.rpartition(':')
+    return bool(family) and revision.isdigit()
+
 
 class ECSReader:
     """
@@ -21,23 +62,142 @@ class ECSReader:
     ECS clusters, services, tasks, task definitions, and container instances.
     """
     
-    def __init__(self, profile_name: str = 'default', region_name: str = 'us-east-1'):
+    def __init__(self, profile_name: str = 'default', region_name: str = 'us-east-1',
+                 cache_ttl: float = 10):
         """
         Initialize the ECS reader.
         
         Args:
             profile_name: AWS profile name to use for authentication
             region_name: AWS region name
+            cache_ttl: Seconds to cache responses for the describe_* methods
         """
         self.client_manager = AWSClientManager(profile_name, region_name)
-        self.ecs_client = self.client_manager.get_client('ecs')
+        self.ecs_client = self.client_manager.get_client('ecs', config=DEFAULT_CLIENT_CONFIG)
+        self._executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix='ecs-reader')
+        self._cache = ResponseCache(maxsize=512, ttl=cache_ttl)
+        self._task_definitions = ResponseCache(maxsize=_TASK_DEFINITION_CACHE_SIZE, ttl=float('inf'))
+    
+    def __enter__(self) -> 'ECSReader':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def clear_cache(self) -> None:
+        """Drop all cached describe responses, including pinned task definitions."""
+        self._cache.clear()
+        self._task_definitions.clear()
+    
+    def close(self) -> None:
+        """Shut down the worker threads and close the client manager's clients."""
+        self._executor.shutdown(wait=True)
+        self.client_manager.close()
     
-    def list_clusters(self, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    def _iter_arn_pages(self, operation: str, result_key: str, max_results: Optional[int] = None,
+                        **kwargs) -> Iterator[List[str]]:
+        """
+        Yield the ARNs of each page of an ECS list_* operation.
+        
+        Args:
+            operation: Paginated client method name, e.g. 'list_services'
+            result_key: Response key holding the ARNs
+            max_results: Maximum number of ARNs to return across all pages
+            **kwargs: Request parameters
+            
+        Yields:
+            List of ARNs from one page
+        """
+        pagination = {'PageSize': _PAGE_SIZE}
+        if max_results:
+            pagination['MaxItems'] = max_results
+        
+        for page in self.ecs_client.get_paginator(operation).paginate(**kwargs, PaginationConfig=pagination):
+            yield page.get(result_key, [])
+    
+    def _list_arns(self, operation: str, result_key: str, max_results: Optional[int] = None,
+                   **kwargs) -> List[str]:
+        """
+        Collect ARNs from every page of an ECS list_* operation.
+        
+        Args:
+            operation: Paginated client method name, e.g. 'list_services'
+            result_key: Response key holding the ARNs
+            max_results: Maximum number of ARNs to return across all pages
+            **kwargs: Request parameters
+            
+        Returns:
+            List of ARNs
+        """
+        return list(chain.from_iterable(self._iter_arn_pages(operation, result_key, max_results, **kwargs)))
+    
+    def _iter_described(self, list_operation: str, arn_result_key: str, describe_operation: str,
+                        arn_key: str, result_key: str, list_kwargs: Dict[str, Any],
+                        describe_kwargs: Dict[str, Any], max_results: Optional[int] = None
+                        ) -> Iterator[Dict[str, Any]]:
+        """
+        Describe each page of a list_* operation as soon as it arrives.
+        
+        Args:
+            list_operation: Paginated client method name, e.g. 'list_services'
+            arn_result_key: Response key holding the ARNs
+            describe_operation: Client method name, e.g. 'describe_services'
+            arn_key: Describe request parameter taking the ARNs
+            result_key: Describe response key holding the descriptions
+            list_kwargs: List request parameters
+            describe_kwargs: Additional describe request parameters
+            max_results: Maximum number of ARNs to describe
+            
+        Yields:
+            Descriptions in ARN order
+        """
+        for arns in self._iter_arn_pages(list_operation, arn_result_key, max_results, **list_kwargs):
+            yield from self._describe(describe_operation, arn_key, result_key, arns, **describe_kwargs)
+    
+    def _describe(self, operation: str, arn_key: str, result_key: str, arns: List[str],
+                  **kwargs) -> List[Dict[str, Any]]:
+        """
+        Describe ARNs in chunks no larger than the operation accepts.
+        
+        Duplicate ARNs are described once. When there is more than one chunk,
+        the chunks are described concurrently on the worker threads; results
+        keep the ARN order.
+        
+        Args:
+            operation: Client method name, e.g. 'describe_services'
+            arn_key: Request parameter taking the ARNs
+            result_key: Response key holding the descriptions
+            arns: ARNs to describe
+            **kwargs: Additional request parameters
+            
+        Returns:
+            List of descriptions from every chunk
+        """
+        call = getattr(self.ecs_client, operation)
+        
+        def describe_chunk(chunk):
+            return call(**{arn_key: chunk}, **kwargs).get(result_key, [])
+        
+        # Throttled chunks (Throttling, ThrottlingException, RequestLimitExceeded)
+        # are retried by the client's adaptive retry mode with jittered backoff,
+        # and its shared rate limiter slows every worker, so no retry loop here.
+        chunks = list(_chunk(list(dict.fromkeys(arns)), _DESCRIBE_LIMITS[operation]))
+        if len(chunks) > 1:
+            return list(chain.from_iterable(self._executor.map(describe_chunk, chunks)))
+        return describe_chunk(chunks[0]) if chunks else []
+    
+    def list_clusters(self, max_results: Optional[int] = None,
+                      include: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         List all ECS clusters in the account.
         
+        Each description also seeds the describe_cluster cache under the
+        cluster's name and ARN, so drilling into a listed cluster is free.
+        
         Args:
-            max_results: Maximum number of clusters to return
+            max_results: Maximum number of clusters to return (default: all)
+            include: Extra cluster details to return: ATTACHMENTS, CONFIGURATIONS,
+                SETTINGS, STATISTICS and/or TAGS
             
         Returns:
             List of cluster ARNs and details
@@ -48,19 +208,15 @@ class ECSReader:
         try:
             logger.info("Listing ECS clusters")
             
-            kwargs = {}
-            if max_results:
-                kwargs['maxResults'] = max_results
+            cluster_arns = self._list_arns('list_clusters', 'clusterArns', max_results)
             
-            response = self.ecs_client.list_clusters(**kwargs)
-            cluster_arns = response.get('clusterArns', [])
+            clusters = self._describe('describe_clusters', 'clusters', 'clusters', cluster_arns, **_kw(include=include))
             
-            if cluster_arns:
-                # Get detailed information about clusters
-                cluster_details = self.ecs_client.describe_clusters(clusters=cluster_arns)
-                clusters = cluster_details.get('clusters', [])
-            else:
-                clusters = []
+            for cluster in clusters:
+                response = {'clusters': [cluster]}
+                for key in (cluster.get('clusterName'), cluster.get('clusterArn')):
+                    if key:
+                        self._cache.set(hashkey('describe_cluster', key, tuple(include or ())), response)
             
             logger.info("Found %d ECS clusters", len(clusters))
             return clusters
@@ -70,12 +226,16 @@ class ECSReader:
             logger.error(error_message)
             raise AWSResourceError(error_message) from e
     
-    def describe_cluster(self, cluster_name: str) -> Dict[str, Any]:
+    def describe_cluster(self, cluster_name: str, use_cache: bool = True,
+                         include: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get detailed information about a specific ECS cluster.
         
         Args:
             cluster_name: Name or ARN of the ECS cluster
+            use_cache: Whether to serve a recently cached response
+            include: Extra cluster details to return: ATTACHMENTS, CONFIGURATIONS,
+                SETTINGS, STATISTICS and/or TAGS
             
         Returns:
             Cluster configuration and metadata
@@ -85,9 +245,15 @@ class ECSReader:
             AWSResourceError: If there's an error retrieving the cluster
         """
         try:
-            logger.info("Describing ECS cluster: %s", cluster_name)
+            logger.debug("Describing ECS cluster: %s", cluster_name)
+            
+            kwargs = _kw(clusters=[cluster_name], include=include)
             
-            response = self.ecs_client.describe_clusters(clusters=[cluster_name])
+            response = self._cache.get_or_load(
+                hashkey('describe_cluster', cluster_name, tuple(include or ())),
+                lambda: self.ecs_client.describe_clusters(**kwargs),
+                use_cache
+            )
             clusters = response.get('clusters', [])
             
             if not clusters:
@@ -96,7 +262,7 @@ class ECSReader:
                 raise ResourceNotFoundError(error_message)
             
             cluster = clusters[0]
-            logger.info("Retrieved cluster information for %s", cluster_name)
+            logger.debug("Retrieved cluster information for %s", cluster_name)
             return cluster
             
         except ClientError as e:
@@ -104,59 +270,65 @@ class ECSReader:
             logger.error(error_message)
             raise AWSResourceError(error_message) from e
     
-    def list_services(self, cluster_name: Optional[str] = None, 
-                     max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    def iter_services(self, cluster_name: Optional[str] = None, 
+                      max_results: Optional[int] = None,
+                      include: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
         """
-        List ECS services in a cluster.
+        Iterate over ECS services in a cluster, one listing page at a time.
         
         Args:
             cluster_name: Name of the cluster (uses default if not specified)
-            max_results: Maximum number of services to return
+            max_results: Maximum number of services to return (default: all)
+            include: Extra service details to return: TAGS
             
-        Returns:
-            List of service configurations
+        Yields:
+            Service configurations
             
         Raises:
             AWSResourceError: If there's an error listing services
         """
         try:
-            logger.info("Listing ECS services in cluster: %s", cluster_name or 'default')
-            
-            kwargs = {}
-            if cluster_name:
-                kwargs['cluster'] = cluster_name
-            if max_results:
-                kwargs['maxResults'] = max_results
-            
-            response = self.ecs_client.list_services(**kwargs)
-            service_arns = response.get('serviceArns', [])
-            
-            if service_arns:
-                # Get detailed information about services
-                describe_kwargs = {'services': service_arns}
-                if cluster_name:
-                    describe_kwargs['cluster'] = cluster_name
-                
-                service_details = self.ecs_client.describe_services(**describe_kwargs)
-                services = service_details.get('services', [])
-            else:
-                services = []
-            
-            logger.info("Found %d ECS services", len(services))
-            return services
-            
+            yield from self._iter_described(
+                'list_services', 'serviceArns', 'describe_services', 'services', 'services',
+                _kw(cluster=cluster_name), _kw(cluster=cluster_name, include=include), max_results
+            )
         except ClientError as e:
             error_message = f"Failed to list ECS services: {e.response['Error']['Message']}"
             logger.error(error_message)
             raise AWSResourceError(error_message) from e
     
-    def describe_service(self, service_name: str, cluster_name: Optional[str] = None) -> Dict[str, Any]:
+    def list_services(self, cluster_name: Optional[str] = None, 
+                     max_results: Optional[int] = None,
+                     include: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        List ECS services in a cluster.
+        
+        Args:
+            cluster_name: Name of the cluster (uses default if not specified)
+            max_results: Maximum number of services to return (default: all)
+            include: Extra service details to return: TAGS
+            
+        Returns:
+            List of service configurations
+            
+        Raises:
+            AWSResourceError: If there's an error listing services
+        """
+        logger.info("Listing ECS services in cluster: %s", cluster_name or 'default')
+        services = list(self.iter_services(cluster_name, max_results, include))
+        logger.info("Found %d ECS services", len(services))
+        return services
+    
+    def describe_service(self, service_name: str, cluster_name: Optional[str] = None,
+                         use_cache: bool = True, include: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get detailed information about a specific ECS service.
         
         Args:
             service_name: Name or ARN of the ECS service
             cluster_name: Name of the cluster (uses default if not specified)
+            use_cache: Whether to serve a recently cached response
+            include: Extra service details to return: TAGS
             
         Returns:
             Service configuration and metadata
@@ -166,13 +338,15 @@ class ECSReader:
             AWSResourceError: If there's an error retrieving the service
         """
         try:
-            logger.info("Describing ECS service: %s", service_name)
+            logger.debug("Describing ECS service: %s", service_name)
             
-            kwargs = {'services': [service_name]}
-            if cluster_name:
-                kwargs['cluster'] = cluster_name
+            kwargs = _kw(services=[service_name], cluster=cluster_name, include=include)
             
-            response = self.ecs_client.describe_services(**kwargs)
+            response = self._cache.get_or_load(
+                hashkey('describe_service', cluster_name, service_name, tuple(include or ())),
+                lambda: self.ecs_client.describe_services(**kwargs),
+                use_cache
+            )
             services = response.get('services', [])
             
             if not services:
@@ -181,7 +355,7 @@ class ECSReader:
                 raise ResourceNotFoundError(error_message)
             
             service = services[0]
-            logger.info("Retrieved service information for %s", service_name)
+            logger.debug("Retrieved service information for %s", service_name)
             return service
             
         except ClientError as e:
@@ -189,63 +363,79 @@ class ECSReader:
             logger.error(error_message)
             raise AWSResourceError(error_message) from e
     
-    def list_tasks(self, cluster_name: Optional[str] = None, 
-                  service_name: Optional[str] = None,
-                  desired_status: Optional[str] = None) -> List[Dict[str, Any]]:
+    def iter_tasks(self, cluster_name: Optional[str] = None, 
+                   service_name: Optional[str] = None,
+                   desired_status: Optional[str] = None,
+                   include: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
         """
-        List ECS tasks in a cluster.
+        Iterate over ECS tasks in a cluster, one listing page at a time.
         
         Args:
             cluster_name: Name of the cluster (uses default if not specified)
             service_name: Optional service name to filter tasks
             desired_status: Optional desired status (RUNNING, PENDING, STOPPED)
+            include: Extra task details to return: TAGS
             
-        Returns:
-            List of task configurations
+        Yields:
+            Task configurations
             
         Raises:
             AWSResourceError: If there's an error listing tasks
         """
         try:
-            logger.info("Listing ECS tasks in cluster: %s", cluster_name or 'default')
-            
-            kwargs = {}
-            if cluster_name:
-                kwargs['cluster'] = cluster_name
-            if service_name:
-                kwargs['serviceName'] = service_name
-            if desired_status:
-                kwargs['desiredStatus'] = desired_status
-            
-            response = self.ecs_client.list_tasks(**kwargs)
-            task_arns = response.get('taskArns', [])
-            
-            if task_arns:
-                # Get detailed information about tasks
-                describe_kwargs = {'tasks': task_arns}
-                if cluster_name:
-                    describe_kwargs['cluster'] = cluster_name
-                
-                task_details = self.ecs_client.describe_tasks(**describe_kwargs)
-                tasks = task_details.get('tasks', [])
-            else:
-                tasks = []
-            
-            logger.info("Found %d ECS tasks", len(tasks))
-            return tasks
-            
+            yield from self._iter_described(
+                'list_tasks', 'taskArns', 'describe_tasks', 'tasks', 'tasks',
+                _kw(cluster=cluster_name, serviceName=service_name, desiredStatus=desired_status),
+                _kw(cluster=cluster_name, include=include)
+            )
         except ClientError as e:
             error_message = f"Failed to list ECS tasks: {e.response['Error']['Message']}"
             logger.error(error_message)
             raise AWSResourceError(error_message) from e
     
-    def describe_task(self, task_arn: str, cluster_name: Optional[str] = None) -> Dict[str, Any]:
+    def list_tasks(self, cluster_name: Optional[str] = None, 
+                  service_name: Optional[str] = None,
+                  desired_status: Optional[str] = None,
+                  include: Optional[List[str]] = None,
+                  prefetch_task_definitions: bool = False) -> List[Dict[str, Any]]:
+        """
+        List ECS tasks in a cluster.
+        
+        Args:
+            cluster_name: Name of the cluster (uses default if not specified)
+            service_name: Optional service name to filter tasks
+            desired_status: Optional desired status (RUNNING, PENDING, STOPPED)
+            include: Extra task details to return: TAGS
+            prefetch_task_definitions: Describe the tasks' task definitions concurrently
+                so later describe_task_definition calls are served from the cache
+            
+        Returns:
+            List of task configurations
+            
+        Raises:
+            AWSResourceError: If there's an error listing tasks or prefetching
+                their task definitions
+        """
+        logger.info("Listing ECS tasks in cluster: %s", cluster_name or 'default')
+        tasks = list(self.iter_tasks(cluster_name, service_name, desired_status, include))
+        logger.info("Found %d ECS tasks", len(tasks))
+        
+        if prefetch_task_definitions:
+            task_definitions = dict.fromkeys(
+                task['taskDefinitionArn'] for task in tasks if 'taskDefinitionArn' in task
+            )
+            list(self._executor.map(self.describe_task_definition, task_definitions))
+        return tasks
+    
+    def describe_task(self, task_arn: str, cluster_name: Optional[str] = None,
+                      include: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get detailed information about a specific ECS task.
         
         Args:
             task_arn: ARN of the ECS task
             cluster_name: Name of the cluster (uses default if not specified)
+            include: Extra task details to return: TAGS
             
         Returns:
             Task configuration and metadata
@@ -255,13 +445,9 @@ class ECSReader:
             AWSResourceError: If there's an error retrieving the task
         """
         try:
-            logger.info("Describing ECS task: %s", task_arn)
-            
-            kwargs = {'tasks': [task_arn]}
-            if cluster_name:
-                kwargs['cluster'] = cluster_name
+            logger.debug("Describing ECS task: %s", task_arn)
             
-            response = self.ecs_client.describe_tasks(**kwargs)
+            response = self.ecs_client.describe_tasks(**_kw(tasks=[task_arn], cluster=cluster_name, include=include))
             tasks = response.get('tasks', [])
             
             if not tasks:
@@ -270,7 +456,7 @@ class ECSReader:
                 raise ResourceNotFoundError(error_message)
             
             task = tasks[0]
-            logger.info("Retrieved task information for %s", task_arn)
+            logger.debug("Retrieved task information for %s", task_arn)
             return task
             
         except ClientError as e:
@@ -296,16 +482,8 @@ class ECSReader:
         try:
             logger.info("Listing ECS task definitions")
             
-            kwargs = {'status': status}
-            if family_prefix:
-                kwargs['familyPrefix'] = family_prefix
-            
-            paginator = self.ecs_client.get_paginator('list_task_definitions')
-            page_iterator = paginator.paginate(**kwargs)
-            
-            task_definitions = []
-            for page in page_iterator:
-                task_definitions.extend(page.get('taskDefinitionArns', []))
+            task_definitions = self._list_arns('list_task_definitions', 'taskDefinitionArns',
+                                               **_kw(status=status, familyPrefix=family_prefix))
             
             logger.info("Found %d ECS task definitions", len(task_definitions))
             return task_definitions
@@ -315,12 +493,17 @@ class ECSReader:
             logger.error(error_message)
             raise AWSResourceError(error_message) from e
     
-    def describe_task_definition(self, task_definition: str) -> Dict[str, Any]:
+    def describe_task_definition(self, task_definition: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get detailed information about a specific ECS task definition.
         
+        A family:revision or ARN is immutable, so its response is kept until
+        clear_cache(); a bare family resolves to the latest revision and uses
+        the short-lived cache instead.
+        
         Args:
             task_definition: Family and revision (family:revision) or full ARN
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             Task definition configuration
@@ -330,11 +513,16 @@ class ECSReader:
             AWSResourceError: If there's an error retrieving the task definition
         """
         try:
-            logger.info("Describing ECS task definition: %s", task_definition)
+            logger.debug("Describing ECS task definition: %s", task_definition)
             
-            response = self.ecs_client.describe_task_definition(taskDefinition=task_definition)
+            cache = self._task_definitions if _is_immutable_task_definition(task_definition) else self._cache
+            response = cache.get_or_load(
+                hashkey('describe_task_definition', task_definition),
+                lambda: self.ecs_client.describe_task_definition(taskDefinition=task_definition),
+                use_cache
+            )
             
-            logger.info("Retrieved task definition information for %s", task_definition)
+            logger.debug("Retrieved task definition information for %s", task_definition)
             return response.get('taskDefinition', {})
             
         except ClientError as e:
@@ -348,14 +536,46 @@ class ECSReader:
                 logger.error(error_message)
                 raise AWSResourceError(error_message) from e
     
+    def iter_container_instances(self, cluster_name: Optional[str] = None,
+                                 status: Optional[str] = None,
+                                 include: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over ECS container instances in a cluster, one listing page at a time.
+        
+        Args:
+            cluster_name: Name of the cluster (uses default if not specified)
+            status: Optional status filter (ACTIVE, DRAINING, REGISTERING, etc.)
+            include: Extra container instance details to return: TAGS and/or
+                CONTAINER_INSTANCE_HEALTH
+            
+        Yields:
+            Container instance configurations
+            
+        Raises:
+            AWSResourceError: If there's an error listing container instances
+        """
+        try:
+            yield from self._iter_described(
+                'list_container_instances', 'containerInstanceArns',
+                'describe_container_instances', 'containerInstances', 'containerInstances',
+                _kw(cluster=cluster_name, status=status), _kw(cluster=cluster_name, include=include)
+            )
+        except ClientError as e:
+            error_message = f"Failed to list ECS container instances: {e.response['Error']['Message']}"
+            logger.error(error_message)
+            raise AWSResourceError(error_message) from e
+    
     def list_container_instances(self, cluster_name: Optional[str] = None,
-                                status: Optional[str] = None) -> List[Dict[str, Any]]:
+                                status: Optional[str] = None,
+                                include: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         List ECS container instances in a cluster.
         
         Args:
             cluster_name: Name of the cluster (uses default if not specified)
             status: Optional status filter (ACTIVE, DRAINING, REGISTERING, etc.)
+            include: Extra container instance details to return: TAGS and/or
+                CONTAINER_INSTANCE_HEALTH
             
         Returns:
             List of container instance configurations
@@ -363,36 +583,32 @@ class ECSReader:
         Raises:
             AWSResourceError: If there's an error listing container instances
         """
-        try:
-            logger.info("Listing ECS container instances in cluster: %s", cluster_name or 'default')
-            
-            kwargs = {}
-            if cluster_name:
-                kwargs['cluster'] = cluster_name
-            if status:
-                kwargs['status'] = status
-            
-            response = self.ecs_client.list_container_instances(**kwargs)
-            instance_arns = response.get('containerInstanceArns', [])
-            
-            if instance_arns:
-                # Get detailed information about container instances
-                describe_kwargs = {'containerInstances': instance_arns}
-                if cluster_name:
-                    describe_kwargs['cluster'] = cluster_name
-                
-                instance_details = self.ecs_client.describe_container_instances(**describe_kwargs)
-                instances = instance_details.get('containerInstances', [])
-            else:
-                instances = []
+        logger.info("Listing ECS container instances in cluster: %s", cluster_name or 'default')
+        instances = list(self.iter_container_instances(cluster_name, status, include))
+        logger.info("Found %d ECS container instances", len(instances))
+        return instances
+    
+    def get_service_counts(self, cluster_name: str, service_name: str,
+                           use_cache: bool = True) -> Tuple[int, int]:
+        """
+        Get the desired and running task counts for a given ECS service.
+        
+        Both counts come from a single (cached) DescribeServices call.
+        
+        Args:
+            cluster_name: Name of the ECS cluster
+            service_name: Name of the ECS service
+            use_cache: Whether to serve a recently cached response
             
-            logger.info("Found %d ECS container instances", len(instances))
-            return instances
+        Returns:
+            Tuple of (desired count, running count)
             
-        except ClientError as e:
-            error_message = f"Failed to list ECS container instances: {e.response['Error']['Message']}"
-            logger.error(error_message)
-            raise AWSResourceError(error_message) from e
+        Raises:
+            ResourceNotFoundError: If the service doesn't exist
+            AWSResourceError: If there's an error retrieving the service
+        """
+        service = self.describe_service(service_name, cluster_name, use_cache)
+        return service.get('desiredCount', 0), service.get('runningCount', 0)
     
     def get_service_task_count(self, cluster_name: str, service_name: str) -> int:
         """
@@ -408,20 +624,8 @@ class ECSReader:
         Raises:
             AWSResourceError: If there's an error retrieving the service
         """
-        try:
-            response = self.ecs_client.describe_services(
-                cluster=cluster_name,
-                services=[service_name]
-            )
-            services = response.get('services', [])
-            if not services:
-                raise ResourceNotFoundError(f"Service {service_name} not found in cluster {cluster_name}")
-            return services[0].get('desiredCount', 0)
-        except ClientError as e:
-            error_message = f"Failed to get task count for service {service_name}: {e.response['Error']['Message']}"
-            logger.error(error_message)
-            raise AWSResourceError(error_message) from e
-
+        return self.get_service_counts(cluster_name, service_name)[0]
+    
     def get_running_task_count(self, cluster_name: str, service_name: str) -> int:
         """
         Get the running task count for a given ECS service.
@@ -436,16 +640,4 @@ class ECSReader:
         Raises:
             AWSResourceError: If there's an error retrieving the service
         """
-        try:
-            response = self.ecs_client.describe_services(
-                cluster=cluster_name,
-                services=[service_name]
-            )
-            services = response.get('services', [])
-            if not services:
-                raise ResourceNotFoundError(f"Service {service_name} not found in cluster {cluster_name}")
-            return services[0].get('runningCount', 0)
-        except ClientError as e:
-            error_message = f"Failed to get running task count for service {service_name}: {e.response['Error']['Message']}"
-            logger.error(error_message)
-            raise AWSResourceError(error_message) from e
+        return self.get_service_counts(cluster_name, service_name)[1]
@@ -0,0 +1,224 @@
+"""
+Async ECS Reader Module
+
+AsyncECSReader mirrors the list_* methods of ECSReader as coroutines so that
+many clusters can be enumerated concurrently. Requests go through a
+long-lived aioboto3 client when the async extra is installed; without
+aioboto3 they fall back to ECSReader run in worker threads.
+"""
+
+import asyncio
+import logging
+from itertools import chain
+from typing import Dict, List, Optional, Any
+from botocore.exceptions import ClientError
+
+from common.aws_client import DEFAULT_CLIENT_CONFIG
+from common.threads import run_sync
+from common.exceptions import AWSResourceError
+from .ecs_reader import ECSReader, _DESCRIBE_LIMITS, _PAGE_SIZE, _chunk, _kw
+
+try:
+    import aioboto3
+except ImportError:  # optional: pip install argus-aws[async]
+    aioboto3 = None
+
+logger = logging.getLogger(__name__)
+
+# Clusters enumerated at once by list_services_for_clusters
+_MAX_CONCURRENT_CLUSTERS = 10
+
+
+class AsyncECSReader:
+    """Async ECS list operations using aioboto3, or ECSReader in worker threads."""
+
+    def __init__(self, profile_name: str = 'default', region_name: str = 'us-east-1',
+                 max_concurrency: int = _MAX_CONCURRENT_CLUSTERS):
+        """
+        Initialize the async ECS reader.
+
+        Args:
+            profile_name: AWS profile name to use for authentication
+            region_name: AWS region name
+            max_concurrency: Clusters enumerated at once by list_services_for_clusters
+        """
+        self.profile_name = profile_name
+        self.region_name = region_name
+        self.max_concurrency = max_concurrency
+        self._client_context = None
+        self._client = None
+        self._lock = None
+        self._sync_reader = None
+
+    async def __aenter__(self) -> 'AsyncECSReader':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _get_client(self):
+        """
+        Get or create the long-lived aioboto3 ECS client.
+
+        Returns:
+            aioboto3 ECS client
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._client is None:
+                session = aioboto3.Session(profile_name=self.profile_name, region_name=self.region_name)
+                context = session.client('ecs', config=DEFAULT_CLIENT_CONFIG)
+                self._client = await context.__aenter__()
+                self._client_context = context
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the aioboto3 ECS client and the fallback reader, if either was opened."""
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+            self._client_context = None
+            self._client = None
+        if self._sync_reader is not None:
+            self._sync_reader.close()
+            self._sync_reader = None
+
+    async def _run_sync(self, method: str, *args, **kwargs) -> List[Dict[str, Any]]:
+        """Call an ECSReader method in a worker thread when aioboto3 is unavailable."""
+        if self._sync_reader is None:
+            self._sync_reader = ECSReader(self.profile_name, self.region_name)
+        return await run_sync(getattr(self._sync_reader, method), *args, **kwargs)
+
+    async def _list_and_describe(self, list_operation: str, arn_result_key: str,
+                                 describe_operation: str, arn_key: str, result_key: str,
+                                 list_kwargs: Dict[str, Any], describe_kwargs: Dict[str, Any],
+                                 max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Collect ARNs from every page of a list_* operation and describe them.
+
+        Duplicate ARNs are described once. Describe chunks are awaited
+        together; results keep the ARN order.
+
+        Args:
+            list_operation: Paginated client method name, e.g. 'list_services'
+            arn_result_key: Response key holding the ARNs
+            describe_operation: Client method name, e.g. 'describe_services'
+            arn_key: Describe request parameter taking the ARNs
+            result_key: Describe response key holding the descriptions
+            list_kwargs: List request parameters
+            describe_kwargs: Additional describe request parameters
+            max_results: Maximum number of ARNs to describe
+
+        Returns:
+            List of descriptions
+        """
+        client = await self._get_client()
+        pagination = {'PageSize': _PAGE_SIZE}
+        if max_results:
+            pagination['MaxItems'] = max_results
+
+        arns = []
+        async for page in client.get_paginator(list_operation).paginate(**list_kwargs, PaginationConfig=pagination):
+            arns.extend(page.get(arn_result_key, []))
+
+        call = getattr(client, describe_operation)
+        responses = await asyncio.gather(*(
+            call(**{arn_key: list(chunk)}, **describe_kwargs)
+            for chunk in _chunk(list(dict.fromkeys(arns)), _DESCRIBE_LIMITS[describe_operation])
+        ))
+        return list(chain.from_iterable(response.get(result_key, []) for response in responses))
+
+    async def list_services(self, cluster_name: Optional[str] = None,
+                            max_results: Optional[int] = None,
+                            include: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Async version of ECSReader.list_services."""
+        if aioboto3 is None:
+            return await self._run_sync('list_services', cluster_name, max_results, include)
+        try:
+            logger.info("Listing ECS services in cluster: %s", cluster_name or 'default')
+
+            services = await self._list_and_describe(
+                'list_services', 'serviceArns', 'describe_services', 'services', 'services',
+                _kw(cluster=cluster_name), _kw(cluster=cluster_name, include=include), max_results
+            )
+
+            logger.info("Found %d ECS services", len(services))
+            return services
+
+        except ClientError as e:
+            error_message = f"Failed to list ECS services: {e.response['Error']['Message']}"
+            logger.error(error_message)
+            raise AWSResourceError(error_message) from e
+
+    async def list_services_for_clusters(self, cluster_names: List[str],
+                                         include: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List the services of several clusters concurrently.
+
+        At most max_concurrency clusters are enumerated at once.
+
+        Args:
+            cluster_names: Names or ARNs of the clusters
+            include: Extra service details to return: TAGS
+
+        Returns:
+            Dictionary mapping each cluster name to its service configurations
+
+        Raises:
+            AWSResourceError: If listing the services of any cluster fails
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def list_cluster(cluster_name):
+            async with semaphore:
+                return await self.list_services(cluster_name, include=include)
+
+        results = await asyncio.gather(*(list_cluster(name) for name in cluster_names))
+        return dict(zip(cluster_names, results))
+
+    async def list_tasks(self, cluster_name: Optional[str] = None,
+                         service_name: Optional[str] = None,
+                         desired_status: Optional[str] = None,
+                         include: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Async version of ECSReader.list_tasks."""
+        if aioboto3 is None:
+            return await self._run_sync('list_tasks', cluster_name, service_name, desired_status, include)
+        try:
+            logger.info("Listing ECS tasks in cluster: %s", cluster_name or 'default')
+
+            tasks = await self._list_and_describe(
+                'list_tasks', 'taskArns', 'describe_tasks', 'tasks', 'tasks',
+                _kw(cluster=cluster_name, serviceName=service_name, desiredStatus=desired_status),
+                _kw(cluster=cluster_name, include=include)
+            )
+
+            logger.info("Found %d ECS tasks", len(tasks))
+            return tasks
+
+        except ClientError as e:
+            error_message = f"Failed to list ECS tasks: {e.response['Error']['Message']}"
+            logger.error(error_message)
+            raise AWSResourceError(error_message) from e
+
+    async def list_container_instances(self, cluster_name: Optional[str] = None,
+                                       status: Optional[str] = None,
+                                       include: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Async version of ECSReader.list_container_instances."""
+        if aioboto3 is None:
+            return await self._run_sync('list_container_instances', cluster_name, status, include)
+        try:
+            logger.info("Listing ECS container instances in cluster: %s", cluster_name or 'default')
+
+            instances = await self._list_and_describe(
+                'list_container_instances', 'containerInstanceArns',
+                'describe_container_instances', 'containerInstances', 'containerInstances',
+                _kw(cluster=cluster_name, status=status), _kw(cluster=cluster_name, include=include)
+            )
+
+            logger.info("Found %d ECS container instances", len(instances))
+            return instances
+
+        except ClientError as e:
+            error_message = f"Failed to list ECS container instances: {e.response['Error']['Message']}"
+            logger.error(error_message)
+            raise AWSResourceError(error_message) from e
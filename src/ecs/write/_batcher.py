@@ -0,0 +1,124 @@
+"""
+Size- and time-bounded batching for ECS write calls.
+
+Batcher buffers items submitted one at a time, e.g. task ARNs to stop in a
+loop, and hands them to a flush function in batches once max_size items are
+waiting or the oldest has waited max_delay seconds.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class Batcher:
+    """Thread-safe debounce batcher resolving one Future per submitted item."""
+
+    def __init__(self, flush_fn: Callable[[List[Any]], Sequence[Any]],
+                 max_size: int = 100, max_delay: float = 0.3):
+        """
+        Initialize Batcher.
+
+        Args:
+            flush_fn: Called with each batch; returns one result per item, in order.
+                An exception returned in place of a result fails only that item's future
+            max_size: Number of buffered items that triggers a flush
+            max_delay: Seconds the oldest buffered item may wait before a flush
+        """
+        self.flush_fn = flush_fn
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._items: List[Any] = []
+        self._futures: List[Future] = []
+        self._deadline: Optional[float] = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._timer = threading.Thread(target=self._run_timer, name='ecs-batcher', daemon=True)
+        self._timer.start()
+
+    def __enter__(self) -> 'Batcher':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def submit(self, item: Any) -> Future:
+        """
+        Queue an item for the next batch.
+
+        Args:
+            item: Item to pass to flush_fn
+
+        Returns:
+            Future resolved with the item's result, or failed with its exception
+
+        Raises:
+            RuntimeError: If the batcher is closed
+        """
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Batcher is closed")
+            self._items.append(item)
+            self._futures.append(future)
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self.max_delay
+            full = len(self._items) >= self.max_size
+            self._condition.notify()
+        if full:
+            self.flush()
+        return future
+
+    def flush(self) -> int:
+        """
+        Send the buffered items to flush_fn now.
+
+        Returns:
+            Number of items flushed
+        """
+        with self._condition:
+            items, futures = self._items, self._futures
+            self._items, self._futures, self._deadline = [], [], None
+        if not items:
+            return 0
+
+        try:
+            results = list(self.flush_fn(items))
+        except Exception as e:
+            results = [e] * len(items)
+        if len(results) != len(items):
+            logger.error("flush_fn returned %s results for %s items", len(results), len(items))
+            results += [RuntimeError(f"flush_fn returned no result for item {n}")
+                        for n in range(len(results), len(items))]
+        for future, result in zip(futures, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        logger.debug("Flushed batch of %s items", len(items))
+        return len(items)
+
+    def close(self) -> None:
+        """Flush any buffered items and stop the timer thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._timer.join()
+        self.flush()
+
+    def _run_timer(self) -> None:
+        """Flush whenever the oldest buffered item reaches max_delay."""
+        while True:
+            with self._condition:
+                while not self._closed and (
+                    self._deadline is None or self._deadline > time.monotonic()
+                ):
+                    timeout = None if self._deadline is None else self._deadline - time.monotonic()
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+            self.flush()
@@ -0,0 +1,121 @@
+"""
+Circuit breaker for throttled ECS write calls.
+
+Throttling errors that reach ECSWriter have already outlasted botocore's
+adaptive retries, so calling again at once only adds to the throttle.
+CircuitBreaker counts those errors per key, e.g. (profile, region, operation), and
+rejects calls for that key for a cooldown once too many arrive within a
+window. After the cooldown one trial call is let through: success closes
+the circuit, another throttle opens it again.
+
+Thresholds default from the environment so they can be tuned without a
+code change:
+
+    ARGUS_ECS_BREAKER_THRESHOLD  throttles that open a circuit (default 5)
+    ARGUS_ECS_BREAKER_WINDOW     seconds the throttles are counted over (default 10)
+    ARGUS_ECS_BREAKER_COOLDOWN   seconds a circuit stays open (default 10)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Error codes ECS and botocore use for throttled requests
+THROTTLING_ERROR_CODES = frozenset({
+    'ThrottlingException', 'Throttling', 'TooManyRequestsException', 'RequestLimitExceeded',
+})
+
+
+class _Circuit:
+    """Throttle times and open state of one key."""
+
+    __slots__ = ('throttles', 'opened_at', 'trial')
+
+    def __init__(self):
+        self.throttles = deque()
+        self.opened_at: Optional[float] = None
+        self.trial = False
+
+
+class CircuitBreaker:
+    """Thread-safe per-key circuit breaker with a half-open trial call."""
+
+    def __init__(self, threshold: Optional[int] = None, window: Optional[float] = None,
+                 cooldown: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            threshold: Throttles within window that open a circuit
+            window: Seconds over which throttles are counted
+            cooldown: Seconds an open circuit rejects calls before a trial call
+            clock: Monotonic time source
+        """
+        if threshold is None:
+            threshold = int(os.environ.get('ARGUS_ECS_BREAKER_THRESHOLD', 5))
+        if window is None:
+            window = float(os.environ.get('ARGUS_ECS_BREAKER_WINDOW', 10))
+        if cooldown is None:
+            cooldown = float(os.environ.get('ARGUS_ECS_BREAKER_COOLDOWN', 10))
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._clock = clock
+        self._circuits: Dict[Hashable, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: Hashable) -> bool:
+        """
+        Check whether a call for key may go ahead.
+
+        An open circuit past its cooldown lets exactly one trial call through.
+
+        Args:
+            key: Circuit key, e.g. (profile, region, operation)
+
+        Returns:
+            False if the circuit is open
+        """
+        if key not in self._circuits:
+            return True
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.opened_at is None:
+                return True
+            if circuit.trial or self._clock() - circuit.opened_at < self.cooldown:
+                return False
+            circuit.trial = True
+            return True
+
+    def record_success(self, key: Hashable) -> None:
+        """Record a call for key that was not throttled, closing its circuit after a trial call."""
+        if key not in self._circuits:
+            return
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.trial:
+                logger.info("Circuit closed for %s", key)
+                del self._circuits[key]
+
+    def record_throttle(self, key: Hashable) -> None:
+        """Record a throttled call for key, opening its circuit past the threshold."""
+        with self._lock:
+            now = self._clock()
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.trial:
+                circuit.opened_at, circuit.trial = now, False
+                logger.warning("Circuit reopened for %s", key)
+                return
+            circuit.throttles.append(now)
+            while circuit.throttles and now - circuit.throttles[0] > self.window:
+                circuit.throttles.popleft()
+            if circuit.opened_at is None and len(circuit.throttles) >= self.threshold:
+                circuit.opened_at = now
+                circuit.throttles.clear()
+                logger.warning("Circuit opened for %s after %d throttles in %.0fs",
+                               key, self.threshold, self.window)
@@ -4,14 +4,194 @@ ECS Writer Module
 This module provides functionality for creating and managing AWS ECS resources.
 """
 
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
 import logging
-from typing import Dict, List, Optional, Any
-from botocore.exceptions import ClientError
-from common.aws_client import AWSClientManager
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
+from botocore.exceptions import BotoCoreError, ClientError
+from common.aws_client import AWSClientManager, DEFAULT_CLIENT_CONFIG
+from common.cache import ResponseCache
 from common.exceptions import AWSResourceError, ResourceNotFoundError
+from ._batcher import Batcher
+from ._breaker import THROTTLING_ERROR_CODES, CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+# Shared by every ECSWriter, since ECS throttles per account and region
+_breaker = CircuitBreaker()
+
+# Registered task definitions remembered per writer by request content
+_REGISTERED_CACHE_SIZE = 128
+
+# Default worker threads for the *_bulk methods
+_BULK_MAX_WORKERS = 20
+
+# Most tasks a single RunTask call may start
+_RUN_TASK_LIMIT = 10
+
+
+def _request(required: Dict[str, Any], *optional: Tuple[str, Any]) -> Dict[str, Any]:
+    """
+    Build request parameters from the required ones and the optional (name, value)
+    pairs that were given, skipping None, empty and False values.
+    """
+    request = dict(required)
+    for name, value in optional:
+        if value:
+            request[name] = value
+    return request
+
+
+# CreateService request names of the optional create_service arguments
+_SERVICE_PARAMETERS = {
+    'cluster': 'cluster',
+    'launch_type': 'launchType',
+    'capacity_provider_strategy': 'capacityProviderStrategy',
+    'load_balancers': 'loadBalancers',
+    'service_registries': 'serviceRegistries',
+    'network_configuration': 'networkConfiguration',
+    'tags': 'tags',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _service_request_names(fields: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Translate create_service argument names to CreateService request names."""
+    unknown = [field for field in fields if field not in _SERVICE_PARAMETERS]
+    if unknown:
+        raise ValueError(f"Unknown create_service fields: {', '.join(unknown)}")
+    return tuple(_SERVICE_PARAMETERS[field] for field in fields)
+
+
+def _run_task_counts(count: int) -> List[int]:
+    """Split a task count into RunTask-sized counts, e.g. 25 -> [10, 10, 5]."""
+    full, rest = divmod(count, _RUN_TASK_LIMIT)
+    return [_RUN_TASK_LIMIT] * full + ([rest] if rest else [])
+
+
+def _merge_run_task_responses(counts: List[int], results: List[Any]) -> Dict[str, Any]:
+    """
+    Combine the tasks and failures of several RunTask calls.
+    
+    A call that raised is recorded as a failure rather than raised, so the
+    tasks the other calls started are still returned and a caller retrying
+    the shortfall doesn't launch duplicates. The first error is raised only
+    if every call failed.
+    """
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors and len(errors) == len(results):
+        raise errors[0]
+    merged = {'tasks': [], 'failures': []}
+    for chunk_count, result in zip(counts, results):
+        if isinstance(result, Exception):
+            cause = result if isinstance(result, ClientError) else result.__cause__
+            reason = cause.response['Error']['Code'] if isinstance(cause, ClientError) else type(result).__name__
+            merged['failures'].append({'reason': reason,
+                                       'detail': f"RunTask for {chunk_count} tasks failed: {result}"})
+        else:
+            merged['tasks'].extend(result.get('tasks', []))
+            merged['failures'].extend(result.get('failures', []))
+    return merged
+
+
+@contextlib.contextmanager
+def _log_op(message: str, name: str) -> Iterator[None]:
+    """
+    Log one INFO record with the elapsed time once the wrapped call succeeds.
+    
+    Failures are logged by _ecs_call, so nothing is logged here for them.
+    """
+    start = time.perf_counter()
+    yield
+    logger.info("%s: %s (%.1f ms)", message, name, (time.perf_counter() - start) * 1000)
+
+
+def _bulk_executor(count: int, max_workers: int) -> ThreadPoolExecutor:
+    """Create a thread pool for count calls, with no more threads than calls."""
+    return ThreadPoolExecutor(max_workers=max(1, min(count, max_workers)), thread_name_prefix='ecs-writer')
+
+
+def _ecs_call(action: str, not_found: Optional[Tuple[str, str]] = None) -> Callable:
+    """
+    Map an ECSWriter method's ClientErrors, and responses missing the key the
+    method returns, to Argus exceptions.
+    
+    Calls are also counted by the circuit breaker per (profile, region, method):
+    while repeated throttling holds a circuit open, calls fail at once without
+    reaching ECS. Each profile is throttled on its own account's limits, so
+    one profile's circuit never blocks another's calls.
+    
+    Args:
+        action: What the method does, formatted with its arguments for the error
+            message, e.g. 'delete ECS service {service_name}'
+        not_found: (error code, message template) pair raised as ResourceNotFoundError
+        
+    Returns:
+        Decorator for ECSWriter methods
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        
+        def arguments(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return bound.arguments
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            circuit = (args[0]._profile_name, args[0]._region_name, func.__name__)
+            if not _breaker.allow(circuit):
+                error_message = (f"Failed to {action.format(**arguments(args, kwargs))}: "
+                                 "circuit open after repeated throttling")
+                logger.error(error_message)
+                raise AWSResourceError(error_message)
+            throttled = False
+            try:
+                return func(*args, **kwargs)
+            except (ClientError, KeyError) as e:
+                throttled = isinstance(e, ClientError) and e.response['Error']['Code'] in THROTTLING_ERROR_CODES
+                bound_arguments = arguments(args, kwargs)
+                exc_class = AWSResourceError
+                if isinstance(e, KeyError):
+                    error_message = f"Failed to {action.format(**bound_arguments)}: response has no {e} key"
+                elif not_found and e.response['Error']['Code'] == not_found[0]:
+                    exc_class, error_message = ResourceNotFoundError, not_found[1].format(**bound_arguments)
+                else:
+                    error_message = f"Failed to {action.format(**bound_arguments)}: {e.response['Error']['Message']}"
+                logger.error(error_message)
+                raise exc_class(error_message) from e
+            finally:
+                if throttled:
+                    _breaker.record_throttle(circuit)
+                else:
+                    _breaker.record_success(circuit)
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client_manager(profile_name: str, region_name: str) -> AWSClientManager:
+    """
+    Return the AWSClientManager shared by every ECSWriter for a profile and region.
+    
+    Building a manager opens a boto3 session and verifies it with an STS call,
+    so writers reuse one manager, and through it one thread-safe ECS client
+    and connection pool, instead of paying that cost per instance.
+    
+    Args:
+        profile_name: AWS profile name to use for authentication
+        region_name: AWS region name
+        
+    Returns:
+        AWSClientManager memoized per profile and region
+    """
+    return AWSClientManager(profile_name, region_name)
+
 
 class ECSWriter:
     """
@@ -19,19 +199,44 @@ class ECSWriter:
     
     This class provides methods to create, update, and delete ECS clusters,
     services, tasks, and task definitions.
+    
+    Instances use __slots__ to stay small when many writers are kept, one per
+    tenant or region, so attributes outside __slots__ cannot be set on them.
     """
     
+    __slots__ = ('_profile_name', '_region_name', '_client_manager', '_ecs_client', '_registered')
+    
     def __init__(self, profile_name: str = 'default', region_name: str = 'us-east-1'):
         """
         Initialize the ECS writer.
         
+        No AWS session or client is created until the first call that needs one.
+        
         Args:
             profile_name: AWS profile name to use for authentication
             region_name: AWS region name
         """
-        self.client_manager = AWSClientManager(profile_name, region_name)
-        self.ecs_client = self.client_manager.get_client('ecs')
+        self._profile_name = profile_name
+        self._region_name = region_name
+        self._client_manager = None
+        self._ecs_client = None
+        self._registered = ResponseCache(maxsize=_REGISTERED_CACHE_SIZE, ttl=float('inf'))
+    
+    @property
+    def client_manager(self) -> AWSClientManager:
+        """The AWSClientManager shared by writers for this profile and region."""
+        if self._client_manager is None:
+            self._client_manager = _get_client_manager(self._profile_name, self._region_name)
+        return self._client_manager
     
+    @property
+    def ecs_client(self) -> Any:
+        """The ECS client, created on first use."""
+        if self._ecs_client is None:
+            self._ecs_client = self.client_manager.get_client('ecs', config=DEFAULT_CLIENT_CONFIG)
+        return self._ecs_client
+    
+    @_ecs_call('create ECS cluster {cluster_name}')
     def create_cluster(self, cluster_name: str, 
                       capacity_providers: Optional[List[str]] = None,
                       default_capacity_provider_strategy: Optional[List[Dict[str, Any]]] = None,
@@ -51,28 +256,19 @@ class ECSWriter:
         Raises:
             AWSResourceError: If there's an error creating the cluster
         """
-        try:
-            logger.info("Creating ECS cluster: %s", cluster_name)
-            
-            kwargs = {'clusterName': cluster_name}
-            
-            if capacity_providers:
-                kwargs['capacityProviders'] = capacity_providers
-            if default_capacity_provider_strategy:
-                kwargs['defaultCapacityProviderStrategy'] = default_capacity_provider_strategy
-            if tags:
-                kwargs['tags'] = tags
-            
+        kwargs = _request(
+            {'clusterName': cluster_name},
+            ('capacityProviders', capacity_providers),
+            ('defaultCapacityProviderStrategy', default_capacity_provider_strategy),
+            ('tags', tags),
+        )
+        
+        with _log_op("Created ECS cluster", cluster_name):
             response = self.ecs_client.create_cluster(**kwargs)
-            
-            logger.info("Created ECS cluster: %s", cluster_name)
-            return response.get('cluster', {})
-            
-        except ClientError as e:
-            error_message = f"Failed to create ECS cluster {cluster_name}: {e.response['Error']['Message']}"
-            logger.error(error_message)
-            raise AWSResourceError(error_message) from e
+        return response['cluster']
     
+    @_ecs_call('delete ECS cluster {cluster_name}',
+               not_found=('ClusterNotFoundException', 'ECS cluster not found: {cluster_name}'))
     def delete_cluster(self, cluster_name: str) -> Dict[str, Any]:
         """
         Delete an ECS cluster.
@@ -87,25 +283,11 @@ class ECSWriter:
             ResourceNotFoundError: If the cluster doesn't exist
             AWSResourceError: If there's an error deleting the cluster
         """
-        try:
-            logger.info("Deleting ECS cluster: %s", cluster_name)
-            
+        with _log_op("Deleted ECS cluster", cluster_name):
             response = self.ecs_client.delete_cluster(cluster=cluster_name)
-            
-            logger.info("Deleted ECS cluster: %s", cluster_name)
-            return response.get('cluster', {})
-            
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'ClusterNotFoundException':
-                error_message = f"ECS cluster not found: {cluster_name}"
-                logger.error(error_message)
-                raise ResourceNotFoundError(error_message) from e
-            else:
-                error_message = f"Failed to delete ECS cluster {cluster_name}: {e.response['Error']['Message']}"
-                logger.error(error_message)
-                raise AWSResourceError(error_message) from e
+        return response['cluster']
     
+    @_ecs_call('create ECS service {service_name}')
     def create_service(self, service_name: str, task_definition: str,
                       cluster: Optional[str] = None, desired_count: int = 1,
                       launch_type: Optional[str] = None,
@@ -135,40 +317,104 @@ class ECSWriter:
         Raises:
             AWSResourceError: If there's an error creating the service
         """
-        try:
-            logger.info("Creating ECS service: %s", service_name)
+        kwargs = _request(
+            {'serviceName': service_name, 'taskDefinition': task_definition, 'desiredCount': desired_count},
+            ('cluster', cluster),
+            ('launchType', launch_type),
+            ('capacityProviderStrategy', capacity_provider_strategy),
+            ('loadBalancers', load_balancers),
+            ('serviceRegistries', service_registries),
+            ('networkConfiguration', network_configuration),
+            ('tags', tags),
+        )
+        
+        with _log_op("Created ECS service", service_name):
+            response = self.ecs_client.create_service(**kwargs)
+        return response['service']
+    
+    def prepare_create_service(self, fields: Iterable[str]) -> Callable[..., Dict[str, Any]]:
+        """
+        Build a create_service variant for calls that always set the same optional fields.
+        
+        The returned function takes service_name, task_definition and then one
+        value per field, in the order of fields. Every value is sent as given,
+        so none of create_service's per-argument checks run on each call:
+        
+            create = writer.prepare_create_service(('cluster', 'launch_type'))
+            for name in names:
+                create(name, 'web:3', 'prod', 'FARGATE', desired_count=2)
+        
+        Args:
+            fields: Optional create_service argument names, e.g. ('cluster', 'launch_type')
             
-            kwargs = {
-                'serviceName': service_name,
-                'taskDefinition': task_definition,
-                'desiredCount': desired_count
-            }
+        Returns:
+            Function returning the created service configuration
             
-            if cluster:
-                kwargs['cluster'] = cluster
-            if launch_type:
-                kwargs['launchType'] = launch_type
-            if capacity_provider_strategy:
-                kwargs['capacityProviderStrategy'] = capacity_provider_strategy
-            if load_balancers:
-                kwargs['loadBalancers'] = load_balancers
-            if service_registries:
-                kwargs['serviceRegistries'] = service_registries
-            if network_configuration:
-                kwargs['networkConfiguration'] = network_configuration
-            if tags:
-                kwargs['tags'] = tags
+        Raises:
+            ValueError: If a field isn't an optional create_service argument
+        """
+        request_names = _service_request_names(tuple(fields))
+        
+        @_ecs_call('create ECS service {service_name}')
+        def create_service(writer: 'ECSWriter', service_name: str, task_definition: str,
+                           *values: Any, desired_count: int = 1) -> Dict[str, Any]:
+            if len(values) != len(request_names):
+                raise TypeError(f"Expected {len(request_names)} field values, got {len(values)}")
+            with _log_op("Created ECS service", service_name):
+                response = writer.ecs_client.create_service(
+                    serviceName=service_name, taskDefinition=task_definition, desiredCount=desired_count,
+                    **dict(zip(request_names, values))
+                )
+            return response['service']
+        
+        return functools.partial(create_service, self)
+    
+    def create_services_bulk(self, specs: Iterable[Dict[str, Any]],
+                             max_workers: int = _BULK_MAX_WORKERS) -> List[Dict[str, Any]]:
+        """
+        Create many ECS services concurrently.
+        
+        The calls share this writer's client on worker threads; threads beyond
+        the client's max_pool_connections wait for a free connection.
+        
+        Args:
+            specs: create_service keyword arguments, one dictionary per service
+            max_workers: Maximum number of concurrent calls
             
-            response = self.ecs_client.create_service(**kwargs)
+        Returns:
+            Service configurations, in the order of specs
             
-            logger.info("Created ECS service: %s", service_name)
-            return response.get('service', {})
+        Raises:
+            AWSResourceError: If there's an error creating a service
+        """
+        specs = list(specs)
+        with _bulk_executor(len(specs), max_workers) as executor:
+            futures = [executor.submit(self.create_service, **spec) for spec in specs]
+            return [future.result() for future in futures]
+    
+    def iter_create_services(self, specs: Iterable[Dict[str, Any]],
+                             max_workers: int = _BULK_MAX_WORKERS) -> Iterator[Dict[str, Any]]:
+        """
+        Create many ECS services concurrently, yielding each as it is created.
+        
+        Args:
+            specs: create_service keyword arguments, one dictionary per service
+            max_workers: Maximum number of concurrent calls
             
-        except ClientError as e:
-            error_message = f"Failed to create ECS service {service_name}: {e.response['Error']['Message']}"
-            logger.error(error_message)
-            raise AWSResourceError(error_message) from e
+        Yields:
+            Service configurations, in completion order
+            
+        Raises:
+            AWSResourceError: If there's an error creating a service
+        """
+        specs = list(specs)
+        with _bulk_executor(len(specs), max_workers) as executor:
+            futures = [executor.submit(self.create_service, **spec) for spec in specs]
+            for future in as_completed(futures):
+                yield future.result()
     
+    @_ecs_call('update ECS service {service_name}',
+               not_found=('ServiceNotFoundException', 'ECS service not found: {service_name}'))
     def update_service(self, service_name: str, cluster: Optional[str] = None,
                       task_definition: Optional[str] = None,
                       desired_count: Optional[int] = None,
@@ -192,38 +438,22 @@ class ECSWriter:
             ResourceNotFoundError: If the service doesn't exist
             AWSResourceError: If there's an error updating the service
         """
-        try:
-            logger.info("Updating ECS service: %s", service_name)
-            
-            kwargs = {'service': service_name}
-            
-            if cluster:
-                kwargs['cluster'] = cluster
-            if task_definition:
-                kwargs['taskDefinition'] = task_definition
-            if desired_count is not None:
-                kwargs['desiredCount'] = desired_count
-            if capacity_provider_strategy:
-                kwargs['capacityProviderStrategy'] = capacity_provider_strategy
-            if network_configuration:
-                kwargs['networkConfiguration'] = network_configuration
-            
+        kwargs = _request(
+            {'service': service_name},
+            ('cluster', cluster),
+            ('taskDefinition', task_definition),
+            ('capacityProviderStrategy', capacity_provider_strategy),
+            ('networkConfiguration', network_configuration),
+        )
+        if desired_count is not None:
+            kwargs['desiredCount'] = desired_count
+        
+        with _log_op("Updated ECS service", service_name):
             response = self.ecs_client.update_service(**kwargs)
-            
-            logger.info("Updated ECS service: %s", service_name)
-            return response.get('service', {})
-            
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'ServiceNotFoundException':
-                error_message = f"ECS service not found: {service_name}"
-                logger.error(error_message)
-                raise ResourceNotFoundError(error_message) from e
-            else:
-                error_message = f"Failed to update ECS service {service_name}: {e.response['Error']['Message']}"
-                logger.error(error_message)
-                raise AWSResourceError(error_message) from e
+        return response['service']
     
+    @_ecs_call('delete ECS service {service_name}',
+               not_found=('ServiceNotFoundException', 'ECS service not found: {service_name}'))
     def delete_service(self, service_name: str, cluster: Optional[str] = None,
                       force: bool = False) -> Dict[str, Any]:
         """
@@ -241,42 +471,33 @@ class ECSWriter:
             ResourceNotFoundError: If the service doesn't exist
             AWSResourceError: If there's an error deleting the service
         """
-        try:
-            logger.info("Deleting ECS service: %s", service_name)
-            
-            kwargs = {'service': service_name}
-            
-            if cluster:
-                kwargs['cluster'] = cluster
-            if force:
-                kwargs['force'] = force
-            
+        kwargs = _request(
+            {'service': service_name},
+            ('cluster', cluster),
+            ('force', force),
+        )
+        
+        with _log_op("Deleted ECS service", service_name):
             response = self.ecs_client.delete_service(**kwargs)
-            
-            logger.info("Deleted ECS service: %s", service_name)
-            return response.get('service', {})
-            
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'ServiceNotFoundException':
-                error_message = f"ECS service not found: {service_name}"
-                logger.error(error_message)
-                raise ResourceNotFoundError(error_message) from e
-            else:
-                error_message = f"Failed to delete ECS service {service_name}: {e.response['Error']['Message']}"
-                logger.error(error_message)
-                raise AWSResourceError(error_message) from e
+        return response['service']
     
+    @_ecs_call('register ECS task definition {family}')
     def register_task_definition(self, family: str, container_definitions: List[Dict[str, Any]],
                                 requires_compatibilities: Optional[List[str]] = None,
                                 network_mode: Optional[str] = None,
                                 cpu: Optional[str] = None, memory: Optional[str] = None,
                                 execution_role_arn: Optional[str] = None,
                                 task_role_arn: Optional[str] = None,
-                                tags: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+                                tags: Optional[List[Dict[str, str]]] = None,
+                                reuse_identical: bool = False) -> Dict[str, Any]:
         """
         Register a new ECS task definition.
         
+        Task definitions are immutable, so with reuse_identical a request
+        identical to one this writer already registered returns that revision
+        instead of registering a new one, provided it is still the family's
+        latest active revision; otherwise a new revision is registered.
+        
         Args:
             family: Family name for the task definition
             container_definitions: List of container definitions
@@ -287,6 +508,9 @@ class ECSWriter:
             execution_role_arn: Task execution role ARN
             task_role_arn: Task role ARN
             tags: Resource tags
+            reuse_identical: Whether to return the revision already registered for
+                an identical request, if it is still the family's latest, instead of
+                registering a new one
             
         Returns:
             Task definition configuration
@@ -294,39 +518,40 @@ class ECSWriter:
         Raises:
             AWSResourceError: If there's an error registering the task definition
         """
+        kwargs = _request(
+            {'family': family, 'containerDefinitions': container_definitions},
+            ('requiresCompatibilities', requires_compatibilities),
+            ('networkMode', network_mode),
+            ('cpu', cpu),
+            ('memory', memory),
+            ('executionRoleArn', execution_role_arn),
+            ('taskRoleArn', task_role_arn),
+            ('tags', tags),
+        )
+        
+        fingerprint = hashlib.sha256(json.dumps(kwargs, sort_keys=True, default=str).encode()).hexdigest()
+        if reuse_identical:
+            registered = self._registered.get(fingerprint)
+            if registered is not None and self._is_latest_revision(registered):
+                logger.info("Reused ECS task definition: %s", registered['taskDefinitionArn'])
+                return registered
+        
+        with _log_op("Registered ECS task definition", family):
+            task_definition = self.ecs_client.register_task_definition(**kwargs)['taskDefinition']
+        self._registered.set(fingerprint, task_definition)
+        return task_definition
+    
+    def _is_latest_revision(self, task_definition: Dict[str, Any]) -> bool:
+        """Check that a task definition is still its family's latest active revision."""
         try:
-            logger.info("Registering ECS task definition: %s", family)
-            
-            kwargs = {
-                'family': family,
-                'containerDefinitions': container_definitions
-            }
-            
-            if requires_compatibilities:
-                kwargs['requiresCompatibilities'] = requires_compatibilities
-            if network_mode:
-                kwargs['networkMode'] = network_mode
-            if cpu:
-                kwargs['cpu'] = cpu
-            if memory:
-                kwargs['memory'] = memory
-            if execution_role_arn:
-                kwargs['executionRoleArn'] = execution_role_arn
-            if task_role_arn:
-                kwargs['taskRoleArn'] = task_role_arn
-            if tags:
-                kwargs['tags'] = tags
-            
-            response = self.ecs_client.register_task_definition(**kwargs)
-            
-            logger.info("Registered ECS task definition: %s", family)
-            return response.get('taskDefinition', {})
-            
+            latest = self.ecs_client.describe_task_definition(taskDefinition=task_definition['family'])
         except ClientError as e:
-            error_message = f"Failed to register ECS task definition {family}: {e.response['Error']['Message']}"
-            logger.error(error_message)
-            raise AWSResourceError(error_message) from e
+            logger.debug("Could not describe family %s: %s", task_definition['family'], e)
+            return False
+        return latest['taskDefinition']['taskDefinitionArn'] == task_definition['taskDefinitionArn']
     
+    @_ecs_call('deregister ECS task definition {task_definition}',
+               not_found=('ClientException', 'ECS task definition not found: {task_definition}'))
     def deregister_task_definition(self, task_definition: str) -> Dict[str, Any]:
         """
         Deregister an ECS task definition.
@@ -341,25 +566,14 @@ class ECSWriter:
             ResourceNotFoundError: If the task definition doesn't exist
             AWSResourceError: If there's an error deregistering the task definition
         """
-        try:
-            logger.info("Deregistering ECS task definition: %s", task_definition)
-            
+        with _log_op("Deregistered ECS task definition", task_definition):
             response = self.ecs_client.deregister_task_definition(taskDefinition=task_definition)
-            
-            logger.info("Deregistered ECS task definition: %s", task_definition)
-            return response.get('taskDefinition', {})
-            
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'ClientException':
-                error_message = f"ECS task definition not found: {task_definition}"
-                logger.error(error_message)
-                raise ResourceNotFoundError(error_message) from e
-            else:
-                error_message = f"Failed to deregister ECS task definition {task_definition}: {e.response['Error']['Message']}"
-                logger.error(error_message)
-                raise AWSResourceError(error_message) from e
+            self._registered.discard(lambda key, registered: task_definition in (
+                registered.get('taskDefinitionArn'), f"{registered.get('family')}:{registered.get('revision')}"
+            ))
+        return response['taskDefinition']
     
+    @_ecs_call('run ECS task {task_definition}')
     def run_task(self, task_definition: str, cluster: Optional[str] = None,
                 count: int = 1, launch_type: Optional[str] = None,
                 capacity_provider_strategy: Optional[List[Dict[str, Any]]] = None,
@@ -369,6 +583,11 @@ class ECSWriter:
         """
         Run a task using an ECS task definition.
         
+        RunTask starts at most 10 tasks per call, so larger counts are sent
+        as concurrent calls of up to 10 whose tasks and failures are merged.
+        A call that fails is reported in failures, next to the tasks the
+        other calls started; the error is raised only if every call fails.
+        
         Args:
             task_definition: Task definition to run
             cluster: Cluster to run the task in
@@ -385,37 +604,34 @@ class ECSWriter:
         Raises:
             AWSResourceError: If there's an error running the task
         """
-        try:
-            logger.info("Running ECS task: %s", task_definition)
-            
-            kwargs = {
-                'taskDefinition': task_definition,
-                'count': count
-            }
-            
-            if cluster:
-                kwargs['cluster'] = cluster
-            if launch_type:
-                kwargs['launchType'] = launch_type
-            if capacity_provider_strategy:
-                kwargs['capacityProviderStrategy'] = capacity_provider_strategy
-            if network_configuration:
-                kwargs['networkConfiguration'] = network_configuration
-            if overrides:
-                kwargs['overrides'] = overrides
-            if tags:
-                kwargs['tags'] = tags
-            
-            response = self.ecs_client.run_task(**kwargs)
-            
-            logger.info("Started ECS task: %s", task_definition)
-            return response
-            
-        except ClientError as e:
-            error_message = f"Failed to run ECS task {task_definition}: {e.response['Error']['Message']}"
-            logger.error(error_message)
-            raise AWSResourceError(error_message) from e
+        kwargs = _request(
+            {'taskDefinition': task_definition},
+            ('cluster', cluster),
+            ('launchType', launch_type),
+            ('capacityProviderStrategy', capacity_provider_strategy),
+            ('networkConfiguration', network_configuration),
+            ('overrides', overrides),
+            ('tags', tags),
+        )
+        
+        with _log_op("Started ECS task", task_definition):
+            counts = _run_task_counts(count)
+            if len(counts) <= 1:
+                response = self.ecs_client.run_task(count=count, **kwargs)
+            else:
+                def run_chunk(chunk_count: int) -> Any:
+                    try:
+                        return self.ecs_client.run_task(count=chunk_count, **kwargs)
+                    except (ClientError, BotoCoreError) as e:
+                        logger.error("RunTask for %s tasks of %s failed: %s", chunk_count, task_definition, e)
+                        return e
+                
+                with _bulk_executor(len(counts), _BULK_MAX_WORKERS) as executor:
+                    response = _merge_run_task_responses(counts, list(executor.map(run_chunk, counts)))
+        return response
     
+    @_ecs_call('stop ECS task {task_arn}',
+               not_found=('TaskNotFoundException', 'ECS task not found: {task_arn}'))
     def stop_task(self, task_arn: str, cluster: Optional[str] = None,
                  reason: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -433,31 +649,73 @@ class ECSWriter:
             ResourceNotFoundError: If the task doesn't exist
             AWSResourceError: If there's an error stopping the task
         """
-        try:
-            logger.info("Stopping ECS task: %s", task_arn)
-            
-            kwargs = {'task': task_arn}
-            
-            if cluster:
-                kwargs['cluster'] = cluster
-            if reason:
-                kwargs['reason'] = reason
-            
+        kwargs = _request(
+            {'task': task_arn},
+            ('cluster', cluster),
+            ('reason', reason),
+        )
+        
+        with _log_op("Stopped ECS task", task_arn):
             response = self.ecs_client.stop_task(**kwargs)
+        return response['task']
+    
+    def stop_tasks_bulk(self, task_arns: Iterable[str], cluster: Optional[str] = None,
+                        reason: Optional[str] = None, max_workers: int = _BULK_MAX_WORKERS,
+                        return_exceptions: bool = False) -> List[Any]:
+        """
+        Stop many ECS tasks concurrently.
+        
+        StopTask takes one task per call, so the calls are fanned out on
+        worker threads sharing this writer's client.
+        
+        Args:
+            task_arns: ARNs of the tasks to stop
+            cluster: Cluster the tasks are running in
+            reason: Reason for stopping the tasks
+            max_workers: Maximum number of concurrent calls
+            return_exceptions: Return each failed stop's exception in place of its
+                task configuration instead of raising the first one
             
-            logger.info("Stopped ECS task: %s", task_arn)
-            return response.get('task', {})
+        Returns:
+            Task configurations, in the order of task_arns
             
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'TaskNotFoundException':
-                error_message = f"ECS task not found: {task_arn}"
-                logger.error(error_message)
-                raise ResourceNotFoundError(error_message) from e
-            else:
-                error_message = f"Failed to stop ECS task {task_arn}: {e.response['Error']['Message']}"
-                logger.error(error_message)
-                raise AWSResourceError(error_message) from e
+        Raises:
+            ResourceNotFoundError: If a task doesn't exist
+            AWSResourceError: If there's an error stopping a task
+        """
+        def stop(task_arn: str) -> Any:
+            try:
+                return self.stop_task(task_arn, cluster, reason)
+            except AWSResourceError as e:
+                if not return_exceptions:
+                    raise
+                return e
+        
+        task_arns = list(task_arns)
+        with _bulk_executor(len(task_arns), max_workers) as executor:
+            return list(executor.map(stop, task_arns))
+    
+    def task_stopper(self, cluster: Optional[str] = None, reason: Optional[str] = None,
+                     max_size: int = 100, max_delay: float = 0.3) -> Batcher:
+        """
+        Create a Batcher that stops submitted task ARNs in concurrent batches.
+        
+        Use it as a context manager so the last batch is flushed on exit:
+        
+            with writer.task_stopper('prod') as stopper:
+                futures = [stopper.submit(arn) for arn in task_arns]
+        
+        Args:
+            cluster: Cluster the tasks are running in
+            reason: Reason for stopping the tasks
+            max_size: Number of queued ARNs that triggers a batch
+            max_delay: Seconds the oldest queued ARN may wait for its batch
+            
+        Returns:
+            Batcher whose futures resolve to the stopped task configurations
+        """
+        return Batcher(lambda task_arns: self.stop_tasks_bulk(task_arns, cluster, reason, return_exceptions=True),
+                       max_size=max_size, max_delay=max_delay)
     
     def scale_service(self, service_name: str, cluster: str, desired_count: int) -> Dict[str, Any]:
         """
@@ -0,0 +1,363 @@
+"""
+Async ECS Writer Module
+
+AsyncECSWriter mirrors the public methods of ECSWriter as coroutines so that
+many writes can be awaited together with asyncio.gather. Requests go through
+a long-lived aioboto3 client when the async extra is installed; without
+aioboto3 they fall back to ECSWriter's boto3 client run in worker threads.
+in_regions runs one method in several regions at once over a shared session.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Any, Tuple
+from botocore.exceptions import ClientError
+
+from common.aws_client import DEFAULT_CLIENT_CONFIG
+from common.threads import THREAD_LIMIT, capacity_limiter, run_sync_limited
+from common.exceptions import AWSResourceError, ResourceNotFoundError
+from .ecs_writer import ECSWriter, _log_op, _merge_run_task_responses, _request, _run_task_counts
+
+try:
+    import aioboto3
+except ImportError:  # optional: pip install argus-aws[async]
+    aioboto3 = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncECSWriter:
+    """Async ECS write operations using aioboto3, or ECSWriter in worker threads."""
+    
+    def __init__(self, profile_name: str = 'default', region_name: str = 'us-east-1',
+                 max_threads: int = THREAD_LIMIT):
+        """
+        Initialize the async ECS writer.
+        
+        Args:
+            profile_name: AWS profile name to use for authentication
+            region_name: AWS region name
+            max_threads: Worker threads the boto3 fallback may use at once
+        """
+        self.profile_name = profile_name
+        self.region_name = region_name
+        self.max_threads = max_threads
+        self._limiter = None
+        self._session = None
+        self._regional_writers = {}
+        self._client_context = None
+        self._client = None
+        self._lock = None
+        self._sync_writer = None
+    
+    async def __aenter__(self) -> 'AsyncECSWriter':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    async def _get_client(self):
+        """
+        Get or create the long-lived aioboto3 ECS client.
+        
+        Returns:
+            aioboto3 ECS client
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._client is None:
+                if self._session is None:
+                    self._session = aioboto3.Session(profile_name=self.profile_name)
+                context = self._session.client('ecs', region_name=self.region_name, config=DEFAULT_CLIENT_CONFIG)
+                self._client = await context.__aenter__()
+                self._client_context = context
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the aioboto3 ECS client and those opened by in_regions."""
+        writers, self._regional_writers = list(self._regional_writers.values()), {}
+        await asyncio.gather(*(writer.aclose() for writer in writers))
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+            self._client_context = None
+            self._client = None
+        if isinstance(self._limiter, Executor):
+            # Without anyio the limiter is a thread pool owned by this writer
+            self._limiter.shutdown(wait=False)
+        self._limiter = None
+    
+    def _for_region(self, region_name: str) -> 'AsyncECSWriter':
+        """Return the writer for a region, sharing this writer's session."""
+        if region_name == self.region_name:
+            return self
+        writer = self._regional_writers.get(region_name)
+        if writer is None:
+            if aioboto3 is not None and self._session is None:
+                self._session = aioboto3.Session(profile_name=self.profile_name)
+            writer = AsyncECSWriter(self.profile_name, region_name, self.max_threads)
+            writer._session = self._session
+            self._regional_writers[region_name] = writer
+        return writer
+    
+    async def in_regions(self, regions: List[str], method: str, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Run one AsyncECSWriter method in several regions concurrently.
+        
+        Each region gets its own long-lived client, created from this writer's
+        session and closed by aclose:
+        
+            await writer.in_regions(['us-east-1', 'eu-west-1'], 'delete_service', 'web', 'prod')
+        
+        Args:
+            regions: AWS region names
+            method: AsyncECSWriter method name, e.g. 'delete_service'
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+            
+        Returns:
+            Dictionary mapping each region to the method's result
+            
+        Raises:
+            ResourceNotFoundError: If the method raises it in any region
+            AWSResourceError: If the method fails in any region
+        """
+        results = await asyncio.gather(*(
+            getattr(self._for_region(region), method)(*args, **kwargs) for region in regions
+        ))
+        return dict(zip(regions, results))
+    
+    async def _call_in_thread(self, func, **params) -> Any:
+        """Run a blocking boto3 call in a worker thread held by this writer's limiter."""
+        if self._limiter is None:
+            self._limiter = capacity_limiter(self.max_threads)
+        return await run_sync_limited(self._limiter, func, **params)
+    
+    async def _call(self, operation: str, description: str,
+                    not_found: Optional[Tuple[str, str]] = None,
+                    result_key: Optional[str] = None, **params) -> Any:
+        """
+        Await one ECS API call and map its errors like ECSWriter does.
+        
+        Args:
+            operation: Client method name, e.g. 'create_service'
+            description: What the call does, used in error messages
+            not_found: (error code, message) pair raised as ResourceNotFoundError
+            result_key: Response key to return instead of the whole response
+            **params: Request parameters
+        
+        Returns:
+            The API response, or its result_key value
+        
+        Raises:
+            ResourceNotFoundError: If the call fails with the not_found error code
+            AWSResourceError: If the call fails or the response has no result_key
+        """
+        try:
+            if aioboto3 is None:
+                if self._sync_writer is None:
+                    self._sync_writer = ECSWriter(self.profile_name, self.region_name)
+                response = await self._call_in_thread(getattr(self._sync_writer.ecs_client, operation), **params)
+            else:
+                client = await self._get_client()
+                response = await getattr(client, operation)(**params)
+            return response if result_key is None else response[result_key]
+        except KeyError as e:
+            error_message = f"Failed to {description}: response has no {e} key"
+            logger.error(error_message)
+            raise AWSResourceError(error_message) from e
+        except ClientError as e:
+            error = e.response['Error']
+            if not_found and error['Code'] == not_found[0]:
+                logger.error(not_found[1])
+                raise ResourceNotFoundError(not_found[1]) from e
+            error_message = f"Failed to {description}: {error['Message']}"
+            logger.error(error_message)
+            raise AWSResourceError(error_message) from e
+    
+    async def create_cluster(self, cluster_name: str,
+                             capacity_providers: Optional[List[str]] = None,
+                             default_capacity_provider_strategy: Optional[List[Dict[str, Any]]] = None,
+                             tags: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+        """Async version of ECSWriter.create_cluster."""
+        params = _request(
+            {'clusterName': cluster_name},
+            ('capacityProviders', capacity_providers),
+            ('defaultCapacityProviderStrategy', default_capacity_provider_strategy),
+            ('tags', tags),
+        )
+        with _log_op("Created ECS cluster", cluster_name):
+            response = await self._call('create_cluster', f"create ECS cluster {cluster_name}",
+                                        result_key='cluster', **params)
+        return response
+    
+    async def delete_cluster(self, cluster_name: str) -> Dict[str, Any]:
+        """Async version of ECSWriter.delete_cluster."""
+        with _log_op("Deleted ECS cluster", cluster_name):
+            response = await self._call('delete_cluster', f"delete ECS cluster {cluster_name}",
+                                        ('ClusterNotFoundException', f"ECS cluster not found: {cluster_name}"),
+                                        cluster=cluster_name, result_key='cluster')
+        return response
+    
+    async def create_service(self, service_name: str, task_definition: str,
+                             cluster: Optional[str] = None, desired_count: int = 1,
+                             launch_type: Optional[str] = None,
+                             capacity_provider_strategy: Optional[List[Dict[str, Any]]] = None,
+                             load_balancers: Optional[List[Dict[str, Any]]] = None,
+                             service_registries: Optional[List[Dict[str, Any]]] = None,
+                             network_configuration: Optional[Dict[str, Any]] = None,
+                             tags: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+        """Async version of ECSWriter.create_service."""
+        params = _request(
+            {'serviceName': service_name, 'taskDefinition': task_definition, 'desiredCount': desired_count},
+            ('cluster', cluster),
+            ('launchType', launch_type),
+            ('capacityProviderStrategy', capacity_provider_strategy),
+            ('loadBalancers', load_balancers),
+            ('serviceRegistries', service_registries),
+            ('networkConfiguration', network_configuration),
+            ('tags', tags),
+        )
+        with _log_op("Created ECS service", service_name):
+            response = await self._call('create_service', f"create ECS service {service_name}",
+                                        result_key='service', **params)
+        return response
+    
+    async def update_service(self, service_name: str, cluster: Optional[str] = None,
+                             task_definition: Optional[str] = None,
+                             desired_count: Optional[int] = None,
+                             capacity_provider_strategy: Optional[List[Dict[str, Any]]] = None,
+                             network_configuration: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Async version of ECSWriter.update_service."""
+        params = _request(
+            {'service': service_name},
+            ('cluster', cluster),
+            ('taskDefinition', task_definition),
+            ('capacityProviderStrategy', capacity_provider_strategy),
+            ('networkConfiguration', network_configuration),
+        )
+        if desired_count is not None:
+            params['desiredCount'] = desired_count
+        with _log_op("Updated ECS service", service_name):
+            response = await self._call('update_service', f"update ECS service {service_name}",
+                                        ('ServiceNotFoundException', f"ECS service not found: {service_name}"),
+                                        result_key='service', **params)
+        return response
+    
+    async def delete_service(self, service_name: str, cluster: Optional[str] = None,
+                             force: bool = False) -> Dict[str, Any]:
+        """Async version of ECSWriter.delete_service."""
+        params = _request(
+            {'service': service_name},
+            ('cluster', cluster),
+            ('force', force),
+        )
+        with _log_op("Deleted ECS service", service_name):
+            response = await self._call('delete_service', f"delete ECS service {service_name}",
+                                        ('ServiceNotFoundException', f"ECS service not found: {service_name}"),
+                                        result_key='service', **params)
+        return response
+    
+    async def register_task_definition(self, family: str, container_definitions: List[Dict[str, Any]],
+                                       requires_compatibilities: Optional[List[str]] = None,
+                                       network_mode: Optional[str] = None,
+                                       cpu: Optional[str] = None, memory: Optional[str] = None,
+                                       execution_role_arn: Optional[str] = None,
+                                       task_role_arn: Optional[str] = None,
+                                       tags: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+        """Async version of ECSWriter.register_task_definition."""
+        params = _request(
+            {'family': family, 'containerDefinitions': container_definitions},
+            ('requiresCompatibilities', requires_compatibilities),
+            ('networkMode', network_mode),
+            ('cpu', cpu),
+            ('memory', memory),
+            ('executionRoleArn', execution_role_arn),
+            ('taskRoleArn', task_role_arn),
+            ('tags', tags),
+        )
+        with _log_op("Registered ECS task definition", family):
+            response = await self._call('register_task_definition', f"register ECS task definition {family}",
+                                        result_key='taskDefinition', **params)
+        return response
+    
+    async def deregister_task_definition(self, task_definition: str) -> Dict[str, Any]:
+        """Async version of ECSWriter.deregister_task_definition."""
+        with _log_op("Deregistered ECS task definition", task_definition):
+            response = await self._call('deregister_task_definition',
+                                        f"deregister ECS task definition {task_definition}",
+                                        ('ClientException', f"ECS task definition not found: {task_definition}"),
+                                        taskDefinition=task_definition, result_key='taskDefinition')
+        return response
+    
+    async def run_task(self, task_definition: str, cluster: Optional[str] = None,
+                       count: int = 1, launch_type: Optional[str] = None,
+                       capacity_provider_strategy: Optional[List[Dict[str, Any]]] = None,
+                       network_configuration: Optional[Dict[str, Any]] = None,
+                       overrides: Optional[Dict[str, Any]] = None,
+                       tags: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+        """Async version of ECSWriter.run_task."""
+        params = _request(
+            {'taskDefinition': task_definition},
+            ('cluster', cluster),
+            ('launchType', launch_type),
+            ('capacityProviderStrategy', capacity_provider_strategy),
+            ('networkConfiguration', network_configuration),
+            ('overrides', overrides),
+            ('tags', tags),
+        )
+        with _log_op("Started ECS task", task_definition):
+            counts = _run_task_counts(count)
+            if len(counts) <= 1:
+                response = await self._call('run_task', f"run ECS task {task_definition}", count=count, **params)
+            else:
+                results = await asyncio.gather(*(
+                    self._call('run_task', f"run ECS task {task_definition}", count=chunk_count, **params)
+                    for chunk_count in counts
+                ), return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException) and not isinstance(result, AWSResourceError):
+                        raise result
+                response = _merge_run_task_responses(counts, results)
+        return response
+    
+    async def stop_task(self, task_arn: str, cluster: Optional[str] = None,
+                        reason: Optional[str] = None) -> Dict[str, Any]:
+        """Async version of ECSWriter.stop_task."""
+        params = _request(
+            {'task': task_arn},
+            ('cluster', cluster),
+            ('reason', reason),
+        )
+        with _log_op("Stopped ECS task", task_arn):
+            response = await self._call('stop_task', f"stop ECS task {task_arn}",
+                                        ('TaskNotFoundException', f"ECS task not found: {task_arn}"),
+                                        result_key='task', **params)
+        return response
+    
+    async def scale_service(self, service_name: str, cluster: str, desired_count: int) -> Dict[str, Any]:
+        """Async version of ECSWriter.scale_service."""
+        return await self.update_service(service_name=service_name, cluster=cluster,
+                                         desired_count=desired_count)
+    
+    async def scale_up(self, service_name: str, cluster: str, increment: int = 1) -> Dict[str, Any]:
+        """Async version of ECSWriter.scale_up."""
+        current_count = await self._desired_count(service_name, cluster)
+        return await self.scale_service(service_name, cluster, current_count + increment)
+    
+    async def scale_down(self, service_name: str, cluster: str, decrement: int = 1) -> Dict[str, Any]:
+        """Async version of ECSWriter.scale_down."""
+        current_count = await self._desired_count(service_name, cluster)
+        return await self.scale_service(service_name, cluster, max(0, current_count - decrement))
+    
+    async def _desired_count(self, service_name: str, cluster: str) -> int:
+        """Return a service's current desired task count."""
+        response = await self._call('describe_services', f"describe ECS service {service_name}",
+                                    services=[service_name], cluster=cluster)
+        services = response.get('services', [])
+        if not services:
+            error_message = f"ECS service not found: {service_name}"
+            logger.error(error_message)
+            raise ResourceNotFoundError(error_message)
+        return services[0].get('desiredCount', 0)
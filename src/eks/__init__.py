@@ -2,10 +2,25 @@
 Elastic Kubernetes Service (EKS) module for AWS resource exploration.
 
 This module provides read and write operations for AWS EKS clusters,
-node groups, Fargate profiles, and add-ons.
+node groups, Fargate profiles, and add-ons. The reader and writer are
+imported on first access, so using one does not load the other.
 """
 
-from .read.eks_reader import EKSReader
-from .write.eks_writer import EKSWriter
+import importlib
 
-__all__ = ['EKSReader', 'EKSWriter']
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'EKSReader': '.read.eks_reader',
+    'AsyncEKSReader': '.read.eks_reader_async',
+    'EKSWriter': '.write.eks_writer',
+}
+
+__all__ = ['EKSReader', 'AsyncEKSReader', 'EKSWriter']
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -3,68 +3,211 @@ Elastic Kubernetes Service Reader for AWS resource exploration.
 
 This module provides read-only operations for AWS EKS resources
 including clusters, node groups, Fargate profiles, and add-ons.
+
+Importing EKSReader does not import boto3: common.aws_client, and with it
+boto3's session machinery, is loaded when the client is first created.
+Only botocore.exceptions is imported up front, for the except clauses.
 """
 
+import base64
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import Callable, Hashable, Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from botocore.exceptions import ClientError
+from cachetools.keys import hashkey
+from common.cache import ResponseCache
+from common.disk_cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
+# Largest page EKS list operations return
+_PAGE_SIZE = 100
+
+# Directory for the opt-in disk cache, under <profile>/<region>
+_DISK_CACHE_DIR = '~/.cache/argus/eks'
+
+# Worker threads for the *_bulk describes
+_MAX_WORKERS = 16
+
+# Seconds to cache the add-on version catalog, which rarely changes
+_ADDON_VERSIONS_TTL = 300
+
+# Error codes EKS uses for a missing resource
+_NOT_FOUND = frozenset({'ResourceNotFoundException', 'NotFoundException'})
+
+# Cluster auth tokens are accepted for 15 minutes; like `aws eks get-token`,
+# treat them as valid for 14 and refresh once less than a minute is left
+_TOKEN_LIFETIME = 14 * 60
+_TOKEN_REFRESH_MARGIN = 60
+_TOKEN_PREFIX = 'k8s-aws-v1.'
+_CLUSTER_ID_HEADER = 'x-k8s-aws-id'
+
+
+def _code(e: ClientError) -> Optional[str]:
+    """Return a ClientError's error code, or None if the response has none."""
+    return (e.response or {}).get('Error', {}).get('Code')
+
+
+def _retain_cluster_id(params, context, **kwargs):
+    """Move the cluster name out of GetCallerIdentity's params so validation passes."""
+    if _CLUSTER_ID_HEADER in params:
+        context[_CLUSTER_ID_HEADER] = params.pop(_CLUSTER_ID_HEADER)
+
+
+def _add_cluster_id_header(request, **kwargs):
+    """Sign the cluster name into the presigned GetCallerIdentity URL."""
+    if _CLUSTER_ID_HEADER in request.context:
+        request.headers[_CLUSTER_ID_HEADER] = request.context[_CLUSTER_ID_HEADER]
+
 
 class EKSReader:
     """Reader class for AWS EKS resources."""
     
-    def __init__(self, client_manager):
+    def __init__(self, client_manager, cache_ttl: float = 60, disk_cache_ttl: Optional[float] = None):
         """
         Initialize EKS Reader.
         
         Args:
             client_manager: AWS client manager instance
+            cache_ttl: Seconds to cache cluster, Fargate profile and add-on descriptions
+            disk_cache_ttl: If set, also keep list and describe responses for this many
+                seconds under ~/.cache/argus/eks, so later processes can reuse them
         """
         self.client_manager = client_manager
         self._client = None
+        self._disk_cache = None
+        if disk_cache_ttl:
+            self._disk_cache = DiskCache(
+                os.path.join(_DISK_CACHE_DIR, str(client_manager.profile_name),
+                             str(client_manager.get_current_region())),
+                ttl=disk_cache_ttl
+            )
+        self._cache = ResponseCache(maxsize=512, ttl=cache_ttl)
+        self._addon_versions = ResponseCache(maxsize=128, ttl=_ADDON_VERSIONS_TTL)
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._oidc_issuers: Dict[str, str] = {}
+        self._executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix='eks-reader')
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._in_flight_lock = threading.Lock()
     
     @property
     def client(self):
-        """Get or create the EKS client."""
+        """Get or create the EKS client, pooled with keep-alive and adaptive retries."""
         if self._client is None:
-            self._client = self.client_manager.get_client('eks')
+            from common.aws_client import DEFAULT_CLIENT_CONFIG
+            self._client = self.client_manager.get_client('eks', config=DEFAULT_CLIENT_CONFIG)
         return self._client
     
-    def list_clusters(self) -> List[str]:
+    def invalidate(self, cluster_name: str) -> int:
         """
-        List all EKS cluster names.
+        Drop the cached descriptions of a cluster and its resources, e.g. after
+        changing them with EKSWriter.
         
+        Args:
+            cluster_name: Name of the cluster
+            
         Returns:
-            List of cluster names
+            Number of cached descriptions dropped
+        """
+        self._oidc_issuers.pop(cluster_name, None)
+        dropped = self._cache.discard(lambda key, value: key[1] == cluster_name)
+        if self._disk_cache is not None:
+            dropped += self._disk_cache.discard(lambda key, value: key[1] == cluster_name)
+        return dropped
+    
+    def clear_cache(self) -> None:
+        """Drop all cached describe responses, including add-on versions and the disk cache."""
+        self._cache.clear()
+        self._addon_versions.clear()
+        self._oidc_issuers.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+    
+    def _fetch(self, key: tuple, loader: Callable[[], Any], use_cache: bool = True) -> Any:
+        """Call the loader through the disk cache, if one is enabled."""
+        if self._disk_cache is None:
+            return loader()
+        return self._disk_cache.get_or_load(key, loader, use_cache)
+    
+    def close(self) -> None:
+        """
+        Shut down the worker threads and close the EKS client.
+        
+        The *_bulk describes can't be used after closing.
+        """
+        self._executor.shutdown(wait=True)
+        if self._client is not None:
+            from common.aws_client import DEFAULT_CLIENT_CONFIG
+            self.client_manager.close_client('eks', config=DEFAULT_CLIENT_CONFIG)
+            self._client = None
+    
+    def _paginate(self, operation: str, result_key: str, **params) -> Iterator[Any]:
+        """
+        Yield the items of every page of a paginated EKS operation.
+        
+        Args:
+            operation: Client method name, e.g. 'list_nodegroups'
+            result_key: Response key holding the items
+            **params: Request parameters
+            
+        Returns:
+            Iterator over the items, fetching pages as it advances
+        """
+        pages = self.client.get_paginator(operation).paginate(
+            **params, PaginationConfig={'PageSize': _PAGE_SIZE}
+        )
+        return chain.from_iterable(page.get(result_key, []) for page in pages)
+    
+    def iter_clusters(self) -> Iterator[str]:
+        """
+        Iterate over all EKS cluster names, one page at a time.
+        
+        Yields:
+            Cluster names
         """
         try:
-            logger.info("Listing EKS clusters")
-            response = self.client.list_clusters()
-            clusters = response.get('clusters', [])
-            logger.info("Found %d clusters", len(clusters))
-            return clusters
+            yield from self._paginate('list_clusters', 'clusters')
         except ClientError as e:
             logger.error("Error listing clusters: %s", e)
             raise
     
-    def describe_cluster(self, cluster_name: str) -> Optional[Dict[str, Any]]:
+    def list_clusters(self) -> List[str]:
+        """
+        List all EKS cluster names, reading every page.
+        
+        Returns:
+            List of cluster names
+        """
+        clusters = self._fetch(('list_clusters', None), lambda: list(self.iter_clusters()))
+        logger.debug("Found %d clusters", len(clusters))
+        return clusters
+    
+    def describe_cluster(self, cluster_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a specific cluster.
         
         Args:
             cluster_name: Name of the cluster
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             Cluster details or None if not found
         """
         try:
-            logger.info("Describing cluster: %s", cluster_name)
-            response = self.client.describe_cluster(name=cluster_name)
+            logger.debug("Describing cluster: %s", cluster_name)
+            key = hashkey('describe_cluster', cluster_name)
+            response = self._cache.get_or_load(
+                key,
+                lambda: self._fetch(key, lambda: self.client.describe_cluster(name=cluster_name), use_cache),
+                use_cache
+            )
             return response.get('cluster')
         except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            if _code(e) in _NOT_FOUND:
                 logger.warning("Cluster not found: %s", cluster_name)
                 return None
             logger.error("Error describing cluster %s: %s", cluster_name, e)
@@ -81,10 +224,11 @@ class EKSReader:
             List of node group names
         """
         try:
-            logger.info("Listing node groups for cluster: %s", cluster_name)
-            response = self.client.list_nodegroups(clusterName=cluster_name)
-            nodegroups = response.get('nodegroups', [])
-            logger.info("Found %d node groups", len(nodegroups))
+            nodegroups = self._fetch(
+                ('list_nodegroups', cluster_name),
+                lambda: list(self._paginate('list_nodegroups', 'nodegroups', clusterName=cluster_name))
+            )
+            logger.debug("Found %d node groups for cluster %s", len(nodegroups), cluster_name)
             return nodegroups
         except ClientError as e:
             logger.error("Error listing node groups for cluster %s: %s", cluster_name, e)
@@ -102,19 +246,71 @@ class EKSReader:
             Node group details or None if not found
         """
         try:
-            logger.info("Describing node group: %s/%s", cluster_name, nodegroup_name)
-            response = self.client.describe_nodegroup(
-                clusterName=cluster_name,
-                nodegroupName=nodegroup_name
+            logger.debug("Describing node group: %s/%s", cluster_name, nodegroup_name)
+            response = self._fetch(
+                ('describe_nodegroup', cluster_name, nodegroup_name),
+                lambda: self.client.describe_nodegroup(
+                    clusterName=cluster_name,
+                    nodegroupName=nodegroup_name
+                )
             )
             return response.get('nodegroup')
         except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            if _code(e) in _NOT_FOUND:
                 logger.warning("Node group not found: %s/%s", cluster_name, nodegroup_name)
                 return None
             logger.error("Error describing node group %s/%s: %s", cluster_name, nodegroup_name, e)
             raise
     
+    def _submit_coalesced(self, key: Hashable, func: Callable[..., Any], *args) -> Future:
+        """
+        Run func(*args) on the worker threads, sharing the Future of an
+        identical call that is still in flight.
+        
+        Args:
+            key: Identifies identical calls, e.g. ('nodegroup', cluster, name)
+            func: Function to call
+            *args: Arguments for the function
+            
+        Returns:
+            Future resolving to the function's result
+        """
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future
+            future = self._executor.submit(func, *args)
+            self._in_flight[key] = future
+        
+        def forget(done):
+            with self._in_flight_lock:
+                if self._in_flight.get(key) is done:
+                    del self._in_flight[key]
+        future.add_done_callback(forget)
+        return future
+    
+    def describe_nodegroups_bulk(self, cluster_name: str,
+                                 nodegroup_names: Iterable[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Describe several node groups of a cluster concurrently.
+        
+        EKS has no batch describe, so each node group is described on a worker
+        thread; a node group already being described, by this call or another
+        thread, is described once.
+        
+        Args:
+            cluster_name: Name of the cluster
+            nodegroup_names: Names of the node groups
+            
+        Returns:
+            Node group details, or None for node groups not found, in the order of nodegroup_names
+        """
+        futures = [
+            self._submit_coalesced(('nodegroup', cluster_name, name), self.describe_nodegroup, cluster_name, name)
+            for name in nodegroup_names
+        ]
+        return [future.result() for future in futures]
+    
     def list_fargate_profiles(self, cluster_name: str) -> List[str]:
         """
         List Fargate profiles for a specific cluster.
@@ -126,35 +322,43 @@ class EKSReader:
             List of Fargate profile names
         """
         try:
-            logger.info("Listing Fargate profiles for cluster: %s", cluster_name)
-            response = self.client.list_fargate_profiles(clusterName=cluster_name)
-            profiles = response.get('fargateProfileNames', [])
-            logger.info("Found %d Fargate profiles", len(profiles))
+            profiles = self._fetch(
+                ('list_fargate_profiles', cluster_name),
+                lambda: list(self._paginate('list_fargate_profiles', 'fargateProfileNames', clusterName=cluster_name))
+            )
+            logger.debug("Found %d Fargate profiles for cluster %s", len(profiles), cluster_name)
             return profiles
         except ClientError as e:
             logger.error("Error listing Fargate profiles for cluster %s: %s", cluster_name, e)
             raise
     
-    def describe_fargate_profile(self, cluster_name: str, profile_name: str) -> Optional[Dict[str, Any]]:
+    def describe_fargate_profile(self, cluster_name: str, profile_name: str,
+                                 use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a specific Fargate profile.
         
         Args:
             cluster_name: Name of the cluster
             profile_name: Name of the Fargate profile
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             Fargate profile details or None if not found
         """
         try:
-            logger.info("Describing Fargate profile: %s/%s", cluster_name, profile_name)
-            response = self.client.describe_fargate_profile(
-                clusterName=cluster_name,
-                fargateProfileName=profile_name
+            logger.debug("Describing Fargate profile: %s/%s", cluster_name, profile_name)
+            key = hashkey('describe_fargate_profile', cluster_name, profile_name)
+            response = self._cache.get_or_load(
+                key,
+                lambda: self._fetch(key, lambda: self.client.describe_fargate_profile(
+                    clusterName=cluster_name,
+                    fargateProfileName=profile_name
+                ), use_cache),
+                use_cache
             )
             return response.get('fargateProfile')
         except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            if _code(e) in _NOT_FOUND:
                 logger.warning("Fargate profile not found: %s/%s", cluster_name, profile_name)
                 return None
             logger.error("Error describing Fargate profile %s/%s: %s", cluster_name, profile_name, e)
@@ -171,60 +375,97 @@ class EKSReader:
             List of add-on names
         """
         try:
-            logger.info("Listing add-ons for cluster: %s", cluster_name)
-            response = self.client.list_addons(clusterName=cluster_name)
-            addons = response.get('addons', [])
-            logger.info("Found %d add-ons", len(addons))
+            addons = self._fetch(
+                ('list_addons', cluster_name),
+                lambda: list(self._paginate('list_addons', 'addons', clusterName=cluster_name))
+            )
+            logger.debug("Found %d add-ons for cluster %s", len(addons), cluster_name)
             return addons
         except ClientError as e:
             logger.error("Error listing add-ons for cluster %s: %s", cluster_name, e)
             raise
     
-    def describe_addon(self, cluster_name: str, addon_name: str) -> Optional[Dict[str, Any]]:
+    def describe_addon(self, cluster_name: str, addon_name: str,
+                       use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a specific add-on.
         
         Args:
             cluster_name: Name of the cluster
             addon_name: Name of the add-on
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             Add-on details or None if not found
         """
         try:
-            logger.info("Describing add-on: %s/%s", cluster_name, addon_name)
-            response = self.client.describe_addon(
-                clusterName=cluster_name,
-                addonName=addon_name
+            logger.debug("Describing add-on: %s/%s", cluster_name, addon_name)
+            key = hashkey('describe_addon', cluster_name, addon_name)
+            response = self._cache.get_or_load(
+                key,
+                lambda: self._fetch(key, lambda: self.client.describe_addon(
+                    clusterName=cluster_name,
+                    addonName=addon_name
+                ), use_cache),
+                use_cache
             )
             return response.get('addon')
         except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            if _code(e) in _NOT_FOUND:
                 logger.warning("Add-on not found: %s/%s", cluster_name, addon_name)
                 return None
             logger.error("Error describing add-on %s/%s: %s", cluster_name, addon_name, e)
             raise
     
-    def describe_addon_versions(self, addon_name: str, kubernetes_version: str = None) -> List[Dict[str, Any]]:
+    def describe_addons_bulk(self, cluster_name: str,
+                             addon_names: Iterable[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Describe several add-ons of a cluster concurrently.
+        
+        Like describe_nodegroups_bulk, add-ons already being described are
+        described once.
+        
+        Args:
+            cluster_name: Name of the cluster
+            addon_names: Names of the add-ons
+            
+        Returns:
+            Add-on details, or None for add-ons not found, in the order of addon_names
+        """
+        futures = [
+            self._submit_coalesced(('addon', cluster_name, name), self.describe_addon, cluster_name, name)
+            for name in addon_names
+        ]
+        return [future.result() for future in futures]
+    
+    def describe_addon_versions(self, addon_name: str, kubernetes_version: str = None,
+                                use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         Get available versions for a specific add-on.
         
+        The version catalog is cached for five minutes.
+        
         Args:
             addon_name: Name of the add-on
             kubernetes_version: Optional Kubernetes version filter
+            use_cache: Whether to serve a recently cached response
             
         Returns:
             List of add-on version information
         """
         try:
-            logger.info("Describing add-on versions for: %s", addon_name)
             params = {'addonName': addon_name}
             if kubernetes_version:
                 params['kubernetesVersion'] = kubernetes_version
             
-            response = self.client.describe_addon_versions(**params)
-            versions = response.get('addons', [])
-            logger.info("Found %d add-on versions", len(versions))
+            key = hashkey('describe_addon_versions', addon_name, kubernetes_version)
+            versions = self._addon_versions.get_or_load(
+                key,
+                lambda: self._fetch(key, lambda: list(self._paginate('describe_addon_versions', 'addons', **params)),
+                                    use_cache),
+                use_cache
+            )
+            logger.debug("Found %d add-on versions for %s", len(versions), addon_name)
             return versions
         except ClientError as e:
             logger.error("Error describing add-on versions for %s: %s", addon_name, e)
@@ -241,10 +482,12 @@ class EKSReader:
             List of identity provider configurations
         """
         try:
-            logger.info("Listing identity provider configs for cluster: %s", cluster_name)
-            response = self.client.list_identity_provider_configs(clusterName=cluster_name)
-            configs = response.get('identityProviderConfigs', [])
-            logger.info("Found %d identity provider configs", len(configs))
+            configs = self._fetch(
+                ('list_identity_provider_configs', cluster_name),
+                lambda: list(self._paginate('list_identity_provider_configs', 'identityProviderConfigs',
+                                            clusterName=cluster_name))
+            )
+            logger.debug("Found %d identity provider configs for cluster %s", len(configs), cluster_name)
             return configs
         except ClientError as e:
             logger.error("Error listing identity provider configs for cluster %s: %s", cluster_name, e)
@@ -262,35 +505,72 @@ class EKSReader:
             Identity provider config details or None if not found
         """
         try:
-            logger.info("Describing identity provider config: %s", config)
+            logger.debug("Describing identity provider config: %s", config)
             response = self.client.describe_identity_provider_config(
                 clusterName=cluster_name,
                 identityProviderConfig=config
             )
             return response.get('identityProviderConfig')
         except ClientError as e:
-            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            if _code(e) in _NOT_FOUND:
                 logger.warning("Identity provider config not found: %s", config)
                 return None
             logger.error("Error describing identity provider config %s: %s", config, e)
             raise
     
+    def get_cluster_token(self, cluster_name: str) -> str:
+        """
+        Get a Kubernetes bearer token for a cluster, as `aws eks get-token` does.
+        
+        The token is a presigned STS GetCallerIdentity URL and is reused from
+        memory until less than a minute of its lifetime is left.
+        
+        Args:
+            cluster_name: Name of the cluster
+            
+        Returns:
+            Bearer token for the cluster's Kubernetes API
+        """
+        cached = self._tokens.get(cluster_name)
+        if cached is not None and cached[1] - time.time() > _TOKEN_REFRESH_MARGIN:
+            return cached[0]
+        
+        from common.aws_client import DEFAULT_CLIENT_CONFIG
+        sts = self.client_manager.get_client('sts', config=DEFAULT_CLIENT_CONFIG)
+        sts.meta.events.register('provide-client-params.sts.GetCallerIdentity', _retain_cluster_id,
+                                 unique_id='argus-eks-retain-cluster-id')
+        sts.meta.events.register('before-sign.sts.GetCallerIdentity', _add_cluster_id_header,
+                                 unique_id='argus-eks-cluster-id-header')
+        url = sts.generate_presigned_url('get_caller_identity', Params={_CLUSTER_ID_HEADER: cluster_name},
+                                         ExpiresIn=60, HttpMethod='GET')
+        token = _TOKEN_PREFIX + base64.urlsafe_b64encode(url.encode()).decode().rstrip('=')
+        
+        self._tokens[cluster_name] = (token, time.time() + _TOKEN_LIFETIME)
+        logger.debug("Generated auth token for cluster: %s", cluster_name)
+        return token
+    
     def get_cluster_oidc_issuer_url(self, cluster_name: str) -> Optional[str]:
         """
         Get the OIDC issuer URL for a cluster.
         
+        The issuer doesn't change for the lifetime of a cluster, so it is kept
+        until invalidate() or clear_cache() is called for the cluster.
+        
         Args:
             cluster_name: Name of the cluster
             
         Returns:
             OIDC issuer URL or None if not available
         """
+        issuer = self._oidc_issuers.get(cluster_name)
+        if issuer is not None:
+            return issuer
         try:
-            cluster = self.describe_cluster(cluster_name)
-            if cluster and 'identity' in cluster:
-                oidc = cluster['identity'].get('oidc', {})
-                return oidc.get('issuer')
-            return None
+            cluster = self.describe_cluster(cluster_name) or {}
+            issuer = cluster.get('identity', {}).get('oidc', {}).get('issuer')
+            if issuer is not None:
+                self._oidc_issuers[cluster_name] = issuer
+            return issuer
         except Exception as e:
             logger.error("Error getting OIDC issuer URL for cluster %s: %s", cluster_name, e)
             return None
@@ -0,0 +1,247 @@
+"""
+Async Elastic Kubernetes Service Reader for AWS resource exploration.
+
+AsyncEKSReader mirrors the cluster, node group, Fargate profile and add-on
+methods of EKSReader as coroutines, with the same return shapes, so that
+describes across many clusters can be awaited together. Requests go through
+a long-lived aioboto3 client when the async extra is installed; without
+aioboto3 they fall back to EKSReader's boto3 client run in worker threads.
+"""
+
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+from botocore.exceptions import ClientError
+
+from common.aws_client import AWSClientManager, DEFAULT_CLIENT_CONFIG
+from common.threads import run_sync
+from .eks_reader import EKSReader, _NOT_FOUND, _PAGE_SIZE, _code
+
+try:
+    import aioboto3
+except ImportError:  # optional: pip install argus-aws[async]
+    aioboto3 = None
+
+logger = logging.getLogger(__name__)
+
+# Describe calls in flight at once per reader
+_MAX_CONCURRENT_DESCRIBES = 32
+
+
+class AsyncEKSReader:
+    """Async EKS read operations using aioboto3, or EKSReader in worker threads."""
+
+    def __init__(self, client_manager: AWSClientManager,
+                 max_concurrency: int = _MAX_CONCURRENT_DESCRIBES):
+        """
+        Initialize AsyncEKSReader.
+
+        Args:
+            client_manager: AWS client manager instance
+            max_concurrency: Describe calls in flight at once
+        """
+        self.client_manager = client_manager
+        self.max_concurrency = max_concurrency
+        self._client_context = None
+        self._client = None
+        self._lock = None
+        self._semaphore = None
+        self._sync_reader = None
+
+    async def __aenter__(self) -> 'AsyncEKSReader':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _get_client(self):
+        """
+        Get or create the long-lived aioboto3 EKS client.
+
+        Returns:
+            aioboto3 EKS client
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._client is None:
+                session = aioboto3.Session(
+                    profile_name=self.client_manager.profile_name,
+                    region_name=self.client_manager.get_current_region()
+                )
+                context = session.client('eks', config=DEFAULT_CLIENT_CONFIG)
+                self._client = await context.__aenter__()
+                self._client_context = context
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the aioboto3 EKS client and the fallback reader's worker threads, if either was started."""
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+            self._client_context = None
+            self._client = None
+        # The fallback reader's boto3 client belongs to the caller's client
+        # manager, which other readers may share, so only its threads are stopped
+        if self._sync_reader is not None:
+            self._sync_reader._executor.shutdown(wait=False)
+            self._sync_reader = None
+
+    def _get_sync_reader(self) -> EKSReader:
+        """Get or create the EKSReader used when aioboto3 is unavailable."""
+        if self._sync_reader is None:
+            self._sync_reader = EKSReader(self.client_manager)
+        return self._sync_reader
+
+    async def _list(self, operation: str, result_key: str, **params) -> List[Any]:
+        """
+        Collect the items of every page of a paginated EKS operation.
+
+        Args:
+            operation: Client method name, e.g. 'list_nodegroups'
+            result_key: Response key holding the items
+            **params: Request parameters
+
+        Returns:
+            List of items
+        """
+        if aioboto3 is None:
+            return await run_sync(lambda: list(self._get_sync_reader()._paginate(operation, result_key, **params)))
+        client = await self._get_client()
+        items = []
+        async for page in client.get_paginator(operation).paginate(
+                **params, PaginationConfig={'PageSize': _PAGE_SIZE}):
+            items.extend(page.get(result_key, []))
+        return items
+
+    async def _describe(self, operation: str, result_key: str, **params) -> Optional[Dict[str, Any]]:
+        """
+        Await one EKS describe call, at most max_concurrency at a time.
+
+        Args:
+            operation: Client method name, e.g. 'describe_nodegroup'
+            result_key: Response key holding the description
+            **params: Request parameters
+
+        Returns:
+            The description, or None if the resource doesn't exist
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            try:
+                if aioboto3 is None:
+                    response = await run_sync(getattr(self._get_sync_reader().client, operation), **params)
+                else:
+                    client = await self._get_client()
+                    response = await getattr(client, operation)(**params)
+            except ClientError as e:
+                if _code(e) in _NOT_FOUND:
+                    return None
+                raise
+        return response.get(result_key)
+
+    async def list_clusters(self) -> List[str]:
+        """Async version of EKSReader.list_clusters."""
+        try:
+            clusters = await self._list('list_clusters', 'clusters')
+            logger.debug("Found %d clusters", len(clusters))
+            return clusters
+        except ClientError as e:
+            logger.error("Error listing clusters: %s", e)
+            raise
+
+    async def describe_cluster(self, cluster_name: str) -> Optional[Dict[str, Any]]:
+        """Async version of EKSReader.describe_cluster."""
+        try:
+            logger.debug("Describing cluster: %s", cluster_name)
+            cluster = await self._describe('describe_cluster', 'cluster', name=cluster_name)
+            if cluster is None:
+                logger.warning("Cluster not found: %s", cluster_name)
+            return cluster
+        except ClientError as e:
+            logger.error("Error describing cluster %s: %s", cluster_name, e)
+            raise
+
+    async def list_nodegroups(self, cluster_name: str) -> List[str]:
+        """Async version of EKSReader.list_nodegroups."""
+        try:
+            nodegroups = await self._list('list_nodegroups', 'nodegroups', clusterName=cluster_name)
+            logger.debug("Found %d node groups for cluster %s", len(nodegroups), cluster_name)
+            return nodegroups
+        except ClientError as e:
+            logger.error("Error listing node groups for cluster %s: %s", cluster_name, e)
+            raise
+
+    async def describe_nodegroup(self, cluster_name: str, nodegroup_name: str) -> Optional[Dict[str, Any]]:
+        """Async version of EKSReader.describe_nodegroup."""
+        try:
+            logger.debug("Describing node group: %s/%s", cluster_name, nodegroup_name)
+            nodegroup = await self._describe('describe_nodegroup', 'nodegroup',
+                                             clusterName=cluster_name, nodegroupName=nodegroup_name)
+            if nodegroup is None:
+                logger.warning("Node group not found: %s/%s", cluster_name, nodegroup_name)
+            return nodegroup
+        except ClientError as e:
+            logger.error("Error describing node group %s/%s: %s", cluster_name, nodegroup_name, e)
+            raise
+
+    async def describe_all_nodegroups(self, cluster_name: str) -> List[Dict[str, Any]]:
+        """
+        Describe every node group of a cluster concurrently.
+
+        Args:
+            cluster_name: Name of the cluster
+
+        Returns:
+            Node group details, in list_nodegroups order; node groups deleted
+            between the list and the describe are left out
+        """
+        names = await self.list_nodegroups(cluster_name)
+        nodegroups = await asyncio.gather(*(self.describe_nodegroup(cluster_name, name) for name in names))
+        return [nodegroup for nodegroup in nodegroups if nodegroup is not None]
+
+    async def list_fargate_profiles(self, cluster_name: str) -> List[str]:
+        """Async version of EKSReader.list_fargate_profiles."""
+        try:
+            profiles = await self._list('list_fargate_profiles', 'fargateProfileNames', clusterName=cluster_name)
+            logger.debug("Found %d Fargate profiles for cluster %s", len(profiles), cluster_name)
+            return profiles
+        except ClientError as e:
+            logger.error("Error listing Fargate profiles for cluster %s: %s", cluster_name, e)
+            raise
+
+    async def describe_fargate_profile(self, cluster_name: str, profile_name: str) -> Optional[Dict[str, Any]]:
+        """Async version of EKSReader.describe_fargate_profile."""
+        try:
+            logger.debug("Describing Fargate profile: %s/%s", cluster_name, profile_name)
+            profile = await self._describe('describe_fargate_profile', 'fargateProfile',
+                                           clusterName=cluster_name, fargateProfileName=profile_name)
+            if profile is None:
+                logger.warning("Fargate profile not found: %s/%s", cluster_name, profile_name)
+            return profile
+        except ClientError as e:
+            logger.error("Error describing Fargate profile %s/%s: %s", cluster_name, profile_name, e)
+            raise
+
+    async def list_addons(self, cluster_name: str) -> List[str]:
+        """Async version of EKSReader.list_addons."""
+        try:
+            addons = await self._list('list_addons', 'addons', clusterName=cluster_name)
+            logger.debug("Found %d add-ons for cluster %s", len(addons), cluster_name)
+            return addons
+        except ClientError as e:
+            logger.error("Error listing add-ons for cluster %s: %s", cluster_name, e)
+            raise
+
+    async def describe_addon(self, cluster_name: str, addon_name: str) -> Optional[Dict[str, Any]]:
+        """Async version of EKSReader.describe_addon."""
+        try:
+            logger.debug("Describing add-on: %s/%s", cluster_name, addon_name)
+            addon = await self._describe('describe_addon', 'addon',
+                                         clusterName=cluster_name, addonName=addon_name)
+            if addon is None:
+                logger.warning("Add-on not found: %s/%s", cluster_name, addon_name)
+            return addon
+        except ClientError as e:
+            logger.error("Error describing add-on %s/%s: %s", cluster_name, addon_name, e)
+            raise
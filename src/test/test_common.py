@@ -18,6 +18,9 @@ class TestAWSClientManager(unittest.TestCase):
         """Set up test fixtures before each test method."""
         self.profile_name = 'test-profile'
         self.region_name = 'us-east-1'
+        
+        from common.aws_client import clear_client_cache
+        clear_client_cache()
     
     @patch('common.aws_client.boto3.Session')
     def test_client_manager_initialization(self, mock_session):
@@ -85,7 +88,98 @@ class TestAWSClientManager(unittest.TestCase):
         # Test getting the same client again (should be cached)
         s3_client_2 = client_manager.get_client('s3')
         self.assertEqual(s3_client, s3_client_2)
-    
+
+    @patch('common.aws_client.boto3.Session')
+    def test_get_client_with_config(self, mock_session):
+        """Test that a client config is forwarded and cached separately."""
+        from botocore.config import Config
+
+        mock_session_instance = Mock()
+        mock_session.return_value = mock_session_instance
+        mock_session_instance.client.side_effect = lambda *args, **kwargs: Mock()
+
+        from common.aws_client import AWSClientManager
+
+        client_manager = AWSClientManager(self.profile_name, self.region_name)
+        config = Config(retries={'mode': 'adaptive'})
+
+        configured = client_manager.get_client('dynamodb', config=config)
+        plain = client_manager.get_client('dynamodb')
+
+        self.assertIsNot(configured, plain)
+        self.assertIs(client_manager.get_client('dynamodb', config=config), configured)
+        mock_session_instance.client.assert_any_call(
+            'dynamodb', region_name=self.region_name, config=config
+        )
+
+    @patch('common.aws_client.boto3.Session')
+    def test_clients_shared_across_managers(self, mock_session):
+        """Test that managers for the same profile share cached clients."""
+        mock_session_instance = Mock()
+        mock_session.return_value = mock_session_instance
+        mock_session_instance.client.side_effect = lambda *args, **kwargs: Mock()
+
+        from common.aws_client import AWSClientManager
+
+        first = AWSClientManager(self.profile_name, self.region_name)
+        second = AWSClientManager(self.profile_name, self.region_name)
+        other = AWSClientManager('other-profile', self.region_name)
+
+        self.assertIs(first.get_client('ec2'), second.get_client('ec2'))
+        self.assertIsNot(first.get_client('ec2'), other.get_client('ec2'))
+
+    @patch('common.aws_client.boto3.Session')
+    def test_close_releases_clients(self, mock_session):
+        """Test that close() closes clients and drops them from the shared cache."""
+        mock_session_instance = Mock()
+        mock_session.return_value = mock_session_instance
+        mock_session_instance.client.side_effect = lambda *args, **kwargs: Mock()
+
+        from common.aws_client import AWSClientManager
+
+        with AWSClientManager(self.profile_name, self.region_name) as client_manager:
+            ec2_client = client_manager.get_client('ec2')
+
+        ec2_client.close.assert_called_once()
+        self.assertIsNot(client_manager.get_client('ec2'), ec2_client)
+
+    @patch('common.aws_client.boto3.Session')
+    def test_close_client_releases_one_client(self, mock_session):
+        """Test that close_client() closes only the named client."""
+        mock_session.return_value.client.side_effect = lambda *args, **kwargs: Mock()
+
+        from common.aws_client import AWSClientManager
+
+        client_manager = AWSClientManager(self.profile_name, self.region_name)
+        ec2_client = client_manager.get_client('ec2')
+        eks_client = client_manager.get_client('eks')
+        client_manager.close_client('eks')
+
+        eks_client.close.assert_called_once()
+        ec2_client.close.assert_not_called()
+        self.assertIs(client_manager.get_client('ec2'), ec2_client)
+        self.assertIsNot(client_manager.get_client('eks'), eks_client)
+
+    @patch('common.aws_client.boto3.Session')
+    def test_shared_client_stays_open_while_another_manager_holds_it(self, mock_session):
+        """Test that closing one manager leaves a client shared with another open and cached."""
+        mock_session.return_value.client.side_effect = lambda *args, **kwargs: Mock()
+
+        from common.aws_client import AWSClientManager
+
+        first = AWSClientManager(self.profile_name, self.region_name)
+        second = AWSClientManager(self.profile_name, self.region_name)
+        client = first.get_client('ec2')
+        self.assertIs(second.get_client('ec2'), client)
+
+        first.close()
+        client.close.assert_not_called()
+        self.assertIs(second.get_client('ec2'), client)
+
+        second.close()
+        client.close.assert_called_once()
+        self.assertIsNot(first.get_client('ec2'), client)
+
     @patch('common.aws_client.boto3.Session')
     def test_get_resource(self, mock_session):
         """Test get_resource method."""
@@ -141,5 +235,69 @@ class TestAWSExceptions(unittest.TestCase):
         from common.exceptions import AWSResourceError
         self.assertIsInstance(error, AWSResourceError)
 
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the ResponseCache helper."""
+
+    def test_get_or_load_caches_value(self):
+        """Test that a second lookup is served from the cache."""
+        from common.cache import ResponseCache
+
+        cache = ResponseCache(maxsize=8, ttl=60)
+        loader = Mock(return_value={'Name': 'app'})
+
+        self.assertEqual(cache.get_or_load('k', loader), {'Name': 'app'})
+        self.assertEqual(cache.get_or_load('k', loader), {'Name': 'app'})
+        loader.assert_called_once()
+
+    def test_get_or_load_caches_none(self):
+        """Test that a None result (resource not found) is cached too."""
+        from common.cache import ResponseCache
+
+        cache = ResponseCache(maxsize=8, ttl=60)
+        loader = Mock(return_value=None)
+
+        self.assertIsNone(cache.get_or_load('k', loader))
+        self.assertIsNone(cache.get_or_load('k', loader))
+        loader.assert_called_once()
+
+    def test_bypass_and_clear(self):
+        """Test that use_cache=False and clear() force a reload."""
+        from common.cache import ResponseCache
+
+        cache = ResponseCache(maxsize=8, ttl=60)
+        loader = Mock(side_effect=[1, 2, 3])
+
+        self.assertEqual(cache.get_or_load('k', loader), 1)
+        self.assertEqual(cache.get_or_load('k', loader, use_cache=False), 2)
+        self.assertEqual(cache.get_or_load('k', loader), 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get_or_load('k', loader), 3)
+
+    def test_discard_matching_entries(self):
+        """Test that discard() drops only the entries the predicate matches."""
+        from common.cache import ResponseCache
+
+        cache = ResponseCache(maxsize=8, ttl=60)
+        cache.get_or_load(('web', None), lambda: 'sg-1')
+        cache.get_or_load(('db', None), lambda: 'sg-2')
+
+        self.assertEqual(cache.discard(lambda key, value: value == 'sg-1'), 1)
+        self.assertEqual(len(cache), 1)
+
+class TestRunSync(unittest.TestCase):
+    """Test cases for the worker-thread helper."""
+
+    def test_runs_without_anyio(self):
+        """Test that run_sync falls back to the event loop's executor when anyio is missing."""
+        import asyncio
+        from common import threads
+
+        with patch.object(threads, 'anyio', None):
+            self.assertEqual(asyncio.run(threads.run_sync(len, [1, 2])), 2)
+            limiter = threads.capacity_limiter(2)
+            self.assertEqual(asyncio.run(threads.run_sync_limited(limiter, len, [1])), 1)
+            limiter.shutdown()
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DynamoDB writer functionality
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+# Add the parent src directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+class TestDynamoDBWriterBatchWrite(unittest.TestCase):
+    """Test cases for DynamoDBWriter.batch_write_item."""
+
+    def setUp(self):
+        """Set up a writer backed by mocked clients."""
+        from dynamodb.write.dynamodb_writer import DynamoDBWriter
+
+        self.client_manager = Mock()
+        self.client = Mock()
+        self.client_manager.get_client.return_value = self.client
+        self.writer = DynamoDBWriter(self.client_manager)
+
+    def test_duplicate_keys_keep_last_request(self):
+        """Test that repeated primary keys collapse to the last request."""
+        request_items = {
+            'Orders': [
+                {'PutRequest': {'Item': {'pk': {'S': 'a'}, 'sk': {'N': '1'}, 'v': {'S': 'old'}}}},
+                {'PutRequest': {'Item': {'pk': {'S': 'b'}, 'sk': {'N': '1'}, 'v': {'S': 'keep'}}}},
+                {'PutRequest': {'Item': {'pk': {'S': 'a'}, 'sk': {'N': '1'}, 'v': {'S': 'new'}}}},
+                {'DeleteRequest': {'Key': {'pk': {'S': 'b'}, 'sk': {'N': '2'}}}},
+            ]
+        }
+
+        self.writer.batch_write_item(request_items, key_schemas={'Orders': ['pk', 'sk']})
+
+        sent = self.client.batch_write_item.call_args.kwargs['RequestItems']['Orders']
+        self.assertEqual(len(sent), 3)
+        values = [r['PutRequest']['Item']['v']['S'] for r in sent if 'PutRequest' in r]
+        self.assertEqual(sorted(values), ['keep', 'new'])
+        self.client.describe_table.assert_not_called()
+
+    def test_equal_numeric_keys_are_duplicates(self):
+        """Test that 1, 1.0 and Decimal('1') are one key, raw or typed."""
+        from decimal import Decimal
+
+        request_items = {
+            'Orders': [
+                {'PutRequest': {'Item': {'pk': 1, 'v': 'int'}}},
+                {'PutRequest': {'Item': {'pk': 1.0, 'v': 'float'}}},
+                {'PutRequest': {'Item': {'pk': Decimal('1'), 'v': 'decimal'}}},
+            ],
+            'Events': [
+                {'PutRequest': {'Item': {'pk': {'N': '1'}, 'v': {'S': 'old'}}}},
+                {'DeleteRequest': {'Key': {'pk': {'N': '1.0'}}}},
+            ],
+        }
+
+        self.writer.batch_write_item(request_items, key_schemas={'Orders': ['pk'], 'Events': ['pk']})
+
+        sent = self.client.batch_write_item.call_args.kwargs['RequestItems']
+        self.assertEqual([r['PutRequest']['Item']['v'] for r in sent['Orders']], ['decimal'])
+        self.assertEqual(sent['Events'], [{'DeleteRequest': {'Key': {'pk': {'N': '1.0'}}}}])
+
+    def test_floats_are_converted_in_place(self):
+        """Test that nested floats in request items become Decimals."""
+        from decimal import Decimal
+
+        item = {'pk': 'a', 'price': 1.25, 'sizes': [0.5, {'w': 2.0}]}
+        request_items = {'Orders': [{'PutRequest': {'Item': item}}]}
+
+        self.writer.batch_write_item(request_items, key_schemas={'Orders': ['pk']})
+
+        sent = self.client.batch_write_item.call_args.kwargs['RequestItems']['Orders']
+        self.assertIs(sent[0]['PutRequest']['Item'], item)
+        self.assertEqual(item, {'pk': 'a', 'price': Decimal('1.25'),
+                                'sizes': [Decimal('0.5'), {'w': Decimal('2.0')}]})
+
+    def test_key_schema_is_looked_up_when_missing(self):
+        """Test that describe_table supplies the key schema when none is given."""
+        self.client.describe_table.return_value = {
+            'Table': {'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}]}
+        }
+        request_items = {
+            'Users': [
+                {'PutRequest': {'Item': {'id': '1', 'name': 'x'}}},
+                {'PutRequest': {'Item': {'id': '1', 'name': 'y'}}},
+            ]
+        }
+
+        self.writer.batch_write_item(request_items)
+
+        self.client.describe_table.assert_called_once_with(TableName='Users')
+        sent = self.client.batch_write_item.call_args.kwargs['RequestItems']['Users']
+        self.assertEqual(sent, [{'PutRequest': {'Item': {'id': '1', 'name': 'y'}}}])
+
+    def test_key_schema_is_cached_until_table_deleted(self):
+        """Test that describe_table runs once per table until the table is deleted."""
+        self.client.describe_table.return_value = {
+            'Table': {'KeySchema': [{'AttributeName': 'id', 'KeyType': 'HASH'}]}
+        }
+        self.client.delete_table.return_value = {'TableDescription': {'TableStatus': 'DELETING'}}
+        request_items = lambda: {'Users': [{'PutRequest': {'Item': {'id': '1'}}}]}
+
+        self.writer.batch_write_item(request_items())
+        self.writer.batch_write_item(request_items())
+        self.assertEqual(self.client.describe_table.call_count, 1)
+
+        self.writer.delete_table('Users')
+        self.writer.batch_write_item(request_items())
+        self.assertEqual(self.client.describe_table.call_count, 2)
+
+
+class TestDynamoDBWriterConversion(unittest.TestCase):
+    """Test cases for DynamoDBWriter float conversion."""
+
+    def test_floats_become_decimals(self):
+        """Test that nested floats convert to exact Decimals."""
+        from decimal import Decimal
+        from dynamodb.write.dynamodb_writer import DynamoDBWriter
+
+        writer = DynamoDBWriter(Mock())
+        item = {'price': 0.1, 'tags': [1.5, 'x'], 'nested': {'zero': -0.0}, 'n': 3}
+        converted = writer._convert_to_dynamodb_format(item)
+
+        self.assertEqual(converted['price'], Decimal('0.1'))
+        self.assertEqual(converted['tags'], [Decimal('1.5'), 'x'])
+        self.assertEqual(str(converted['nested']['zero']), '-0.0')
+        self.assertEqual(converted['n'], 3)
+
+    def test_items_without_floats_are_returned_unchanged(self):
+        """Test that items with no floats skip conversion."""
+        from decimal import Decimal
+        from dynamodb.write.dynamodb_writer import DynamoDBWriter
+
+        writer = DynamoDBWriter(Mock())
+        item = {'price': Decimal('0.1'), 'tags': ['x', {'n': 1}]}
+
+        self.assertIs(writer._convert_to_dynamodb_format(item), item)
+        self.assertTrue(writer._needs_conversion({'tags': ['x', {'n': 1.5}]}))
+
+    def test_large_items_match_python_walk(self):
+        """Test that the orjson fast path agrees with the Python walk."""
+        from decimal import Decimal
+        from dynamodb.write.dynamodb_writer import DynamoDBWriter
+
+        writer = DynamoDBWriter(Mock())
+        item = {f'attr{i}': [i * 0.1, {'s': str(i)}] for i in range(100)}
+        item['flag'] = True
+
+        self.assertEqual(writer._convert_to_dynamodb_format(item), writer._convert_value(item))
+        self.assertEqual(writer._convert_to_dynamodb_format(item)['attr3'][0], Decimal('0.30000000000000004'))
+
+    def test_large_items_keep_unsupported_values(self):
+        """Test that values JSON cannot represent fall back to the Python walk."""
+        from decimal import Decimal
+        from dynamodb.write.dynamodb_writer import DynamoDBWriter
+
+        writer = DynamoDBWriter(Mock())
+        item = {f'attr{i}': i for i in range(100)}
+        item.update({'blob': b'raw', 'nan': float('nan'), 'dec': Decimal('1.5'), 'none': None})
+        converted = writer._convert_to_dynamodb_format(item)
+
+        self.assertEqual(converted['blob'], b'raw')
+        self.assertTrue(converted['nan'].is_nan())
+        self.assertIsNone(converted['none'])
+
+
+class TestDynamoDBWriterErrors(unittest.TestCase):
+    """Test cases for DynamoDBWriter ClientError translation."""
+
+    def setUp(self):
+        """Set up a writer backed by mocked clients."""
+        from dynamodb.write.dynamodb_writer import DynamoDBWriter
+
+        self.client_manager = Mock()
+        self.client = Mock()
+        self.client_manager.get_client.return_value = self.client
+        self.writer = DynamoDBWriter(self.client_manager)
+
+    def _client_error(self, code):
+        from botocore.exceptions import ClientError
+        return ClientError({'Error': {'Code': code, 'Message': 'boom'}}, 'Op')
+
+    def test_error_codes_map_to_exceptions(self):
+        """Test that each error code raises the expected exception type."""
+        from common.exceptions import (
+            AWSPermissionException, AWSResourceError, ResourceNotFoundError
+        )
+
+        cases = [
+            ('AccessDeniedException', AWSPermissionException),
+            ('ResourceNotFoundException', ResourceNotFoundError),
+            ('ValidationException', AWSResourceError),
+        ]
+        for code, exc_class in cases:
+            self.client.delete_table.side_effect = self._client_error(code)
+            with self.assertRaises(exc_class):
+                self.writer.delete_table('Orders')
+
+    def test_not_found_message_names_table(self):
+        """Test that table-scoped errors mention the table."""
+        from common.exceptions import ResourceNotFoundError
+
+        self.client.delete_table.side_effect = self._client_error('ResourceNotFoundException')
+        with self.assertRaises(ResourceNotFoundError) as ctx:
+            self.writer.delete_table('Orders')
+        self.assertEqual(str(ctx.exception), "Table 'Orders' not found")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Elastic Beanstalk writer functionality
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+# Add the parent src directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+class TestEBSWriterParams(unittest.TestCase):
+    """Test cases for EBSWriter request parameters."""
+
+    def setUp(self):
+        """Set up a writer backed by a mocked Elastic Beanstalk client."""
+        from ebs.write.ebs_writer import EBSWriter
+
+        self.client = Mock()
+        client_manager = Mock()
+        client_manager.get_client.return_value = self.client
+        self.writer = EBSWriter(client_manager)
+
+    def test_client_uses_adaptive_retries(self):
+        """Test that the client is built with the shared adaptive-retry config."""
+        from common.aws_client import DEFAULT_CLIENT_CONFIG
+
+        self.writer.client
+        self.writer.client_manager.get_client.assert_called_once_with(
+            'elasticbeanstalk', config=DEFAULT_CLIENT_CONFIG
+        )
+        self.assertEqual(DEFAULT_CLIENT_CONFIG.retries['mode'], 'adaptive')
+
+    def test_close_releases_client(self):
+        """Test that leaving the context releases a client that was created through its manager."""
+        from common.aws_client import DEFAULT_CLIENT_CONFIG
+
+        with self.writer as writer:
+            writer.restart_app_server(environment_name='env')
+
+        self.writer.client_manager.close_client.assert_called_once_with(
+            'elasticbeanstalk', config=DEFAULT_CLIENT_CONFIG
+        )
+        self.client.close.assert_not_called()
+
+    def test_empty_optional_fields_are_omitted(self):
+        """Test that only provided optional fields are sent."""
+        self.writer.create_environment('app', 'env', platform_arn='arn:platform', tags=[])
+
+        self.client.create_environment.assert_called_once_with(
+            ApplicationName='app', EnvironmentName='env', PlatformArn='arn:platform'
+        )
+
+    def test_update_environment_by_name(self):
+        """Test that update_environment targets the environment name."""
+        self.writer.update_environment(environment_name='env', version_label='v2')
+
+        self.client.update_environment.assert_called_once_with(
+            EnvironmentName='env', VersionLabel='v2'
+        )
+
+
+    def test_swap_cnames_prefers_ids(self):
+        """Test that each side of a CNAME swap uses its ID when given."""
+        self.writer.swap_environment_cnames(source_environment_id='e-1',
+                                            source_environment_name='blue',
+                                            destination_environment_name='green')
+
+        self.client.swap_environment_cnames.assert_called_once_with(
+            SourceEnvironmentId='e-1', DestinationEnvironmentName='green'
+        )
+
+    def test_missing_environment_raises(self):
+        """Test that omitting both the ID and the name raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.writer.restart_app_server()
+        self.client.restart_app_server.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
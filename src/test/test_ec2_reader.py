@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Unit tests for EC2 reader functionality
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+# Add the parent src directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+class TestEC2ReaderPagination(unittest.TestCase):
+    """Test cases for the paginated EC2Reader list methods."""
+
+    def setUp(self):
+        """Set up a reader backed by a mocked EC2 client."""
+        from ec2.read.ec2_reader import EC2Reader
+
+        self.client = Mock()
+        client_manager = Mock()
+        client_manager.get_client.return_value = self.client
+        self.reader = EC2Reader(client_manager)
+
+    def _pages(self, *pages):
+        paginator = Mock()
+        paginator.paginate.return_value = iter(pages)
+        self.client.get_paginator.return_value = paginator
+        return paginator
+
+    def test_client_uses_adaptive_retries(self):
+        """Test that the client is built lazily with the shared adaptive-retry config."""
+        from common.aws_client import DEFAULT_CLIENT_CONFIG
+
+        client_manager = self.reader.client_manager
+        client_manager.get_client.assert_not_called()
+        self.reader.ec2_client
+        client_manager.get_client.assert_called_once_with('ec2', config=DEFAULT_CLIENT_CONFIG)
+        self.assertEqual(DEFAULT_CLIENT_CONFIG.retries['mode'], 'adaptive')
+
+    def test_close_releases_client(self):
+        """Test that leaving the context releases the client through its manager."""
+        from common.aws_client import DEFAULT_CLIENT_CONFIG
+
+        self.client.describe_key_pairs.return_value = {'KeyPairs': []}
+
+        with self.reader as reader:
+            reader.list_key_pairs()
+
+        self.reader.client_manager.close_client.assert_called_once_with('ec2', config=DEFAULT_CLIENT_CONFIG)
+
+    def test_list_instances_reads_every_page(self):
+        """Test that instances from all pages and reservations are returned."""
+        self._pages(
+            {'Reservations': [{'Instances': [{'InstanceId': 'i-1'}, {'InstanceId': 'i-2'}]}]},
+            {'Reservations': [{'Instances': [{'InstanceId': 'i-3'}]}, {}]},
+        )
+
+        instances = self.reader.list_instances()
+
+        self.assertEqual([i['InstanceId'] for i in instances], ['i-1', 'i-2', 'i-3'])
+        self.client.get_paginator.assert_called_once_with('describe_instances')
+
+    def test_filters_are_passed_to_paginator(self):
+        """Test that filters and owners reach the paginate call."""
+        paginator = self._pages({'Images': [{'ImageId': 'ami-1'}]})
+        filters = [{'Name': 'state', 'Values': ['available']}]
+
+        amis = self.reader.list_amis(owners=['self'], filters=filters)
+
+        self.assertEqual(amis, [{'ImageId': 'ami-1'}])
+        kwargs = paginator.paginate.call_args.kwargs
+        self.assertEqual(kwargs['Owners'], ['self'])
+        self.assertEqual(kwargs['Filters'], filters)
+
+    def test_filter_shorthands_become_server_side_filters(self):
+        """Test that keyword filters are sent as EC2 Filters."""
+        paginator = self._pages({'Reservations': []})
+
+        self.reader.list_instances(state='running', availability_zone='us-east-1a',
+                                   tag={'Env': 'prod'})
+
+        self.assertEqual(paginator.paginate.call_args.kwargs['Filters'], [
+            {'Name': 'instance-state-name', 'Values': ['running']},
+            {'Name': 'availability-zone', 'Values': ['us-east-1a']},
+            {'Name': 'tag:Env', 'Values': ['prod']},
+        ])
+
+    def test_projection_keeps_requested_fields(self):
+        """Test that projection trims each instance to the requested fields."""
+        self._pages({'Reservations': [{'Instances': [
+            {'InstanceId': 'i-1', 'State': {'Name': 'running'}, 'BlockDeviceMappings': []},
+        ]}]})
+
+        instances = self.reader.list_instances(projection=('InstanceId', 'State', 'Tags'))
+
+        self.assertEqual(instances, [{'InstanceId': 'i-1', 'State': {'Name': 'running'}, 'Tags': None}])
+
+    def test_errors_are_wrapped(self):
+        """Test that paginator failures raise AWSResourceError."""
+        from common.exceptions import AWSResourceError
+
+        self.client.get_paginator.side_effect = RuntimeError('boom')
+
+        with self.assertRaises(AWSResourceError):
+            self.reader.list_vpcs()
+
+
+class TestEC2ReaderCache(unittest.TestCase):
+    """Test cases for cached EC2Reader listings."""
+
+    def setUp(self):
+        """Set up a reader backed by a mocked EC2 client."""
+        from ec2.read.ec2_reader import EC2Reader
+
+        self.client = Mock()
+        client_manager = Mock()
+        client_manager.get_client.return_value = self.client
+        self.reader = EC2Reader(client_manager)
+
+    def test_key_pairs_are_cached_until_invalidated(self):
+        """Test that repeat listings skip the API until the cache is dropped."""
+        self.client.describe_key_pairs.return_value = {'KeyPairs': [{'KeyName': 'k'}]}
+
+        self.reader.list_key_pairs()
+        self.reader.list_key_pairs()
+        self.assertEqual(self.client.describe_key_pairs.call_count, 1)
+
+        self.reader.invalidate_cache()
+        self.reader.list_key_pairs()
+        self.assertEqual(self.client.describe_key_pairs.call_count, 2)
+
+    def test_subnet_cache_is_keyed_by_vpc(self):
+        """Test that different VPC filters are cached separately."""
+        paginator = Mock()
+        paginator.paginate.side_effect = lambda **kwargs: iter([{'Subnets': [kwargs.get('Filters')]}])
+        self.client.get_paginator.return_value = paginator
+
+        self.reader.list_subnets('vpc-1')
+        self.reader.list_subnets('vpc-2')
+        self.reader.list_subnets('vpc-1')
+
+        self.assertEqual(paginator.paginate.call_count, 2)
+
+
+class TestEC2ReaderGetInstances(unittest.TestCase):
+    """Test cases for batched instance lookups."""
+
+    def setUp(self):
+        """Set up a reader backed by a mocked EC2 client."""
+        from ec2.read.ec2_reader import EC2Reader
+
+        self.client = Mock()
+        client_manager = Mock()
+        client_manager.get_client.return_value = self.client
+        self.reader = EC2Reader(client_manager)
+        self.client.describe_instances.side_effect = lambda InstanceIds: {
+            'Reservations': [{'Instances': [{'InstanceId': i} for i in InstanceIds]}]
+        }
+
+    def test_ids_are_chunked_by_100(self):
+        """Test that 250 IDs take three requests and come back keyed by ID."""
+        ids = [f'i-{n:03d}' for n in range(250)]
+
+        instances = self.reader.get_instances(ids + ids[:5])
+
+        self.assertEqual(self.client.describe_instances.call_count, 3)
+        self.assertEqual(set(instances), set(ids))
+
+    def test_get_instance_not_found(self):
+        """Test that a missing instance raises ResourceNotFoundError."""
+        from botocore.exceptions import ClientError
+        from common.exceptions import ResourceNotFoundError
+
+        self.client.describe_instances.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidInstanceID.NotFound', 'Message': 'missing'}}, 'DescribeInstances'
+        )
+
+        with self.assertRaises(ResourceNotFoundError) as ctx:
+            self.reader.get_instance('i-404')
+        self.assertEqual(str(ctx.exception), 'EC2 instance not found: i-404')
+
+    def test_empty_security_group_result_is_not_found(self):
+        """Test that a missing security group keeps its ResourceNotFoundError."""
+        from common.exceptions import ResourceNotFoundError
+
+        self.client.describe_security_groups.return_value = {'SecurityGroups': []}
+
+        with self.assertRaises(ResourceNotFoundError) as ctx:
+            self.reader.get_security_group('sg-404')
+        self.assertEqual(str(ctx.exception), 'Security group not found: sg-404')
+
+    def test_instance_status_includes_stopped_instances(self):
+        """Test that status comes from one describe_instance_status call."""
+        status = {'InstanceId': 'i-1', 'InstanceState': {'Name': 'stopped'}}
+        self.client.describe_instance_status.return_value = {'InstanceStatuses': [status]}
+
+        self.assertEqual(self.reader.get_instance_status('i-1'), status)
+        self.client.describe_instance_status.assert_called_once_with(
+            InstanceIds=['i-1'], IncludeAllInstances=True
+        )
+        self.client.describe_instances.assert_not_called()
+
+
+class TestEC2ReaderSnapshot(unittest.TestCase):
+    """Test cases for EC2Reader.snapshot."""
+
+    def test_snapshot_collects_every_listing(self):
+        """Test that snapshot returns each resource listing by name."""
+        from ec2.read.ec2_reader import EC2Reader
+
+        client = Mock()
+        client_manager = Mock()
+        client_manager.get_client.return_value = client
+        reader = EC2Reader(client_manager)
+
+        paginator = Mock()
+        paginator.paginate.side_effect = lambda **kwargs: iter([{
+            'Reservations': [{'Instances': [{'InstanceId': 'i-1'}]}],
+            'SecurityGroups': [{'GroupId': 'sg-1'}],
+            'Vpcs': [{'VpcId': 'vpc-1'}],
+            'Subnets': [{'SubnetId': 'subnet-1'}],
+            'Images': [{'ImageId': 'ami-1'}],
+        }])
+        client.get_paginator.return_value = paginator
+        client.describe_key_pairs.return_value = {'KeyPairs': [{'KeyName': 'k'}]}
+
+        snapshot = reader.snapshot()
+
+        self.assertEqual(snapshot['instances'], [{'InstanceId': 'i-1'}])
+        self.assertEqual(snapshot['key_pairs'], [{'KeyName': 'k'}])
+        self.assertEqual(sorted(snapshot), ['amis', 'instances', 'key_pairs',
+                                            'security_groups', 'subnets', 'vpcs'])
+
+class TestEC2ReaderAsync(unittest.TestCase):
+    """Test cases for the async EC2Reader list methods."""
+
+    def setUp(self):
+        """Set up a reader backed by a mocked aioboto3 client."""
+        from unittest.mock import patch
+        from ec2.read.ec2_reader import EC2Reader
+
+        patcher = patch('ec2.read.ec2_reader.aioboto3', Mock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = Mock()
+        self.client.can_paginate.return_value = True
+        self.reader = EC2Reader(Mock())
+        self.reader._async_client = self.client
+
+    def _pages(self, *pages):
+        async def paginate(**kwargs):
+            for page in pages:
+                yield page
+        paginator = Mock()
+        paginator.paginate.side_effect = paginate
+        self.client.get_paginator.return_value = paginator
+        return paginator
+
+    def test_list_reads_every_page_with_shorthand_filters(self):
+        """Test that async listings follow every page and build filters like the sync methods."""
+        import asyncio
+
+        paginator = self._pages({'SecurityGroups': [{'GroupId': 'sg-1'}]},
+                                {'SecurityGroups': [{'GroupId': 'sg-2'}]})
+
+        groups = asyncio.run(self.reader.list_security_groups_async(vpc_id='vpc-1'))
+
+        self.assertEqual([g['GroupId'] for g in groups], ['sg-1', 'sg-2'])
+        self.assertEqual(paginator.paginate.call_args.kwargs['Filters'],
+                         [{'Name': 'vpc-id', 'Values': ['vpc-1']}])
+
+    def test_async_listings_share_the_sync_cache(self):
+        """Test that a VPC listing cached by list_vpcs_async is served to list_vpcs."""
+        import asyncio
+
+        paginator = self._pages({'Vpcs': [{'VpcId': 'vpc-1'}]})
+
+        vpcs = asyncio.run(self.reader.list_vpcs_async())
+
+        self.assertIs(self.reader.list_vpcs(), vpcs)
+        self.assertEqual(paginator.paginate.call_count, 1)
+
+    def test_async_exit_closes_off_the_event_loop(self):
+        """Test that leaving an async with block shuts the worker threads down in a thread."""
+        import asyncio
+        import threading
+        from unittest.mock import patch
+        from ec2.read.ec2_reader import EC2Reader
+
+        closed_on = []
+
+        async def use_reader():
+            async with self.reader:
+                return threading.current_thread()
+
+        with patch.object(EC2Reader, 'close', lambda reader: closed_on.append(threading.current_thread())):
+            loop_thread = asyncio.run(use_reader())
+
+        self.assertEqual(len(closed_on), 1)
+        self.assertIsNot(closed_on[0], loop_thread)
+
+if __name__ == '__main__':
+    unittest.main()
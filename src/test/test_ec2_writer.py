@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Unit tests for EC2 writer functionality
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+# Add the parent src directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+class TestEC2WriterBulkStateChanges(unittest.TestCase):
+    """Test cases for the bulk instance state methods."""
+
+    def setUp(self):
+        """Set up a writer backed by a mocked EC2 client."""
+        from ec2.write.ec2_writer import EC2Writer
+
+        self.client = Mock()
+        operation_model = self.client.meta.service_model.operation_model.return_value
+        operation_model.input_shape.members = {'ImageId': None, 'ClientToken': None, 'EbsOptimized': None}
+        client_manager = Mock()
+        client_manager.get_client.return_value = self.client
+        self.writer = EC2Writer(client_manager)
+
+    def test_client_uses_shared_config(self):
+        """Test that the client is built with the pooled adaptive-retry config."""
+        from common.aws_client import DEFAULT_CLIENT_CONFIG
+
+        self.writer.client_manager.get_client.assert_called_once_with('ec2', config=DEFAULT_CLIENT_CONFIG)
+
+    def test_ids_are_chunked_by_1000(self):
+        """Test that 2500 IDs take three calls and merge their results."""
+        self.client.terminate_instances.side_effect = lambda InstanceIds: {
+            'TerminatingInstances': [{'InstanceId': i} for i in InstanceIds]
+        }
+        ids = [f'i-{n:04d}' for n in range(2500)]
+
+        response = self.writer.terminate_instances(ids)
+
+        self.assertEqual(self.client.terminate_instances.call_count, 3)
+        self.assertEqual([i['InstanceId'] for i in response['TerminatingInstances']], ids)
+
+    def test_single_instance_wrapper(self):
+        """Test that stop_instance delegates with its force flag."""
+        self.client.stop_instances.return_value = {'StoppingInstances': []}
+
+        self.writer.stop_instance('i-1', force=True)
+
+        self.client.stop_instances.assert_called_once_with(InstanceIds=['i-1'], Force=True)
+
+    def test_tags_stream_from_a_generator(self):
+        """Test that tag resource IDs are read lazily in chunks of 1000."""
+        tags = [{'Key': 'Env', 'Value': 'prod'}]
+
+        self.writer.create_tags((f'vol-{n}' for n in range(2001)), tags)
+
+        sizes = [len(c.kwargs['Resources']) for c in self.client.create_tags.call_args_list]
+        self.assertEqual(sizes, [1000, 1000, 1])
+
+    def test_shared_writer_is_memoized_per_manager(self):
+        """Test that get_shared_writer returns one writer per client manager."""
+        from ec2.write.ec2_writer import get_shared_writer
+
+        manager = self.writer.client_manager
+        self.assertIs(get_shared_writer(manager), get_shared_writer(manager))
+        self.assertIsNot(get_shared_writer(manager), get_shared_writer(Mock()))
+
+
+    def test_create_instance_can_wait_for_running(self):
+        """Test that wait=True hands the new IDs to the instance_running waiter."""
+        self.client.run_instances.return_value = {'Instances': [{'InstanceId': 'i-1'}], 'ReservationId': 'r-1'}
+
+        result = self.writer.create_instance('ami-1', wait=True)
+
+        self.assertEqual((result.instance_ids, result.reservation_id, result.raw), (['i-1'], 'r-1', None))
+
+        self.client.get_waiter.assert_called_once_with('instance_running')
+        self.client.get_waiter.return_value.wait.assert_called_once_with(
+            InstanceIds=['i-1'], WaiterConfig={'Delay': 5, 'MaxAttempts': 40}
+        )
+        self.assertNotIn('wait', self.client.run_instances.call_args.kwargs)
+
+    def test_idempotent_launches_share_a_client_token(self):
+        """Test that idempotent launches send the same derived ClientToken and others send none."""
+        response = {'Instances': [{'InstanceId': 'i-1'}], 'ReservationId': 'r-1'}
+        self.client.run_instances.return_value = response
+
+        self.writer.create_instance('ami-1', key_name='k', idempotent=True)
+        self.assertIs(self.writer.create_instance('ami-1', key_name='k', idempotent=True,
+                                                  return_raw=True).raw, response)
+        self.writer.create_instance('ami-1', key_name='k')
+
+        first, second, third = (c.kwargs for c in self.client.run_instances.call_args_list)
+        self.assertEqual(first['ClientToken'], second['ClientToken'])
+        self.assertEqual(len(first['ClientToken']), 40)
+        self.assertNotIn('ClientToken', third)
+
+    def test_unknown_launch_parameters_are_rejected(self):
+        """Test that kwargs outside the RunInstances model fail before the call."""
+        self.client.run_instances.return_value = {'Instances': [], 'ReservationId': 'r-1'}
+
+        self.writer.create_instance('ami-1', EbsOptimized=True)
+        with self.assertRaises(ValueError):
+            self.writer.create_instance('ami-1', EbsOptimised=True)
+
+        self.client.run_instances.assert_called_once()
+
+
+class TestEC2WriterGroupLookup(unittest.TestCase):
+    """Test cases for cached security group name lookups."""
+
+    def setUp(self):
+        """Set up a writer backed by a mocked EC2 client."""
+        from ec2.write.ec2_writer import EC2Writer
+
+        self.client = Mock()
+        self.client.describe_security_groups.return_value = {'SecurityGroups': [{'GroupId': 'sg-1'}]}
+        client_manager = Mock()
+        client_manager.get_client.return_value = self.client
+        self.writer = EC2Writer(client_manager)
+
+    def test_names_are_resolved_once(self):
+        """Test that repeated rule changes by name share one lookup."""
+        rules = [{'IpProtocol': 'tcp', 'FromPort': 22, 'ToPort': 22}]
+
+        self.writer.authorize_security_group_ingress('web', rules, vpc_id='vpc-1')
+        self.writer.revoke_security_group_ingress('web', rules, vpc_id='vpc-1')
+
+        self.client.describe_security_groups.assert_called_once_with(Filters=[
+            {'Name': 'group-name', 'Values': ['web']},
+            {'Name': 'vpc-id', 'Values': ['vpc-1']},
+        ])
+        self.client.revoke_security_group_ingress.assert_called_once_with(GroupId='sg-1', IpPermissions=rules)
+
+    def test_delete_invalidates_lookup(self):
+        """Test that deleting a group drops its cached name lookup."""
+        self.writer.delete_security_group('web')
+        self.writer.authorize_security_group_ingress('web', [])
+
+        self.assertEqual(self.client.describe_security_groups.call_count, 2)
+        self.client.delete_security_group.assert_called_once_with(GroupId='sg-1')
+
+    def test_errors_are_mapped(self):
+        """Test that aws_call maps not-found codes and wraps other failures."""
+        from botocore.exceptions import ClientError
+        from common.exceptions import AWSResourceError, ResourceNotFoundError
+
+        self.client.delete_security_group.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidGroupId.NotFound', 'Message': 'missing'}}, 'DeleteSecurityGroup'
+        )
+        self.client.delete_key_pair.side_effect = RuntimeError('boom')
+
+        with self.assertRaises(ResourceNotFoundError) as ctx:
+            self.writer.delete_security_group('sg-404')
+        self.assertEqual(str(ctx.exception), 'Security group not found: sg-404')
+        with self.assertRaises(AWSResourceError) as ctx:
+            self.writer.delete_key_pair('k')
+        self.assertEqual(str(ctx.exception), 'Failed to delete key pair k: boom')
+
+    def test_reconcile_sends_only_the_difference(self):
+        """Test that reconcile authorizes missing rules and revokes extra ones."""
+        ssh = {'IpProtocol': 'tcp', 'FromPort': 22, 'ToPort': 22}
+        self.client.describe_security_groups.return_value = {'SecurityGroups': [{'IpPermissions': [
+            dict(ssh, IpRanges=[{'CidrIp': '10.0.0.0/8', 'Description': 'vpn'}, {'CidrIp': '0.0.0.0/0'}]),
+        ]}]}
+        desired = [dict(ssh, IpRanges=[{'CidrIp': '10.0.0.0/8'}, {'CidrIp': '192.168.0.0/16'}])]
+
+        result = self.writer.reconcile_security_group_ingress('sg-1', desired)
+
+        self.assertEqual(result['Authorized'], [dict(ssh, IpRanges=[{'CidrIp': '192.168.0.0/16'}])])
+        self.assertEqual(result['Revoked'], [dict(ssh, IpRanges=[{'CidrIp': '0.0.0.0/0'}])])
+        self.client.authorize_security_group_ingress.assert_called_once_with(
+            GroupId='sg-1', IpPermissions=result['Authorized']
+        )
+        self.client.revoke_security_group_ingress.assert_called_once_with(
+            GroupId='sg-1', IpPermissions=result['Revoked']
+        )
+
+
+class TestTagBatcher(unittest.TestCase):
+    """Test cases for buffered tagging."""
+
+    def test_resources_with_same_tags_share_a_call(self):
+        """Test that one call is made per tag set, chunked at 1000 resources."""
+        from ec2.write.tag_batcher import TagBatcher
+
+        writer = Mock()
+        batcher = TagBatcher(writer, flush_threshold=5000)
+        for n in range(1500):
+            batcher.add(f'i-{n:04d}', {'Env': 'prod'})
+        batcher.add('vol-1', [{'Key': 'Env', 'Value': 'dev'}])
+
+        self.assertEqual(batcher.flush(), 3)
+        first_ids, first_tags = writer.create_tags.call_args_list[0].args
+        self.assertEqual(len(first_ids), 1000)
+        self.assertEqual(first_tags, [{'Key': 'Env', 'Value': 'prod'}])
+        writer.create_tags.assert_called_with(['vol-1'], [{'Key': 'Env', 'Value': 'dev'}])
+
+    def test_threshold_triggers_flush(self):
+        """Test that reaching flush_threshold sends the buffer."""
+        from ec2.write.tag_batcher import TagBatcher
+
+        writer = Mock()
+        batcher = TagBatcher(writer, flush_threshold=2)
+        batcher.add('i-1', {'Env': 'prod'})
+        writer.create_tags.assert_not_called()
+        batcher.add('i-2', {'Env': 'prod'})
+
+        writer.create_tags.assert_called_once_with(['i-1', 'i-2'], [{'Key': 'Env', 'Value': 'prod'}])
+
+    def test_failed_flush_keeps_unsent_tags(self):
+        """Test that a failing create_tags call leaves its and later groups buffered."""
+        from common.exceptions import AWSResourceError
+        from ec2.write.tag_batcher import TagBatcher
+
+        writer = Mock()
+        writer.create_tags.side_effect = [None, AWSResourceError('throttled'), None, None]
+        batcher = TagBatcher(writer, flush_threshold=5000)
+        for n in range(1200):
+            batcher.add(f'i-{n:04d}', {'Env': 'prod'})
+        batcher.add('vol-1', {'Env': 'dev'})
+
+        with self.assertRaises(AWSResourceError):
+            batcher.flush()
+        self.assertEqual(batcher.flush(), 2)
+        retried = [c.args[0] for c in writer.create_tags.call_args_list[2:]]
+        self.assertEqual(retried, [[f'i-{n:04d}' for n in range(1000, 1200)], ['vol-1']])
+
+    def test_exit_flushes_after_an_error(self):
+        """Test that leaving the context on an exception still sends the buffer."""
+        from ec2.write.tag_batcher import TagBatcher
+
+        writer = Mock()
+        with self.assertRaises(KeyError):
+            with TagBatcher(writer) as batcher:
+                batcher.add('i-1', {'Env': 'prod'})
+                raise KeyError('boom')
+        writer.create_tags.assert_called_once_with(['i-1'], [{'Key': 'Env', 'Value': 'prod'}])
+
+
+class TestAsyncEC2Writer(unittest.TestCase):
+    """Test cases for AsyncEC2Writer on an aioboto3 client."""
+
+    def setUp(self):
+        """Set up an async writer backed by a mocked aioboto3 client."""
+        from unittest.mock import AsyncMock, patch
+        from ec2.write.ec2_writer_async import AsyncEC2Writer
+
+        patcher = patch('ec2.write.ec2_writer_async.aioboto3', Mock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = AsyncMock()
+        self.writer = AsyncEC2Writer(Mock())
+        self.writer._client = self.client
+
+    def test_chunks_are_sent_concurrently_and_merged(self):
+        """Test that 1500 IDs take two awaited calls with merged results."""
+        import asyncio
+
+        async def terminate(InstanceIds):
+            return {'TerminatingInstances': [{'InstanceId': i} for i in InstanceIds]}
+        self.client.terminate_instances.side_effect = terminate
+        ids = [f'i-{n:04d}' for n in range(1500)]
+
+        response = asyncio.run(self.writer.terminate_instances(ids))
+
+        self.assertEqual(self.client.terminate_instances.await_count, 2)
+        self.assertEqual([i['InstanceId'] for i in response['TerminatingInstances']], ids)
+
+    def test_missing_group_raises_not_found(self):
+        """Test that a missing security group keeps its ResourceNotFoundError."""
+        import asyncio
+        from botocore.exceptions import ClientError
+        from common.exceptions import ResourceNotFoundError
+
+        self.client.delete_security_group.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidGroupId.NotFound', 'Message': 'missing'}}, 'DeleteSecurityGroup'
+        )
+
+        with self.assertRaises(ResourceNotFoundError) as ctx:
+            asyncio.run(self.writer.delete_security_group('sg-404'))
+        self.assertEqual(str(ctx.exception), 'Security group not found: sg-404')
+
+    def test_errors_are_mapped_like_the_sync_writer(self):
+        """Test that permission errors and key pair lookups use EC2Writer's error map."""
+        import asyncio
+        from botocore.exceptions import ClientError
+        from common.exceptions import AWSPermissionException, ResourceNotFoundError
+
+        denied = ClientError({'Error': {'Code': 'UnauthorizedOperation', 'Message': 'no'}}, 'CreateKeyPair')
+        self.client.create_key_pair.side_effect = denied
+        with self.assertRaises(AWSPermissionException) as ctx:
+            asyncio.run(self.writer.create_key_pair('deploy'))
+        self.assertIs(ctx.exception.__cause__, denied)
+
+        self.client.delete_key_pair.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidKeyPair.NotFound', 'Message': 'missing'}}, 'DeleteKeyPair'
+        )
+        with self.assertRaises(ResourceNotFoundError) as ctx:
+            asyncio.run(self.writer.delete_key_pair('deploy'))
+        self.assertEqual(str(ctx.exception), 'Key pair not found: deploy')
+
+    def test_tags_are_sent_in_chunks_of_1000(self):
+        """Test that tagging 2500 resources takes three CreateTags calls."""
+        import asyncio
+
+        ids = [f'i-{n:04d}' for n in range(2500)]
+        asyncio.run(self.writer.create_tags(ids, [{'Key': 'Env', 'Value': 'prod'}]))
+
+        sizes = [len(c.kwargs['Resources']) for c in self.client.create_tags.await_args_list]
+        self.assertEqual(sizes, [1000, 1000, 500])
+
+    def test_falls_back_to_threads_without_async_extra(self):
+        """Test that without aioboto3 or anyio the calls run on EC2Writer's boto3 client."""
+        import asyncio
+        from unittest.mock import patch
+        from ec2.write.ec2_writer_async import AsyncEC2Writer
+
+        manager = Mock()
+        sync_client = manager.get_client.return_value
+        with patch('ec2.write.ec2_writer_async.aioboto3', None), patch('common.threads.anyio', None):
+            asyncio.run(AsyncEC2Writer(manager).create_tags(['i-1'], [{'Key': 'Env', 'Value': 'prod'}]))
+
+        sync_client.create_tags.assert_called_once_with(Resources=['i-1'], Tags=[{'Key': 'Env', 'Value': 'prod'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
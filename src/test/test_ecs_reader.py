@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ECS reader functionality
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+# Add the parent src directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+class TestECSReaderListing(unittest.TestCase):
+    """Test cases for the paginated ECSReader list methods."""
+
+    def setUp(self):
+        """Set up a reader backed by a mocked ECS client."""
+        from ecs.read.ecs_reader import ECSReader
+
+        self.client = Mock()
+        with patch('ecs.read.ecs_reader.AWSClientManager') as manager_class:
+            manager_class.return_value.get_client.return_value = self.client
+            self.reader = ECSReader()
+
+    def _pages(self, *pages):
+        paginator = Mock()
+        paginator.paginate.return_value = iter(pages)
+        self.client.get_paginator.return_value = paginator
+        return paginator
+
+    def test_client_uses_shared_config(self):
+        """Test that the client is built with the pooled adaptive-retry config."""
+        from common.aws_client import DEFAULT_CLIENT_CONFIG
+
+        self.reader.client_manager.get_client.assert_called_once_with('ecs', config=DEFAULT_CLIENT_CONFIG)
+        self.assertGreaterEqual(DEFAULT_CLIENT_CONFIG.max_pool_connections, 10)
+
+    def test_list_services_reads_every_page(self):
+        """Test that service ARNs from all pages are described."""
+        paginator = self._pages({'serviceArns': ['s1', 's2']}, {'serviceArns': ['s3']})
+        self.client.describe_services.return_value = {'services': [{'serviceName': 's'}]}
+
+        self.reader.list_services('prod')
+
+        self.client.get_paginator.assert_called_once_with('list_services')
+        paginator.paginate.assert_called_once_with(cluster='prod', PaginationConfig={'PageSize': 100})
+        described = [c.kwargs['services'] for c in self.client.describe_services.call_args_list]
+        self.assertEqual(described, [['s1', 's2'], ['s3']])
+
+    def test_iter_tasks_describes_each_page_as_it_arrives(self):
+        """Test that iter_tasks yields the first page before listing the next."""
+        def pages(**kwargs):
+            yield {'taskArns': ['t1', 't2']}
+            self.fail('second page requested before the first was consumed')
+
+        self._pages().paginate.side_effect = pages
+        self.client.describe_tasks.side_effect = lambda tasks: {'tasks': [{'taskArn': t} for t in tasks]}
+
+        tasks = self.reader.iter_tasks()
+
+        self.assertEqual([next(tasks)['taskArn'], next(tasks)['taskArn']], ['t1', 't2'])
+        self.client.describe_tasks.assert_called_once_with(tasks=['t1', 't2'])
+
+    def test_max_results_caps_items(self):
+        """Test that max_results becomes the paginator's MaxItems."""
+        paginator = self._pages({'clusterArns': []})
+
+        self.assertEqual(self.reader.list_clusters(max_results=5), [])
+        paginator.paginate.assert_called_once_with(PaginationConfig={'PageSize': 100, 'MaxItems': 5})
+        self.client.describe_clusters.assert_not_called()
+
+    def test_include_is_forwarded_to_describe(self):
+        """Test that include reaches the describe call but not the list call."""
+        paginator = self._pages({'taskArns': ['t1']})
+        self.client.describe_tasks.return_value = {'tasks': [{'taskArn': 't1', 'tags': []}]}
+
+        self.reader.list_tasks('prod', include=['TAGS'])
+
+        paginator.paginate.assert_called_once_with(cluster='prod', PaginationConfig={'PageSize': 100})
+        self.client.describe_tasks.assert_called_once_with(tasks=['t1'], cluster='prod', include=['TAGS'])
+
+    def test_duplicate_arns_are_described_once(self):
+        """Test that repeated ARNs are dropped before the describe call."""
+        self._pages({'containerInstanceArns': ['c1', 'c2', 'c1']})
+        self.client.describe_container_instances.return_value = {'containerInstances': []}
+
+        self.reader.list_container_instances()
+
+        self.client.describe_container_instances.assert_called_once_with(containerInstances=['c1', 'c2'])
+
+    def test_task_definitions_use_full_pages(self):
+        """Test that task definitions are listed 100 per page."""
+        paginator = self._pages({'taskDefinitionArns': ['td:1']}, {'taskDefinitionArns': ['td:2']})
+
+        self.assertEqual(self.reader.list_task_definitions(), ['td:1', 'td:2'])
+        paginator.paginate.assert_called_once_with(status='ACTIVE', PaginationConfig={'PageSize': 100})
+
+    def test_describe_calls_are_chunked(self):
+        """Test that services are described 10 and tasks 100 per call."""
+        page = {'serviceArns': [f's{n}' for n in range(25)], 'taskArns': [f't{n}' for n in range(150)]}
+        self._pages().paginate.side_effect = lambda **kwargs: iter([page])
+        self.client.describe_services.side_effect = lambda cluster, services: {'services': services}
+        self.client.describe_tasks.side_effect = lambda cluster, tasks: {'tasks': tasks}
+
+        self.assertEqual(len(self.reader.list_services('prod')), 25)
+        self.assertEqual(len(self.reader.list_tasks('prod')), 150)
+
+        self.assertEqual(self.client.describe_services.call_count, 3)
+        self.assertEqual(self.client.describe_tasks.call_count, 2)
+
+    def test_concurrent_chunks_keep_arn_order(self):
+        """Test that chunks described on worker threads come back in ARN order."""
+        arns = [f's{n}' for n in range(35)]
+        self._pages({'serviceArns': arns})
+        self.client.describe_services.side_effect = lambda services: {
+            'services': [{'serviceArn': arn} for arn in services]
+        }
+
+        with self.reader as reader:
+            services = reader.list_services()
+
+        self.assertEqual([s['serviceArn'] for s in services], arns)
+        self.reader.client_manager.close.assert_called_once()
+
+
+class TestECSReaderCache(unittest.TestCase):
+    """Test cases for cached ECSReader describe calls."""
+
+    def setUp(self):
+        """Set up a reader backed by a mocked ECS client."""
+        from ecs.read.ecs_reader import ECSReader
+
+        self.client = Mock()
+        with patch('ecs.read.ecs_reader.AWSClientManager') as manager_class:
+            manager_class.return_value.get_client.return_value = self.client
+            self.reader = ECSReader()
+
+    def test_describe_service_is_cached_until_cleared(self):
+        """Test that repeat describes skip the API until the cache is dropped."""
+        self.client.describe_services.return_value = {'services': [{'serviceName': 'web'}]}
+
+        self.reader.describe_service('web', 'prod')
+        self.reader.describe_service('web', 'prod')
+        self.assertEqual(self.client.describe_services.call_count, 1)
+
+        self.reader.describe_service('web', 'prod', use_cache=False)
+        self.reader.clear_cache()
+        self.reader.describe_service('web', 'prod')
+        self.assertEqual(self.client.describe_services.call_count, 3)
+
+    def test_listed_clusters_seed_describe_cluster(self):
+        """Test that a cluster from list_clusters is described from the cache by name or ARN."""
+        arn = 'arn:aws:ecs:us-east-1:1:cluster/prod'
+        paginator = Mock()
+        paginator.paginate.return_value = iter([{'clusterArns': [arn]}])
+        self.client.get_paginator.return_value = paginator
+        self.client.describe_clusters.return_value = {'clusters': [{'clusterName': 'prod', 'clusterArn': arn}]}
+
+        self.reader.list_clusters()
+
+        self.assertEqual(self.reader.describe_cluster('prod')['clusterArn'], arn)
+        self.assertEqual(self.reader.describe_cluster(arn)['clusterName'], 'prod')
+        self.reader.describe_cluster('prod', include=['TAGS'])
+        self.assertEqual(self.client.describe_clusters.call_count, 2)
+
+    def test_task_counts_share_one_describe(self):
+        """Test that desired and running counts come from one DescribeServices call."""
+        self.client.describe_services.return_value = {
+            'services': [{'serviceName': 'web', 'desiredCount': 3, 'runningCount': 2}]
+        }
+
+        self.assertEqual(self.reader.get_service_task_count('prod', 'web'), 3)
+        self.assertEqual(self.reader.get_running_task_count('prod', 'web'), 2)
+        self.client.describe_services.assert_called_once_with(services=['web'], cluster='prod')
+
+    def test_task_definition_revisions_are_pinned(self):
+        """Test that only immutable task definition references skip the TTL cache."""
+        self.client.describe_task_definition.return_value = {'taskDefinition': {'revision': 3}}
+
+        for task_definition in ('web:3', 'arn:aws:ecs:us-east-1:1:task-definition/web:3', 'web', 'web:3'):
+            self.reader.describe_task_definition(task_definition)
+
+        self.assertEqual(self.client.describe_task_definition.call_count, 3)
+        self.assertEqual((len(self.reader._task_definitions), len(self.reader._cache)), (2, 1))
+        self.reader.clear_cache()
+        self.assertEqual(len(self.reader._task_definitions), 0)
+
+    def test_list_tasks_can_prefetch_task_definitions(self):
+        """Test that each distinct task definition is described once and then cached."""
+        paginator = Mock()
+        paginator.paginate.return_value = iter([{'taskArns': ['t1', 't2', 't3']}])
+        self.client.get_paginator.return_value = paginator
+        self.client.describe_tasks.return_value = {'tasks': [
+            {'taskArn': 't1', 'taskDefinitionArn': 'arn:td/web:1'},
+            {'taskArn': 't2', 'taskDefinitionArn': 'arn:td/web:1'},
+            {'taskArn': 't3', 'taskDefinitionArn': 'arn:td/worker:4'},
+        ]}
+        self.client.describe_task_definition.return_value = {'taskDefinition': {}}
+
+        self.reader.list_tasks('prod', prefetch_task_definitions=True)
+        self.reader.describe_task_definition('arn:td/worker:4')
+
+        described = sorted(c.kwargs['taskDefinition'] for c in self.client.describe_task_definition.call_args_list)
+        self.assertEqual(described, ['arn:td/web:1', 'arn:td/worker:4'])
+
+
+
+class TestAsyncECSReader(unittest.TestCase):
+    """Test cases for AsyncECSReader on an aioboto3 client."""
+
+    def setUp(self):
+        """Set up an async reader backed by a mocked aioboto3 client."""
+        from unittest.mock import AsyncMock, patch
+        from ecs.read.ecs_reader_async import AsyncECSReader
+
+        patcher = patch('ecs.read.ecs_reader_async.aioboto3', Mock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        async def pages(cluster, PaginationConfig):
+            yield {'serviceArns': [f'{cluster}-svc-{n}' for n in range(12)]}
+
+        async def describe_services(services, cluster):
+            return {'services': [{'serviceArn': arn} for arn in services]}
+
+        self.client = Mock()
+        self.client.get_paginator.return_value.paginate.side_effect = pages
+        self.client.describe_services = AsyncMock(side_effect=describe_services)
+        self.reader = AsyncECSReader(max_concurrency=2)
+        self.reader._client = self.client
+
+    def test_services_are_listed_per_cluster(self):
+        """Test that each cluster's services are listed, chunked and keyed by cluster."""
+        import asyncio
+
+        result = asyncio.run(self.reader.list_services_for_clusters(['a', 'b', 'c']))
+
+        self.assertEqual(list(result), ['a', 'b', 'c'])
+        self.assertEqual([s['serviceArn'] for s in result['b']], [f'b-svc-{n}' for n in range(12)])
+        self.assertEqual(self.client.describe_services.await_count, 6)
+
+    def test_falls_back_to_threads_without_async_extra(self):
+        """Test that without aioboto3 or anyio list_services runs on ECSReader in a thread."""
+        import asyncio
+        from ecs.read.ecs_reader_async import AsyncECSReader
+
+        client = Mock()
+        client.get_paginator.return_value.paginate.return_value = iter([{'serviceArns': ['svc-1']}])
+        client.describe_services.return_value = {'services': [{'serviceArn': 'svc-1'}]}
+
+        async def list_services():
+            async with AsyncECSReader() as reader:
+                return await reader.list_services('prod')
+
+        with patch('ecs.read.ecs_reader_async.aioboto3', None), patch('common.threads.anyio', None), \
+                patch('ecs.read.ecs_reader.AWSClientManager') as manager_class:
+            manager_class.return_value.get_client.return_value = client
+            services = asyncio.run(list_services())
+
+        self.assertEqual(services, [{'serviceArn': 'svc-1'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ECS writer functionality
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+# Add the parent src directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+class TestECSWriter(unittest.TestCase):
+    """Test cases for ECSWriter client setup."""
+
+    def setUp(self):
+        """Patch the client manager and reset the shared manager cache."""
+        from unittest.mock import patch
+        from ecs.write.ecs_writer import _get_client_manager
+
+        patcher = patch('ecs.write.ecs_writer.AWSClientManager')
+        self.manager_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        _get_client_manager.cache_clear()
+        self.addCleanup(_get_client_manager.cache_clear)
+
+    def test_writers_share_a_client_manager(self):
+        """Test that writers build one manager per profile and region, on first use."""
+        from ecs.write.ecs_writer import ECSWriter
+
+        first, second = ECSWriter(), ECSWriter()
+        other_region = ECSWriter(region_name='eu-west-1')
+        self.manager_class.assert_not_called()
+
+        self.assertIs(first.ecs_client, second.ecs_client)
+        other_region.ecs_client
+        self.assertEqual(self.manager_class.call_count, 2)
+        self.manager_class.assert_called_with('default', 'eu-west-1')
+        self.assertFalse(hasattr(first, '__dict__'))
+
+    def test_client_uses_shared_config(self):
+        """Test that the client is built with the pooled adaptive-retry config."""
+        from common.aws_client import DEFAULT_CLIENT_CONFIG
+        from ecs.write.ecs_writer import ECSWriter
+
+        writer = ECSWriter()
+        writer.ecs_client
+        writer.client_manager.get_client.assert_called_once_with('ecs', config=DEFAULT_CLIENT_CONFIG)
+
+    def test_unset_options_are_left_out(self):
+        """Test that only the optional parameters that were given are sent."""
+        from ecs.write.ecs_writer import ECSWriter
+
+        writer = ECSWriter()
+        writer.create_service('web', 'web:1', cluster='prod', launch_type='FARGATE', tags=[])
+        writer.update_service('web', desired_count=0)
+
+        writer.ecs_client.create_service.assert_called_once_with(
+            serviceName='web', taskDefinition='web:1', desiredCount=1, cluster='prod', launchType='FARGATE'
+        )
+        writer.ecs_client.update_service.assert_called_once_with(service='web', desiredCount=0)
+
+    def test_errors_are_mapped(self):
+        """Test that _ecs_call maps not-found codes and wraps other failures."""
+        from botocore.exceptions import ClientError
+        from common.exceptions import AWSResourceError, ResourceNotFoundError
+        from ecs.write.ecs_writer import ECSWriter
+
+        writer = ECSWriter()
+        writer.ecs_client.delete_cluster.side_effect = ClientError(
+            {'Error': {'Code': 'ClusterNotFoundException', 'Message': 'missing'}}, 'DeleteCluster'
+        )
+        writer.ecs_client.create_cluster.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidParameterException', 'Message': 'bad name'}}, 'CreateCluster'
+        )
+
+        with self.assertRaises(ResourceNotFoundError) as ctx:
+            writer.delete_cluster('prod')
+        self.assertEqual(str(ctx.exception), 'ECS cluster not found: prod')
+        with self.assertRaises(AWSResourceError) as ctx:
+            writer.create_cluster(cluster_name='bad!')
+        self.assertEqual(str(ctx.exception), 'Failed to create ECS cluster bad!: bad name')
+
+        writer.ecs_client.delete_service.return_value = {}
+        with self.assertRaises(AWSResourceError) as ctx:
+            writer.delete_service('web')
+        self.assertEqual(str(ctx.exception), "Failed to delete ECS service web: response has no 'service' key")
+
+    def test_identical_task_definitions_reuse_the_latest_revision(self):
+        """Test that reuse_identical returns a stored revision only while it is the family's latest."""
+        from ecs.write.ecs_writer import ECSWriter
+
+        writer = ECSWriter()
+        revisions = []
+
+        def register(family, containerDefinitions, **kwargs):
+            revisions.append({'taskDefinitionArn': f'arn:td/{family}:{len(revisions) + 1}',
+                              'family': family, 'revision': len(revisions) + 1})
+            return {'taskDefinition': revisions[-1]}
+        writer.ecs_client.register_task_definition.side_effect = register
+        writer.ecs_client.describe_task_definition.side_effect = lambda taskDefinition: {
+            'taskDefinition': revisions[-1]
+        }
+        a = [{'name': 'app', 'image': 'nginx:1'}]
+        b = [{'name': 'app', 'image': 'nginx:2'}]
+
+        writer.register_task_definition('web', a, reuse_identical=True)
+        self.assertEqual(writer.register_task_definition('web', a, reuse_identical=True)['revision'], 1)
+        writer.register_task_definition('web', b, reuse_identical=True)
+        self.assertEqual(writer.register_task_definition('web', a, reuse_identical=True)['revision'], 3)
+        self.assertEqual(writer.register_task_definition('web', a)['revision'], 4)
+
+        self.assertEqual(writer.ecs_client.register_task_definition.call_count, 4)
+
+    def test_create_services_bulk(self):
+        """Test that bulk creation keeps spec order and the iterator yields every service."""
+        from ecs.write.ecs_writer import ECSWriter
+
+        writer = ECSWriter()
+        writer.ecs_client.create_service.side_effect = lambda **kwargs: {'service': {'serviceName': kwargs['serviceName']}}
+        specs = [{'service_name': f's{n}', 'task_definition': 'web:1'} for n in range(30)]
+
+        services = writer.create_services_bulk(specs, max_workers=8)
+        streamed = list(writer.iter_create_services(specs))
+
+        self.assertEqual([s['serviceName'] for s in services], [spec['service_name'] for spec in specs])
+        self.assertCountEqual(streamed, services)
+        self.assertEqual(writer.create_services_bulk([]), [])
+
+    def test_prepared_create_service_sends_fixed_fields(self):
+        """Test that a prepared create_service maps its positional fields to request names."""
+        from ecs.write.ecs_writer import ECSWriter
+
+        writer = ECSWriter()
+        writer.ecs_client.create_service.return_value = {'service': {'serviceName': 'api'}}
+
+        create = writer.prepare_create_service(('cluster', 'launch_type'))
+        self.assertEqual(create('api', 'web:3', 'prod', 'FARGATE', desired_count=2), {'serviceName': 'api'})
+
+        writer.ecs_client.create_service.assert_called_once_with(
+            serviceName='api', taskDefinition='web:3', desiredCount=2, cluster='prod', launchType='FARGATE'
+        )
+        with self.assertRaises(ValueError):
+            writer.prepare_create_service(('cluster', 'tagz'))
+
+    def test_large_run_task_counts_are_split(self):
+        """Test that count=25 becomes RunTask calls of 10, 10 and 5 with merged results."""
+        from ecs.write.ecs_writer import ECSWriter
+
+        writer = ECSWriter()
+        writer.ecs_client.run_task.side_effect = lambda count, **kwargs: {
+            'tasks': [{'taskArn': 't'}] * count, 'failures': [{'reason': 'RESOURCE:CPU'}] if count < 10 else []
+        }
+
+        response = writer.run_task('web:1', 'prod', count=25)
+
+        self.assertEqual(sorted(c.kwargs['count'] for c in writer.ecs_client.run_task.call_args_list), [5, 10, 10])
+        self.assertEqual((len(response['tasks']), len(response['failures'])), (25, 1))
+
+    def test_failed_run_task_chunk_keeps_started_tasks(self):
+        """Test that a failed RunTask chunk becomes a failure next to the tasks already started."""
+        from botocore.exceptions import ClientError
+        from ecs.write.ecs_writer import ECSWriter
+
+        def run_task(count, **kwargs):
+            if count < 10:
+                raise ClientError({'Error': {'Code': 'ThrottlingException', 'Message': 'slow down'}}, 'RunTask')
+            return {'tasks': [{'taskArn': 't'}] * count, 'failures': []}
+        writer = ECSWriter()
+        writer.ecs_client.run_task.side_effect = run_task
+
+        response = writer.run_task('web:1', 'prod', count=25)
+
+        self.assertEqual(len(response['tasks']), 20)
+        self.assertEqual([f['reason'] for f in response['failures']], ['ThrottlingException'])
+
+    def test_run_task_chunk_connection_error_keeps_started_tasks(self):
+        """Test that a chunk failing below the API, e.g. on a timeout, is recorded as a failure too."""
+        from botocore.exceptions import ReadTimeoutError
+        from ecs.write.ecs_writer import ECSWriter
+
+        def run_task(count, **kwargs):
+            if count < 10:
+                raise ReadTimeoutError(endpoint_url='https://ecs.us-east-1.amazonaws.com')
+            return {'tasks': [{'taskArn': 't'}] * count, 'failures': []}
+        writer = ECSWriter()
+        writer.ecs_client.run_task.side_effect = run_task
+
+        response = writer.run_task('web:1', 'prod', count=25)
+
+        self.assertEqual(len(response['tasks']), 20)
+        self.assertEqual([f['reason'] for f in response['failures']], ['ReadTimeoutError'])
+
+    def test_stop_tasks_bulk_keeps_order(self):
+        """Test that every task is stopped and results follow the ARN order."""
+        from ecs.write.ecs_writer import ECSWriter
+
+        writer = ECSWriter()
+        writer.ecs_client.stop_task.side_effect = lambda task, cluster: {'task': {'taskArn': task}}
+        arns = [f't{n}' for n in range(120)]
+
+        tasks = writer.stop_tasks_bulk(arns, 'prod')
+
+        self.assertEqual([t['taskArn'] for t in tasks], arns)
+        self.assertEqual(writer.ecs_client.stop_task.call_count, 120)
+
+    def test_task_stopper_flushes_on_size_and_delay(self):
+        """Test that a full batch flushes at once and a partial one after max_delay."""
+        from ecs.write.ecs_writer import ECSWriter
+
+        writer = ECSWriter()
+        writer.ecs_client.stop_task.side_effect = lambda task: {'task': {'taskArn': task}}
+
+        with writer.task_stopper(max_size=2, max_delay=0.05) as stopper:
+            first = [stopper.submit('t1'), stopper.submit('t2')]
+            self.assertTrue(all(f.done() for f in first))
+            late = stopper.submit('t3')
+            self.assertEqual(late.result(timeout=1)['taskArn'], 't3')
+
+    def test_task_stopper_fails_only_the_missing_task(self):
+        """Test that one failed stop doesn't fail the other futures in its batch."""
+        from botocore.exceptions import ClientError
+        from common.exceptions import ResourceNotFoundError
+        from ecs.write.ecs_writer import ECSWriter
+
+        def stop_task(task):
+            if task == 'gone':
+                raise ClientError({'Error': {'Code': 'TaskNotFoundException', 'Message': 'x'}}, 'StopTask')
+            return {'task': {'taskArn': task}}
+        writer = ECSWriter()
+        writer.ecs_client.stop_task.side_effect = stop_task
+
+        with writer.task_stopper(max_size=3) as stopper:
+            futures = [stopper.submit(arn) for arn in ('t1', 'gone', 't2')]
+        self.assertEqual(futures[0].result()['taskArn'], 't1')
+        self.assertIsInstance(futures[1].exception(), ResourceNotFoundError)
+        self.assertEqual(futures[2].result()['taskArn'], 't2')
+
+    def test_batcher_fails_futures_without_results(self):
+        """Test that items flush_fn returned no result for get an exception instead of hanging."""
+        from ecs.write._batcher import Batcher
+
+        with Batcher(lambda items: items[:1], max_size=10) as batcher:
+            futures = [batcher.submit(n) for n in range(3)]
+        self.assertEqual(futures[0].result(timeout=1), 0)
+        self.assertIsInstance(futures[2].exception(timeout=1), RuntimeError)
+
+    def test_throttling_opens_the_circuit(self):
+        """Test that repeated throttles fail fast until a trial call succeeds."""
+        from unittest.mock import patch
+        from botocore.exceptions import ClientError
+        from common.exceptions import AWSResourceError
+        from ecs.write._breaker import CircuitBreaker
+        from ecs.write.ecs_writer import ECSWriter
+
+        now = [0.0]
+        breaker = CircuitBreaker(threshold=2, window=10, cooldown=5, clock=lambda: now[0])
+        patcher = patch('ecs.write.ecs_writer._breaker', breaker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        writer = ECSWriter()
+        writer.ecs_client.delete_service.side_effect = ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}}, 'DeleteService'
+        )
+
+        for _ in range(2):
+            with self.assertRaises(AWSResourceError):
+                writer.delete_service('web')
+        with self.assertRaises(AWSResourceError) as ctx:
+            writer.delete_service('web')
+        self.assertEqual(str(ctx.exception), 'Failed to delete ECS service web: circuit open after repeated throttling')
+        self.assertEqual(writer.ecs_client.delete_service.call_count, 2)
+
+        now[0] = 6.0
+        writer.ecs_client.delete_service.side_effect = None
+        writer.ecs_client.delete_service.return_value = {'service': {'serviceName': 'web'}}
+        writer.delete_service('web')
+        writer.delete_service('web')
+        self.assertEqual(writer.ecs_client.delete_service.call_count, 4)
+
+    def test_circuits_are_kept_per_profile(self):
+        """Test that throttling under one profile leaves another profile's circuit closed."""
+        from unittest.mock import patch
+        from botocore.exceptions import ClientError
+        from common.exceptions import AWSResourceError
+        from ecs.write._breaker import CircuitBreaker
+        from ecs.write.ecs_writer import ECSWriter
+
+        patcher = patch('ecs.write.ecs_writer._breaker', CircuitBreaker(threshold=1, window=10, cooldown=60))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        throttled, other = ECSWriter('tenant-a'), ECSWriter('tenant-b')
+        throttled.ecs_client.delete_service.side_effect = ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}}, 'DeleteService'
+        )
+
+        for _ in range(2):
+            with self.assertRaises(AWSResourceError):
+                throttled.delete_service('web')
+        self.assertEqual(throttled.ecs_client.delete_service.call_count, 1)
+
+        throttled.ecs_client.delete_service.side_effect = None
+        throttled.ecs_client.delete_service.return_value = {'service': {'serviceName': 'web'}}
+        other.delete_service('web')
+        self.assertEqual(other.ecs_client.delete_service.call_count, 2)
+
+    def test_explicit_zero_settings_are_kept(self):
+        """Test that an explicit 0 is not replaced by the environment default."""
+        from ecs.write._breaker import CircuitBreaker
+
+        breaker = CircuitBreaker(threshold=0, window=0, cooldown=0)
+
+        self.assertEqual((breaker.threshold, breaker.window, breaker.cooldown), (0, 0, 0))
+
+
+class TestAsyncECSWriter(unittest.TestCase):
+    """Test cases for AsyncECSWriter on an aioboto3 client."""
+
+    def setUp(self):
+        """Set up an async writer backed by a mocked aioboto3 client."""
+        from unittest.mock import AsyncMock, patch
+        from ecs.write.ecs_writer_async import AsyncECSWriter
+
+        patcher = patch('ecs.write.ecs_writer_async.aioboto3', Mock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = AsyncMock()
+        self.writer = AsyncECSWriter()
+        self.writer._client = self.client
+
+    def test_deletes_can_be_gathered(self):
+        """Test that concurrent deletes each send their own request."""
+        import asyncio
+
+        async def delete_service(service, cluster):
+            return {'service': {'serviceName': service}}
+        self.client.delete_service.side_effect = delete_service
+
+        async def delete_all():
+            return await asyncio.gather(*(self.writer.delete_service(f'svc-{n}', 'prod') for n in range(5)))
+
+        services = asyncio.run(delete_all())
+
+        self.assertEqual([s['serviceName'] for s in services], [f'svc-{n}' for n in range(5)])
+        self.assertEqual(self.client.delete_service.await_count, 5)
+
+    def test_response_without_result_key_raises(self):
+        """Test that a response missing the returned key raises like ECSWriter instead of returning {}."""
+        import asyncio
+        from common.exceptions import AWSResourceError
+
+        self.client.delete_service.return_value = {}
+
+        with self.assertRaises(AWSResourceError) as ctx:
+            asyncio.run(self.writer.delete_service('web', 'prod'))
+        self.assertEqual(str(ctx.exception), "Failed to delete ECS service web: response has no 'service' key")
+
+    def test_failed_run_task_chunk_keeps_started_tasks(self):
+        """Test that a failed RunTask chunk doesn't discard the other chunks' tasks."""
+        import asyncio
+        from botocore.exceptions import ClientError
+
+        async def run_task(count, **kwargs):
+            if count < 10:
+                raise ClientError({'Error': {'Code': 'ThrottlingException', 'Message': 'slow down'}}, 'RunTask')
+            return {'tasks': [{'taskArn': 't'}] * count, 'failures': []}
+        self.client.run_task.side_effect = run_task
+
+        response = asyncio.run(self.writer.run_task('web:1', 'prod', count=15))
+
+        self.assertEqual(len(response['tasks']), 10)
+        self.assertEqual([f['reason'] for f in response['failures']], ['ThrottlingException'])
+
+    def test_falls_back_to_threads_without_async_extra(self):
+        """Test that without aioboto3 or anyio calls run on ECSWriter's client in the writer's own pool."""
+        import asyncio
+        from unittest.mock import patch
+        from ecs.write.ecs_writer_async import AsyncECSWriter
+
+        async def delete_cluster():
+            async with AsyncECSWriter(max_threads=2) as writer:
+                cluster = await writer.delete_cluster('prod')
+                self.assertEqual(writer._limiter._max_workers, 2)
+                return cluster
+
+        from ecs.write.ecs_writer import _get_client_manager
+
+        _get_client_manager.cache_clear()
+        self.addCleanup(_get_client_manager.cache_clear)
+        with patch('ecs.write.ecs_writer_async.aioboto3', None), patch('common.threads.anyio', None), \
+                patch('ecs.write.ecs_writer.AWSClientManager') as manager_class:
+            sync_client = manager_class.return_value.get_client.return_value
+            sync_client.delete_cluster.return_value = {'cluster': {'clusterName': 'prod'}}
+            self.assertEqual(asyncio.run(delete_cluster()), {'clusterName': 'prod'})
+
+    def test_in_regions_shares_one_session(self):
+        """Test that each region gets its own client from one shared session."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from ecs.write import ecs_writer_async
+
+        regional_client = AsyncMock()
+        regional_client.delete_cluster.return_value = {'cluster': {'clusterName': 'eu'}}
+        session = ecs_writer_async.aioboto3.Session.return_value
+        session.client.return_value.__aenter__ = AsyncMock(return_value=regional_client)
+        session.client.return_value.__aexit__ = AsyncMock()
+        self.client.delete_cluster.return_value = {'cluster': {'clusterName': 'us'}}
+
+        async def delete_everywhere():
+            result = await self.writer.in_regions(['us-east-1', 'eu-west-1'], 'delete_cluster', 'prod')
+            await self.writer.aclose()
+            return result
+
+        result = asyncio.run(delete_everywhere())
+
+        self.assertEqual(result, {'us-east-1': {'clusterName': 'us'}, 'eu-west-1': {'clusterName': 'eu'}})
+        ecs_writer_async.aioboto3.Session.assert_called_once_with(profile_name='default')
+        self.assertEqual(session.client.call_args.kwargs['region_name'], 'eu-west-1')
+        session.client.return_value.__aexit__.assert_awaited_once()
+
+    def test_missing_service_raises_not_found(self):
+        """Test that ServiceNotFoundException keeps its ResourceNotFoundError."""
+        import asyncio
+        from botocore.exceptions import ClientError
+        from common.exceptions import ResourceNotFoundError
+
+        self.client.update_service.side_effect = ClientError(
+            {'Error': {'Code': 'ServiceNotFoundException', 'Message': 'missing'}}, 'UpdateService'
+        )
+
+        with self.assertRaises(ResourceNotFoundError) as ctx:
+            asyncio.run(self.writer.scale_service('web', 'prod', 0))
+        self.assertEqual(str(ctx.exception), 'ECS service not found: web')
+        self.client.update_service.assert_awaited_once_with(service='web', cluster='prod', desiredCount=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Unit tests for EKS reader functionality
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+# Add the parent src directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+class TestEKSReader(unittest.TestCase):
+    """Test cases for EKSReader."""
+
+    def setUp(self):
+        """Set up a reader backed by a mocked EKS client."""
+        from eks.read.eks_reader import EKSReader
+
+        self.client = Mock()
+        client_manager = Mock()
+        client_manager.get_client.return_value = self.client
+        self.reader = EKSReader(client_manager)
+
+    def test_client_uses_shared_config(self):
+        """Test that the client is built with the pooled adaptive-retry config and closed on close()."""
+        from common.aws_client import DEFAULT_CLIENT_CONFIG
+
+        self.assertIs(self.reader.client, self.client)
+        self.reader.client_manager.get_client.assert_called_once_with('eks', config=DEFAULT_CLIENT_CONFIG)
+        self.reader.close()
+        self.reader.client_manager.close_client.assert_called_once_with('eks', config=DEFAULT_CLIENT_CONFIG)
+
+    def test_lists_read_every_page(self):
+        """Test that list methods page with the largest page size and merge the pages."""
+        paginator = self.client.get_paginator.return_value
+        paginator.paginate.return_value = [{'nodegroups': ['ng-1', 'ng-2']}, {'nodegroups': ['ng-3']}]
+
+        self.assertEqual(self.reader.list_nodegroups('prod'), ['ng-1', 'ng-2', 'ng-3'])
+
+        self.client.get_paginator.assert_called_once_with('list_nodegroups')
+        paginator.paginate.assert_called_once_with(clusterName='prod', PaginationConfig={'PageSize': 100})
+
+    def test_reads_log_one_debug_record(self):
+        """Test that a list call logs a single DEBUG record and nothing at INFO."""
+        self.client.get_paginator.return_value.paginate.return_value = [{'addons': ['vpc-cni']}]
+
+        with self.assertLogs('eks.read.eks_reader', level='DEBUG') as logs:
+            self.reader.list_addons('prod')
+        self.assertEqual(logs.output, ['DEBUG:eks.read.eks_reader:Found 1 add-ons for cluster prod'])
+
+    def test_describes_are_cached_until_invalidated(self):
+        """Test that repeated describes hit the cache and invalidate() drops one cluster's entries."""
+        self.client.describe_cluster.return_value = {'cluster': {'name': 'prod'}}
+        self.client.describe_addon.return_value = {'addon': {'addonName': 'vpc-cni'}}
+
+        self.reader.describe_cluster('prod')
+        self.reader.describe_addon('prod', 'vpc-cni')
+        self.assertEqual(self.reader.get_cluster_oidc_issuer_url('prod'), None)
+        self.client.describe_cluster.assert_called_once_with(name='prod')
+
+        self.assertEqual(self.reader.invalidate('prod'), 2)
+        self.reader.describe_cluster('prod')
+        self.reader.describe_cluster('prod', use_cache=False)
+        self.assertEqual(self.client.describe_cluster.call_count, 3)
+
+    def test_oidc_issuer_is_kept_until_invalidated(self):
+        """Test that the OIDC issuer URL is looked up once per cluster."""
+        issuer = 'https://oidc.eks.us-east-1.amazonaws.com/id/ABC'
+        self.client.describe_cluster.return_value = {'cluster': {'identity': {'oidc': {'issuer': issuer}}}}
+
+        self.assertEqual(self.reader.get_cluster_oidc_issuer_url('prod'), issuer)
+        self.reader.clear_cache()
+        self.assertEqual(self.reader.get_cluster_oidc_issuer_url('prod'), issuer)
+        self.reader._cache.clear()
+        self.assertEqual(self.reader.get_cluster_oidc_issuer_url('prod'), issuer)
+        self.assertEqual(self.client.describe_cluster.call_count, 2)
+
+    def test_cluster_tokens_are_reused_until_near_expiry(self):
+        """Test that a token is presigned once and refreshed when under a minute is left."""
+        import base64
+        from unittest.mock import patch
+
+        sts = Mock()
+        sts.generate_presigned_url.return_value = 'https://sts.amazonaws.com/?Action=GetCallerIdentity'
+        self.reader.client_manager.get_client.return_value = sts
+
+        with patch('eks.read.eks_reader.time.time', return_value=1000.0):
+            token = self.reader.get_cluster_token('prod')
+            self.assertEqual(self.reader.get_cluster_token('prod'), token)
+        with patch('eks.read.eks_reader.time.time', return_value=1000.0 + 14 * 60 - 30):
+            self.reader.get_cluster_token('prod')
+
+        self.assertTrue(token.startswith('k8s-aws-v1.'))
+        encoded = token[len('k8s-aws-v1.'):]
+        self.assertEqual(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)).decode(),
+                         sts.generate_presigned_url.return_value)
+        self.assertEqual(sts.generate_presigned_url.call_count, 2)
+        sts.generate_presigned_url.assert_called_with(
+            'get_caller_identity', Params={'x-k8s-aws-id': 'prod'}, ExpiresIn=60, HttpMethod='GET'
+        )
+
+    def test_bulk_describes_coalesce_duplicates(self):
+        """Test that duplicate node group names share one in-flight describe."""
+        import threading
+
+        release = threading.Event()
+
+        def describe_nodegroup(clusterName, nodegroupName):
+            release.wait(1)
+            if nodegroupName == 'gone':
+                from botocore.exceptions import ClientError
+                raise ClientError({'Error': {'Code': 'ResourceNotFoundException', 'Message': 'gone'}},
+                                  'DescribeNodegroup')
+            return {'nodegroup': {'nodegroupName': nodegroupName}}
+        self.client.describe_nodegroup.side_effect = describe_nodegroup
+
+        timer = threading.Timer(0.05, release.set)
+        timer.start()
+        nodegroups = self.reader.describe_nodegroups_bulk('prod', ['ng-1', 'ng-2', 'ng-1', 'gone'])
+
+        self.assertEqual(nodegroups[0], nodegroups[2])
+        self.assertEqual([n and n['nodegroupName'] for n in nodegroups], ['ng-1', 'ng-2', 'ng-1', None])
+        self.assertEqual(self.client.describe_nodegroup.call_count, 3)
+        self.reader.close()
+
+    def test_iter_clusters_is_lazy(self):
+        """Test that iter_clusters only fetches pages as it is advanced."""
+        fetched = []
+
+        def pages(**kwargs):
+            for n in range(3):
+                fetched.append(n)
+                yield {'clusters': [f'c{n}']}
+        self.client.get_paginator.return_value.paginate.side_effect = pages
+
+        clusters = self.reader.iter_clusters()
+        self.assertEqual(next(clusters), 'c0')
+        self.assertEqual(fetched, [0])
+        self.assertEqual(list(clusters), ['c1', 'c2'])
+
+    def test_import_does_not_load_boto3(self):
+        """Test that importing EKSReader leaves boto3 unloaded until a client is needed."""
+        import subprocess
+
+        src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, '-c', "import sys; from eks import EKSReader; print('boto3' in sys.modules)"],
+            cwd=src, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_disk_cache_is_shared_across_readers(self):
+        """Test that a second reader reuses describes written to disk, datetimes included."""
+        import datetime
+        import tempfile
+        from unittest.mock import patch
+        from eks.read.eks_reader import EKSReader
+
+        created = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+        self.client.describe_cluster.return_value = {'cluster': {'name': 'prod', 'createdAt': created}}
+        manager = self.reader.client_manager
+        manager.profile_name, manager.get_current_region.return_value = 'dev', 'us-east-1'
+
+        with tempfile.TemporaryDirectory() as directory:
+            with patch('eks.read.eks_reader._DISK_CACHE_DIR', directory):
+                first = EKSReader(manager, disk_cache_ttl=60)
+                second = EKSReader(manager, disk_cache_ttl=60)
+            first.describe_cluster('prod')
+            self.assertEqual(second.describe_cluster('prod'), {'name': 'prod', 'createdAt': created})
+            self.assertEqual(self.client.describe_cluster.call_count, 1)
+            self.assertTrue(os.path.isdir(os.path.join(directory, 'dev', 'us-east-1')))
+
+            self.assertEqual(second.invalidate('prod'), 2)
+            second.describe_cluster('prod')
+            self.assertEqual(self.client.describe_cluster.call_count, 2)
+
+
+
+class TestAsyncEKSReader(unittest.TestCase):
+    """Test cases for AsyncEKSReader on an aioboto3 client."""
+
+    def setUp(self):
+        """Set up an async reader backed by a mocked aioboto3 client."""
+        from unittest.mock import AsyncMock, patch
+        from eks.read.eks_reader_async import AsyncEKSReader
+
+        patcher = patch('eks.read.eks_reader_async.aioboto3', Mock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = AsyncMock()
+        self.reader = AsyncEKSReader(Mock(), max_concurrency=2)
+        self.reader._client = self.client
+
+    def test_falls_back_to_threads_without_async_extra(self):
+        """Test that without aioboto3 or anyio reads run on EKSReader and leave the manager's client open."""
+        import asyncio
+        from unittest.mock import patch
+        from eks.read.eks_reader_async import AsyncEKSReader
+
+        manager = Mock()
+        client = manager.get_client.return_value
+        client.get_paginator.return_value.paginate.return_value = [{'nodegroups': ['ng-1']}]
+
+        async def list_nodegroups():
+            async with AsyncEKSReader(manager) as reader:
+                return await reader.list_nodegroups('prod')
+
+        with patch('eks.read.eks_reader_async.aioboto3', None), patch('common.threads.anyio', None):
+            self.assertEqual(asyncio.run(list_nodegroups()), ['ng-1'])
+        manager.close_client.assert_not_called()
+
+    def test_nodegroups_are_described_concurrently(self):
+        """Test that describe_all_nodegroups keeps list order and drops deleted node groups."""
+        import asyncio
+        from botocore.exceptions import ClientError
+
+        async def pages(**kwargs):
+            yield {'nodegroups': ['ng-1', 'ng-2']}
+            yield {'nodegroups': ['ng-3']}
+        self.client.get_paginator = Mock()
+        self.client.get_paginator.return_value.paginate.side_effect = pages
+
+        async def describe_nodegroup(clusterName, nodegroupName):
+            if nodegroupName == 'ng-2':
+                raise ClientError({'Error': {'Code': 'ResourceNotFoundException', 'Message': 'gone'}},
+                                  'DescribeNodegroup')
+            return {'nodegroup': {'nodegroupName': nodegroupName}}
+        self.client.describe_nodegroup.side_effect = describe_nodegroup
+
+        nodegroups = asyncio.run(self.reader.describe_all_nodegroups('prod'))
+
+        self.assertEqual([n['nodegroupName'] for n in nodegroups], ['ng-1', 'ng-3'])
+        self.assertEqual(self.client.describe_nodegroup.await_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()